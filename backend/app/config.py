@@ -47,25 +47,130 @@ SEMANTIC_SCHOLAR_API_KEY = (
 # source. Optional; the ADS connector is skipped when absent.
 ADS_API_TOKEN = os.environ.get("ADS_API_TOKEN")
 
+# Outbound request rate per API host (requests/second), overriding the defaults
+# in services/ratelimit.py. Comma-separated "host=rate" pairs, e.g.
+# "api.openalex.org=5,api.semanticscholar.org=0.5". The live rate still backs
+# off on 429s and recovers towards this value.
+HTTP_RATE_LIMITS = {
+    k.strip(): float(v)
+    for k, _, v in (
+        pair.partition("=") for pair in os.environ.get("HTTP_RATE_LIMITS", "").split(",")
+    )
+    if k.strip() and v.strip()
+}
+for _host, _rate in HTTP_RATE_LIMITS.items():
+    if not _rate > 0:  # also catches nan; a limiter paces at 1/rate
+        raise ValueError(f"HTTP_RATE_LIMITS: rate for {_host} must be positive, got {_rate:g}")
+
+# Outbound connection pools (services/http_pool.py): one keep-alive pool per API
+# host. HTTP2=1 negotiates HTTP/2 where the host supports it (requires
+# `pip install h2`); idle connections stay open HTTP_KEEPALIVE_EXPIRY seconds.
+HTTP2 = os.environ.get("HTTP2", "0").lower() in ("1", "true", "yes")
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("HTTP_KEEPALIVE_EXPIRY", "30"))
+
+# --- Intent extraction -----------------------------------------------------
+# Plain keyword queries, optionally with "since YYYY" / "by Author", are parsed
+# locally instead of going through the LLM (saves 1-3s per search). Set to 0 to
+# send every query to the model.
+INTENT_FAST_PATH = os.environ.get("INTENT_FAST_PATH", "1").lower() not in ("0", "false", "no")
+
 # --- Semantic rerank configuration ---------------------------------------
 # How candidates are reranked for relevance:
-#   "auto"      -> try embeddings (Google), fall back to Anthropic LLM rerank
+#   "auto"      -> try embeddings (Google), fall back to RERANK_FALLBACK
 #   "google"    -> Google embeddings only
 #   "anthropic" -> Anthropic LLM rerank only (works without Google billing)
+#   "bm25"      -> local lexical BM25 only (milliseconds, no network)
 #   "none"      -> disable reranking (source ranking / citation sort)
 RERANK_PROVIDER = os.environ.get("RERANK_PROVIDER", "auto").lower()
+# What "auto" uses once embeddings are unavailable: "bm25" (default),
+# "anthropic" (LLM listwise rerank, seconds), or "none".
+RERANK_FALLBACK = os.environ.get("RERANK_FALLBACK", "bm25").lower()
+# Cascade size: BM25 on the intent's keywords orders the whole pool and only the
+# top RERANK_TOP_K papers are embedded (or sent to the single-prompt LLM
+# rerank); the rest keep their BM25 order below them. 0 sends the whole pool.
+RERANK_TOP_K = int(os.environ.get("RERANK_TOP_K", "100"))
+# Anthropic rerank shape: "windowed" (default) ranks half-overlapping windows of
+# LLM_RERANK_WINDOW papers in parallel, then ranks each window's winners together
+# in one more call (the rest follow by reciprocal-rank fusion), covering the whole
+# candidate list at the latency of two small calls; "single"
+# sends one prompt with the first 150 papers and leaves the rest unranked.
+LLM_RERANK_MODE = os.environ.get("LLM_RERANK_MODE", "windowed").lower()
+LLM_RERANK_WINDOW = max(2, int(os.environ.get("LLM_RERANK_WINDOW", "40")))
+# Window calls in flight at once. The windowed mode skips the RERANK_TOP_K
+# prefilter: it ranks the whole pool.
+LLM_RERANK_CONCURRENCY = max(1, int(os.environ.get("LLM_RERANK_CONCURRENCY", "8")))
 EMBEDDING_MODEL = os.environ.get("EMBEDDING_MODEL", "gemini-embedding-001")
+# Embedding misses are sent in batches of 64 texts. Up to EMBED_CONCURRENCY
+# batches are in flight at once, and misses arriving from concurrent requests
+# within EMBED_BATCH_WINDOW_MS are packed into shared batches.
+EMBED_CONCURRENCY = int(os.environ.get("EMBED_CONCURRENCY", "4"))
+EMBED_BATCH_WINDOW_MS = float(os.environ.get("EMBED_BATCH_WINDOW_MS", "5"))
+# In-memory encoding of cached embeddings (services/embedding_codec.py):
+# "float16" (default; no visible rank change, half of float32), "float32", or
+# "int8" (per-vector scale; a quarter of float32, slight score noise).
+EMBEDDING_CACHE_DTYPE = os.environ.get("EMBEDDING_CACHE_DTYPE", "float16").lower()
+if EMBEDDING_CACHE_DTYPE not in ("float16", "float32", "int8"):
+    raise ValueError(
+        f"EMBEDDING_CACHE_DTYPE must be float16, float32 or int8, got {EMBEDDING_CACHE_DTYPE!r}"
+    )
 # Back-compat: previously toggled via EMBEDDING_PROVIDER=none.
 EMBEDDING_PROVIDER = os.environ.get("EMBEDDING_PROVIDER", "google").lower()
 
-# Default number of candidates to over-fetch per source before merge/rerank.
+# Upper bound on the first fetch per source before merge/rerank. The first wave
+# is sized to the requested page (about 2x the page, split across sources) and
+# the pool grows on demand as users page ("load more"), so this only caps it.
+# Values above one API page (200; 500 for arXiv) are fetched as several pages,
+# up to 2000 per source (connectors/base.py MAX_RECORDS_PER_SOURCE).
 SEARCH_CANDIDATES_PER_SOURCE = int(os.environ.get("SEARCH_CANDIDATES_PER_SOURCE", "120"))
 
+# Ranked-result cache lifetimes (seconds). Past the soft TTL a cached ranking is
+# served immediately while a background refresh recomputes it; past the hard
+# TTL the next caller waits for a fresh multi-source run.
+SEARCH_CACHE_SOFT_TTL = float(os.environ.get("SEARCH_CACHE_SOFT_TTL", "600"))
+SEARCH_CACHE_TTL = float(os.environ.get("SEARCH_CACHE_TTL", "3600"))
+
+# Latency budget (seconds) for the retrieval phase. Once it runs out — or a
+# source passes its own soft deadline — the search ranks whatever has arrived;
+# cut-off sources keep running in the background and fold their records into
+# the cached ranking when they land. Per-source overrides are comma-separated
+# "source=seconds" pairs, e.g. "arxiv=10,ads=6".
+SEARCH_BUDGET_S = float(os.environ.get("SEARCH_BUDGET_S", "10"))
+SEARCH_SOURCE_DEADLINE_S = float(os.environ.get("SEARCH_SOURCE_DEADLINE_S", "8"))
+SEARCH_SOURCE_DEADLINES = {
+    k.strip(): float(v)
+    for k, _, v in (
+        pair.partition("=") for pair in os.environ.get("SEARCH_SOURCE_DEADLINES", "").split(",")
+    )
+    if k.strip() and v.strip()
+}
+
+# --- Shared cache backend --------------------------------------------------
+# The in-process caches in services/cache.py are always the L1 tier. A shared
+# L2 lets several uvicorn workers/instances reuse each other's embeddings,
+# OpenAlex responses and ranked result lists:
+#   "memory" -> no L2, per-process caches only (default)
+#   "sqlite" -> one SQLite file on local disk (all workers on one host)
+#   "redis"  -> any Redis-protocol server (requires `pip install redis`)
+# L2 values are pickled: point these only at a store nobody else can write.
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory").lower()
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_SQLITE_PATH = os.environ.get("CACHE_SQLITE_PATH", "cache/shared_cache.sqlite3")
+
 # Weight for the "hybrid" sort (relevance + citation impact blend):
 #   score = alpha * relevance_norm + (1 - alpha) * citations_norm
 # 1.0 = pure relevance, 0.0 = pure impact. 0.7 = mostly on-topic, impact breaks ties.
 RELEVANCE_BLEND_ALPHA = float(os.environ.get("RELEVANCE_BLEND_ALPHA", "0.7"))
 
+# --- Persistent embedding store -------------------------------------------
+# Directory for the memory-mapped embedding store (services/embedding_store.py).
+# Empty disables it. Point it at a persistent disk so embeddings survive
+# restarts/deploys; every worker on the host shares the same files.
+EMBEDDING_STORE_DIR = os.environ.get("EMBEDDING_STORE_DIR", "")
+# On-disk precision: float16 halves the footprint with no visible rank change.
+EMBEDDING_STORE_DTYPE = os.environ.get("EMBEDDING_STORE_DTYPE", "float16").lower()
+# Hard cap on rows per (model, task_type) file; the store turns read-only when full.
+EMBEDDING_STORE_MAX_ROWS = int(os.environ.get("EMBEDDING_STORE_MAX_ROWS", "200000"))
+
 RESEARCH_CATEGORIES = {
     'physics': ['quantum physics', 'condensed matter', 'particle physics', 'astrophysics', 'nuclear physics'],
     'computer_science': ['machine learning', 'artificial intelligence', 'algorithms', 'computer vision', 'nlp'],
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
@@ -16,9 +18,20 @@ from .routes.papers import router as papers_router
 from .routes.network import router as network_router
 from .routes.tools import router as tools_router
 from .routes.review import router as review_router
+from .routes.metrics import router as metrics_router
+from .services.http_pool import close_all as close_http_pools
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Outbound HTTP pools open lazily per host on first use; close them all
+    # (and their keep-alive connections) when the server stops.
+    yield
+    await close_http_pools()
+
 
 logger.info("Initializing FastAPI application...")
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 logger.info("Adding CORS middleware...")
 app.add_middleware(
@@ -37,6 +50,7 @@ app.include_router(papers_router, prefix="/api")
 app.include_router(network_router, prefix="/api")
 app.include_router(tools_router, prefix="/api")
 app.include_router(review_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
 logger.info("All routers included successfully")
 
 if __name__ == "__main__":
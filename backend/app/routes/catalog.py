@@ -1,13 +1,16 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import json
 import uuid
 import logging
 
 from ..config import RESEARCH_CATEGORIES
 from ..store import insert_many
-from ..services.search.schema import SearchIntent
-from ..services.search.orchestrator import run_search
+from ..services.search.schema import SearchIntent, export_papers
+from ..services.search.orchestrator import run_nl_search, run_search, stream_search
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -47,6 +50,7 @@ def _response(query: str, result: Dict[str, Any], filters: Dict[str, Any]) -> Di
         "offset": result.get("offset", 0),
         "has_more": result.get("has_more", False),
         "sources_used": result["sources_used"],
+        "sources_cut_off": result.get("sources_cut_off", []),
         "reranked": result["reranked"],
         "errors": result["errors"],
         "query": query,
@@ -84,6 +88,7 @@ async def search_papers(
     except Exception as e:  # noqa: BLE001
         logger.error("Search failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Search error: {str(e)}")
+    result["papers"] = export_papers(result["papers"])
 
     if offset == 0:
         await _persist(result["papers"], query)
@@ -99,14 +104,7 @@ async def search_papers(
     )
 
 
-@router.post("/search")
-async def search_papers_advanced(request: Dict[str, Any]):
-    """Advanced search: accepts a full structured ``intent`` so precise queries
-    (boolean terms, authors, arXiv categories, dates, sort) survive end-to-end.
-
-    Body: {"intent": {...SearchIntent...}, "limit": int, "sources": [ids]}.
-    Falls back to a flat ``query`` field if no intent is supplied.
-    """
+def _parse_advanced(request: Dict[str, Any]) -> Tuple[SearchIntent, int, int, Optional[List[str]]]:
     intent_data = request.get("intent")
     try:
         if intent_data:
@@ -122,24 +120,107 @@ async def search_papers_advanced(request: Dict[str, Any]):
     sources = request.get("sources") or None
     if isinstance(sources, list):
         sources = [_SOURCE_MAP.get(s, s) for s in sources]
+    return intent, limit, offset, sources
+
+
+def _advanced_filters(intent: SearchIntent) -> Dict[str, Any]:
+    return {
+        "category": intent.field,
+        "min_citations": intent.min_citations or 0,
+        "year_range": f"{intent.year_from() or 'any'}-{intent.year_to() or 'any'}",
+        "sort": intent.sort,
+        "arxiv_categories": intent.arxiv_categories,
+    }
+
+
+@router.post("/search")
+async def search_papers_advanced(request: Dict[str, Any]):
+    """Advanced search: accepts a full structured ``intent`` so precise queries
+    (boolean terms, authors, arXiv categories, dates, sort) survive end-to-end.
+
+    Body: {"intent": {...SearchIntent...}, "limit": int, "sources": [ids]}.
+    Falls back to a flat ``query`` field if no intent is supplied.
+    """
+    intent, limit, offset, sources = _parse_advanced(request)
 
     try:
         result = await run_search(intent, limit=limit, offset=offset, sources=sources)
     except Exception as e:  # noqa: BLE001
         logger.error("Advanced search failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Search error: {str(e)}")
+    result["papers"] = export_papers(result["papers"])
 
     query = intent.canonical_query or intent.semantic_text()
     if offset == 0:
         await _persist(result["papers"], query)
-    return _response(
-        query,
-        result,
-        {
-            "category": intent.field,
-            "min_citations": intent.min_citations or 0,
-            "year_range": f"{intent.year_from() or 'any'}-{intent.year_to() or 'any'}",
-            "sort": intent.sort,
-            "arxiv_categories": intent.arxiv_categories,
-        },
+    return _response(query, result, _advanced_filters(intent))
+
+
+@router.post("/search/nl")
+async def search_papers_natural_language(request: Dict[str, Any]):
+    """Natural-language search in one round trip: intent extraction and source
+    retrieval run concurrently instead of ``/convert-query`` then ``POST
+    /search``.
+
+    Body: {"query": str, "limit": int, "offset": int, "sources": [ids]}. The
+    response carries the extracted ``intent``; page with ``POST /search``
+    using it (same ranking, served from the cache).
+    """
+    nl = (request.get("query") or "").strip()
+    if not nl:
+        raise HTTPException(status_code=400, detail="query is required")
+    _, limit, offset, sources = _parse_advanced({**request, "query": nl})
+
+    try:
+        result = await run_nl_search(nl, limit=limit, offset=offset, sources=sources)
+    except Exception as e:  # noqa: BLE001
+        logger.error("Natural-language search failed: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Search error: {str(e)}")
+    result["papers"] = export_papers(result["papers"])
+
+    intent = SearchIntent(**result["intent"])
+    query = intent.canonical_query or nl
+    if offset == 0:
+        await _persist(result["papers"], query)
+    return _response(query, result, _advanced_filters(intent))
+
+
+@router.post("/search/stream")
+async def search_papers_stream(request: Dict[str, Any], http_request: Request):
+    """Streaming variant of ``POST /search`` (same body).
+
+    Emits one JSON object per line (NDJSON), or Server-Sent Events when the
+    client sends ``Accept: text/event-stream``. Each event carries the usual
+    search response plus ``event``: ``"partial"`` rankings arrive as each
+    source lands (merged + deduped, not yet enriched or reranked, with
+    ``sources_pending``), then exactly one ``"final"`` ranking — or an
+    ``"error"`` event if the pipeline fails.
+    """
+    intent, limit, offset, sources = _parse_advanced(request)
+    query = intent.canonical_query or intent.semantic_text()
+    filters = _advanced_filters(intent)
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+
+    def _encode(payload: Dict[str, Any]) -> str:
+        data = json.dumps(jsonable_encoder(payload))
+        return f"event: {payload['event']}\ndata: {data}\n\n" if sse else data + "\n"
+
+    async def _events() -> AsyncIterator[str]:
+        try:
+            async for result in stream_search(intent, limit=limit, offset=offset, sources=sources):
+                result["papers"] = export_papers(result["papers"])
+                if result["event"] == "final" and offset == 0:
+                    await _persist(result["papers"], query)
+                payload = {"event": result["event"], **_response(query, result, filters)}
+                if "sources_pending" in result:
+                    payload["sources_pending"] = result["sources_pending"]
+                yield _encode(payload)
+        except Exception as e:  # noqa: BLE001 - headers are sent; report in-band
+            logger.error("Streaming search failed: %s", e, exc_info=True)
+            yield _encode({"event": "error", "detail": f"Search error: {str(e)}"})
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
-from ..services.research_client import api_client, arxiv
+from ..services.research_client import api_client
 from ..services.nlq import convert_natural_language_to_query
 
 router = APIRouter()
@@ -8,8 +8,6 @@ router = APIRouter()
 @router.get("/test-arxiv")
 async def test_arxiv_search(query: str = "quantum computing"):
     try:
-        if not arxiv:
-            return {"error": "arxiv package not imported", "arxiv_working": False}
         results = await api_client.search_arxiv_enhanced(query, max_results=5)
         return {
             "query": query,
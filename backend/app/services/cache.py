@@ -2,68 +2,778 @@
 
 Goal: never pay twice for the same expensive call within a session — Gemini
 embeddings (reused between search reranking and trend clustering) and OpenAlex
-citation/reference lookups (reused across repeated network builds). These are
-process-local; swap for Redis if/when we run multiple instances.
+citation/reference lookups (reused across repeated network builds).
+
+Each ``TTLCache`` keeps a process-local dict as its L1 tier. When
+``CACHE_BACKEND`` is ``sqlite`` or ``redis`` a shared L2 backend sits behind it,
+so every uvicorn worker (and, with Redis, every instance) sees the same
+embeddings, OpenAlex responses and ranked result lists. The backend is strictly
+best-effort: any error is logged, the backend is benched for a short while, and
+the cache keeps working from L1 alone.
+
+L2 values are pickled, and ``pickle.loads`` runs whatever a blob tells it to,
+so the backend must be trusted: a SQLite file only this service can write, or
+a Redis instance that is private to the deployment (no shared or exposed
+server, ``requirepass`` / ACLs on anything reachable from elsewhere).
+
+The backend never runs on the event loop: ``set`` hands the L2 write to a
+background writer thread (which pickles and stores writes in batches), and
+coroutines read through ``aget`` / ``aget_entry`` / ``aget_many``, which
+serve L1 hits inline and batch the misses into one backend round trip in a
+worker thread. The blocking ``get`` / ``get_entry`` are for plain threads.
+
+``SingleFlight`` complements the caches for the moment *before* a value is
+cached: concurrent callers that miss on the same key share one computation
+instead of each starting their own.
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import logging
+import os
+import pickle
+import queue
+import sqlite3
+import sys
 import threading
 import time
-from typing import Any, Optional
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any, Awaitable, Callable, Dict, Iterable, List, Optional, Protocol, Tuple, TypeVar,
+)
+
+from app.config import (
+    CACHE_BACKEND,
+    CACHE_REDIS_URL,
+    CACHE_SQLITE_PATH,
+    SEARCH_CACHE_SOFT_TTL,
+    SEARCH_CACHE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 
 def text_key(text: str) -> str:
     return hashlib.md5((text or "").encode("utf-8", "ignore")).hexdigest()
 
 
+def _backend_key(namespace: str, key: Any) -> str:
+    """Stable string key for a (possibly tuple) cache key. ``repr`` of the
+    str/int tuples we use as keys is deterministic across processes."""
+    return f"ms:{namespace}:{hashlib.md5(repr(key).encode('utf-8', 'ignore')).hexdigest()}"
+
+
+# ---------------------------------------------------------------------------
+# Shared (L2) backends
+# ---------------------------------------------------------------------------
+class CacheBackend(Protocol):
+    """Out-of-process store behind a ``TTLCache``. Values round-trip through
+    pickle together with their write timestamp, so an L1 fill from L2 keeps
+    the original age instead of restarting the TTL. Anyone who can write to
+    the store can run code in the workers that read it (see module docstring).
+    """
+
+    name: str
+
+    def get_many(self, keys: List[str]) -> List[Optional[Tuple[Any, float]]]: ...
+
+    def set_many(self, items: List[Tuple[str, Any, float, float]]) -> None:
+        """Store ``(key, value, written_at, ttl)`` items."""
+
+
+class SQLiteBackend:
+    """Single-host stand-in for Redis: one SQLite file shared by every worker.
+
+    WAL mode lets readers proceed while a writer commits; each thread gets its
+    own connection because sqlite3 connections are not thread-safe.
+    """
+
+    name = "sqlite"
+    _PURGE_EVERY = 500  # writes between opportunistic sweeps of expired rows
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "k TEXT PRIMARY KEY, v BLOB NOT NULL, ts REAL NOT NULL, exp REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_exp ON cache(exp)")
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=1.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    _MAX_VARS = 500  # keys per SELECT; SQLite caps bound parameters
+
+    def get_many(self, keys: List[str]) -> List[Optional[Tuple[Any, float]]]:
+        conn = self._conn()
+        now = time.time()
+        found: Dict[str, Tuple[Any, float]] = {}
+        for i in range(0, len(keys), self._MAX_VARS):
+            chunk = keys[i:i + self._MAX_VARS]
+            rows = conn.execute(
+                f"SELECT k, v, ts FROM cache WHERE k IN ({','.join('?' * len(chunk))}) AND exp > ?",
+                (*chunk, now),
+            ).fetchall()
+            for k, v, ts in rows:
+                found[k] = (pickle.loads(v), ts)
+        return [found.get(k) for k in keys]
+
+    def set_many(self, items: List[Tuple[str, Any, float, float]]) -> None:
+        rows = [
+            (
+                key,
+                pickle.dumps(val, protocol=pickle.HIGHEST_PROTOCOL),
+                ts,
+                ts + ttl if ttl else float("inf"),
+            )
+            for key, val, ts, ttl in items
+        ]
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (k, v, ts, exp) VALUES (?, ?, ?, ?)", rows
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        before = self._writes
+        self._writes += len(rows)
+        if self._writes // self._PURGE_EVERY > before // self._PURGE_EVERY:
+            conn.execute("DELETE FROM cache WHERE exp <= ?", (time.time(),))
+
+
+class RedisBackend:
+    """Any Redis-protocol server (Redis, Valkey, KeyDB, Dragonfly...).
+
+    Requires the optional ``redis`` package. Round trips run in worker threads
+    (see ``TTLCache``); short socket timeouts still keep a slow or unreachable
+    server from tying those threads up.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str) -> None:
+        import redis  # optional dependency; ImportError is handled by the caller
+
+        self._client = redis.Redis.from_url(
+            url, socket_timeout=0.25, socket_connect_timeout=0.5
+        )
+
+    def get_many(self, keys: List[str]) -> List[Optional[Tuple[Any, float]]]:
+        blobs = self._client.mget(keys) if keys else []
+        return [None if blob is None else tuple(pickle.loads(blob)) for blob in blobs]
+
+    def set_many(self, items: List[Tuple[str, Any, float, float]]) -> None:
+        pipe = self._client.pipeline(transaction=False)
+        for key, val, ts, ttl in items:
+            blob = pickle.dumps((val, ts), protocol=pickle.HIGHEST_PROTOCOL)
+            if ttl:
+                pipe.set(key, blob, ex=max(1, int(ttl)))
+            else:
+                pipe.set(key, blob)
+        pipe.execute()
+
+
+def make_backend(kind: str = CACHE_BACKEND) -> Optional[CacheBackend]:
+    """Build the configured shared backend, or None for L1-only caching."""
+    kind = (kind or "memory").lower()
+    if kind in ("", "memory", "none"):
+        return None
+    try:
+        if kind == "sqlite":
+            return SQLiteBackend(CACHE_SQLITE_PATH)
+        if kind == "redis":
+            return RedisBackend(CACHE_REDIS_URL)
+    except Exception as e:  # noqa: BLE001 - a broken L2 must not break startup
+        logger.error("Cache backend %r unavailable (%s); using in-process caches only", kind, e)
+        return None
+    logger.error("Unknown CACHE_BACKEND %r; using in-process caches only", kind)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Size estimation
+# ---------------------------------------------------------------------------
+_SAMPLE = 32     # containers longer than this are sized from a sample
+_MAX_DEPTH = 6
+
+
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """Rough deep size of ``obj`` in bytes.
+
+    Good enough for budgeting, not exact: shared objects are counted once per
+    reference, and containers longer than ``_SAMPLE`` are extrapolated from an
+    evenly spaced sample so sizing a ranked list of hundreds of papers stays
+    cheap (it runs on every ``set``, outside the lock).
+    """
+    size = sys.getsizeof(obj)
+    nbytes = getattr(obj, "nbytes", None)  # numpy views don't own their data
+    if isinstance(nbytes, int):
+        return max(size, nbytes)
+    if _depth >= _MAX_DEPTH or isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        items = list(obj.items())
+        n = len(items)
+        sample = items if n <= _SAMPLE else items[:: max(1, n // _SAMPLE)]
+        inner = sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in sample
+        )
+        return size + (inner * n // max(1, len(sample)))
+    slots = getattr(type(obj), "__slots__", None)
+    if slots and not isinstance(obj, (list, tuple, set, frozenset)):
+        # Slotted records (search.schema.PaperRecord): size the stored values.
+        inner = sum(estimate_size(getattr(obj, s), _depth + 1) for s in slots if hasattr(obj, s))
+        return size + inner
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        seq = obj if isinstance(obj, (list, tuple)) else list(obj)
+        n = len(seq)
+        if not n:
+            return size
+        sample = seq if n <= _SAMPLE else seq[:: max(1, n // _SAMPLE)]
+        inner = sum(estimate_size(v, _depth + 1) for v in sample)
+        return size + (inner * n // len(sample))
+    return size
+
+
+# ---------------------------------------------------------------------------
+# TTL cache (LRU L1 + optional shared L2)
+# ---------------------------------------------------------------------------
+_SWEEP_INTERVAL = 60.0  # seconds between background expiry sweeps
+_registry: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+_sweeper_lock = threading.Lock()
+_sweeper_started = False
+
+
+def _sweep_forever() -> None:
+    while True:
+        time.sleep(_SWEEP_INTERVAL)
+        for cache in list(_registry):
+            try:
+                cache.sweep()
+            except Exception as e:  # noqa: BLE001 - the sweeper must never die
+                logger.warning("Cache sweep failed for %s: %s", cache.name or "?", e)
+
+
+def _ensure_sweeper() -> None:
+    """Start the daemon sweeper on first write (never at import time)."""
+    global _sweeper_started
+    if _sweeper_started:
+        return
+    with _sweeper_lock:
+        if not _sweeper_started:
+            threading.Thread(target=_sweep_forever, name="cache-sweeper", daemon=True).start()
+            _sweeper_started = True
+
+
+_WRITE_QUEUE_MAX = 10000  # pending L2 writes; past this, writes are dropped
+_WRITE_BATCH = 256        # writes per backend round trip
+
+
+class _L2Writer:
+    """One daemon thread that stores queued L2 writes in batches, so
+    ``TTLCache.set`` never waits on pickling or a backend round trip. Writes
+    are best-effort like the rest of L2: when the queue is full (backend
+    slower than the write rate) they are dropped and counted."""
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Tuple[TTLCache, Any, Any, float]]" = queue.Queue(_WRITE_QUEUE_MAX)
+        self._lock = threading.Lock()
+        self._started = False
+
+    def submit(self, cache: "TTLCache", key: Any, val: Any, ts: float) -> bool:
+        if not self._started:
+            with self._lock:
+                if not self._started:
+                    threading.Thread(target=self._run, name="cache-l2-writer", daemon=True).start()
+                    self._started = True
+        try:
+            self._queue.put_nowait((cache, key, val, ts))
+        except queue.Full:
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Block until every queued write has been attempted."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            by_cache: Dict[TTLCache, List[Tuple[Any, Any, float]]] = {}
+            for cache, key, val, ts in batch:
+                by_cache.setdefault(cache, []).append((key, val, ts))
+            for cache, items in by_cache.items():
+                cache._l2_store(items)
+            for _ in batch:
+                self._queue.task_done()
+
+
+_writer = _L2Writer()
+
+
+def flush_l2_writes() -> None:
+    """Wait for pending L2 writes (tests, graceful shutdown)."""
+    _writer.flush()
+
+
 class TTLCache:
-    def __init__(self, ttl: float = 3600.0, max_size: int = 2000) -> None:
+    """Thread-safe TTL + LRU cache bounded by entry count and estimated bytes.
+
+    ``_store`` is kept in recency order (hits move to the end, eviction pops
+    the front), so both are O(1). ``_written`` mirrors the keys in write order;
+    with one TTL per cache that is also expiry order, which lets ``sweep``
+    drop expired entries by popping from its front instead of scanning.
+
+    L2 writes are pickled later, on the writer thread, so a value must not be
+    mutated once it has been ``set`` (cache a new object instead).
+    """
+
+    _BACKEND_COOLDOWN = 30.0  # seconds to bench a failing backend
+
+    def __init__(
+        self,
+        ttl: float = 3600.0,
+        max_size: int = 2000,
+        *,
+        max_bytes: Optional[int] = None,
+        soft_ttl: Optional[float] = None,
+        name: str = "",
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
         self.ttl = ttl
         self.max_size = max_size
-        self._store: dict[Any, tuple[Any, float]] = {}
+        self.max_bytes = max_bytes
+        self.soft_ttl = soft_ttl
+        self.name = name
+        self.backend = backend
+        self._store: "OrderedDict[Any, Tuple[Any, float, int]]" = OrderedDict()
+        self._written: "OrderedDict[Any, float]" = OrderedDict()
+        self._bytes = 0
         self._lock = threading.Lock()
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_hits = 0
+        self.l2_hits = 0
+        self.l2_errors = 0
+        self.l2_dropped = 0
+        self._backend_down_until = 0.0
+        _registry.add(self)
 
-    def get(self, key: Any) -> Optional[Any]:
+    # --- L2 plumbing ------------------------------------------------------
+    def _backend_ready(self) -> bool:
+        return self.backend is not None and time.time() >= self._backend_down_until
+
+    def _backend_failed(self, op: str, e: Exception) -> None:
+        self.l2_errors += 1
+        self._backend_down_until = time.time() + self._BACKEND_COOLDOWN
+        logger.warning(
+            "Cache %s: %s backend %s failed (%s); L1 only for %.0fs",
+            self.name or "?", self.backend.name if self.backend else "?", op,
+            str(e)[:120], self._BACKEND_COOLDOWN,
+        )
+
+    def _l2_get_many(self, keys: List[Any]) -> List[Optional[Tuple[Any, float]]]:
+        """Live L2 items for ``keys`` in one round trip. Blocking."""
+        if not self._backend_ready():
+            return [None] * len(keys)
+        try:
+            items = self.backend.get_many([_backend_key(self.name, k) for k in keys])
+        except Exception as e:  # noqa: BLE001
+            self._backend_failed("get", e)
+            return [None] * len(keys)
+        now = time.time()
+        return [
+            None if item is None or (self.ttl and (now - item[1]) > self.ttl) else item
+            for item in items
+        ]
+
+    def _l2_store(self, items: List[Tuple[Any, Any, float]]) -> None:
+        """Write ``(key, value, written_at)`` items. Runs on the writer thread."""
+        if not self._backend_ready():
+            return
+        try:
+            self.backend.set_many(
+                [(_backend_key(self.name, k), v, ts, self.ttl) for k, v, ts in items]
+            )
+        except Exception as e:  # noqa: BLE001
+            self._backend_failed("set", e)
+
+    # --- L1 ---------------------------------------------------------------
+    def _drop(self, key: Any) -> None:
+        """Remove ``key`` from L1. Caller holds the lock."""
+        item = self._store.pop(key, None)
+        if item is not None:
+            self._bytes -= item[2]
+        self._written.pop(key, None)
+
+    def _l1_put(self, key: Any, val: Any, ts: float) -> None:
+        size = estimate_size(val)
+        if self.max_bytes and size > self.max_bytes:
+            # Too big for L1, but it still replaces the key: an older value
+            # must not keep being served. L2 (if any) holds the only copy.
+            logger.debug("Cache %s: %d-byte entry exceeds budget; not cached", self.name, size)
+            with self._lock:
+                self._drop(key)
+            return
         with self._lock:
-            item = self._store.get(key)
-            if item is None:
-                self.misses += 1
-                return None
-            val, ts = item
-            if self.ttl and (time.time() - ts) > self.ttl:
-                self._store.pop(key, None)
+            self._drop(key)
+            self._store[key] = (val, ts, size)
+            self._written[key] = ts
+            self._bytes += size
+            while self._store and (
+                len(self._store) > self.max_size
+                or (self.max_bytes and self._bytes > self.max_bytes)
+            ):
+                oldest = next(iter(self._store))
+                self._drop(oldest)
+                self.evictions += 1
+        _ensure_sweeper()
+
+    def _l1_get(self, key: Any) -> Optional[Tuple[Any, float]]:
+        """Live L1 item, counting a hit. Caller holds the lock."""
+        item = self._store.get(key)
+        if item is None:
+            return None
+        val, ts, _ = item
+        if self.ttl and (time.time() - ts) > self.ttl:
+            self._drop(key)
+            self.expirations += 1
+            return None
+        self._store.move_to_end(key)
+        self.hits += 1
+        return val, ts
+
+    def _fill(self, key: Any, shared: Optional[Tuple[Any, float]]) -> Optional[Tuple[Any, float]]:
+        """Count an L1 miss; an L2 item found for it is copied into L1."""
+        if shared is not None:
+            self._l1_put(key, *shared)
+        with self._lock:
+            if shared is None:
                 self.misses += 1
-                return None
-            self.hits += 1
-            return val
+            else:
+                self.hits += 1
+                self.l2_hits += 1
+        return shared
+
+    def _lookup(self, key: Any) -> Optional[Tuple[Any, float]]:
+        """``(value, written_at)`` for a live entry, counting hit/miss."""
+        with self._lock:
+            item = self._l1_get(key)
+        if item is not None:
+            return item
+        return self._fill(key, self._l2_get_many([key])[0])
+
+    async def _alookup_many(self, keys: List[Any]) -> List[Optional[Tuple[Any, float]]]:
+        """``_lookup`` for many keys: L1 inline, the misses in one L2 round
+        trip off the event loop (no thread hop when L1 serves them all)."""
+        with self._lock:
+            found = [self._l1_get(k) for k in keys]
+        missed = [k for k, item in zip(keys, found) if item is None]
+        if not missed:
+            return found
+        shared: List[Optional[Tuple[Any, float]]] = [None] * len(missed)
+        if self._backend_ready():
+            shared = await asyncio.to_thread(self._l2_get_many, missed)
+        filled = iter([self._fill(k, item) for k, item in zip(missed, shared)])
+        return [item if item is not None else next(filled) for item in found]
+
+    def _entry(self, item: Optional[Tuple[Any, float]]) -> Optional[Tuple[Any, bool]]:
+        if item is None:
+            return None
+        val, ts = item
+        stale = bool(self.soft_ttl) and (time.time() - ts) > self.soft_ttl
+        if stale:
+            with self._lock:
+                self.stale_hits += 1
+        return val, stale
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Blocking lookup (an L1 miss reads L2 inline); coroutines use ``aget``."""
+        item = self._lookup(key)
+        return item[0] if item is not None else None
+
+    def get_entry(self, key: Any) -> Optional[Tuple[Any, bool]]:
+        """``(value, stale)`` where ``stale`` means older than ``soft_ttl``.
+
+        Stale entries are still served (stale-while-revalidate); only past the
+        hard ``ttl`` does the entry disappear and the caller have to block.
+        Blocking like ``get``; coroutines use ``aget_entry``.
+        """
+        return self._entry(self._lookup(key))
+
+    async def aget(self, key: Any) -> Optional[Any]:
+        item = (await self._alookup_many([key]))[0]
+        return item[0] if item is not None else None
+
+    async def aget_entry(self, key: Any) -> Optional[Tuple[Any, bool]]:
+        return self._entry((await self._alookup_many([key]))[0])
+
+    async def aget_many(self, keys: List[Any]) -> List[Optional[Any]]:
+        """Values for ``keys`` (None where missing), one L2 round trip at most."""
+        return [item[0] if item is not None else None for item in await self._alookup_many(keys)]
 
     def set(self, key: Any, val: Any) -> None:
+        ts = time.time()
+        self._l1_put(key, val, ts)
+        if self._backend_ready() and not _writer.submit(self, key, val, ts):
+            with self._lock:
+                self.l2_dropped += 1
+
+    def sweep(self) -> int:
+        """Drop expired L1 entries; returns how many were removed."""
+        if not self.ttl:
+            return 0
+        cutoff = time.time() - self.ttl
+        removed = 0
         with self._lock:
-            if len(self._store) >= self.max_size and key not in self._store:
-                # Evict ~10% oldest by insertion order.
-                for k in list(self._store.keys())[: max(1, self.max_size // 10)]:
-                    self._store.pop(k, None)
-            self._store[key] = (val, time.time())
+            while self._written:
+                key, ts = next(iter(self._written.items()))
+                if ts > cutoff:
+                    break
+                self._drop(key)
+                removed += 1
+            self.expirations += removed
+        return removed
 
     def stats(self) -> dict:
         with self._lock:
-            return {"size": len(self._store), "hits": self.hits, "misses": self.misses}
+            return {
+                "size": len(self._store),
+                "bytes": self._bytes,
+                "max_size": self.max_size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "stale_hits": self.stale_hits,
+                "l2_hits": self.l2_hits,
+                "l2_errors": self.l2_errors,
+                "l2_dropped": self.l2_dropped,
+                "backend": self.backend.name if self.backend else "memory",
+            }
 
 
+def cache_stats() -> Dict[str, dict]:
+    """``stats()`` of every live TTLCache, keyed by cache name."""
+    return {c.name or f"cache_{id(c):x}": c.stats() for c in list(_registry)}
+
+
+# ---------------------------------------------------------------------------
+# Single-flight request coalescing
+# ---------------------------------------------------------------------------
+class SingleFlight:
+    """Coalesce concurrent computations of the same key.
+
+    The first caller for a key launches the work as its own task; callers that
+    arrive while it is running await that task instead of starting another.
+    Everyone awaits through ``asyncio.shield``, so a caller that disconnects
+    (cancelling its request) never cancels the work the others are waiting
+    on. Event-loop local, like every asyncio object: one table per worker.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._inflight: Dict[Any, "asyncio.Task[Any]"] = {}
+        self.calls = 0
+        self.leaders = 0
+        self.coalesced = 0
+        _flights.append(self)
+
+    def join(self, key: Any) -> Optional["asyncio.Task[Any]"]:
+        """The in-flight task for ``key``, if any (counts as a coalesced call)."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.calls += 1
+            self.coalesced += 1
+        return task
+
+    def running(self, key: Any) -> bool:
+        return key in self._inflight
+
+    def launch(self, keys: Iterable[Any], coro: Awaitable[T]) -> "asyncio.Task[T]":
+        """Start ``coro`` as the shared computation for every key in ``keys``."""
+        keys = list(keys)
+        task = asyncio.ensure_future(coro)
+        self.calls += len(keys)
+        self.leaders += len(keys)
+        for k in keys:
+            self._inflight[k] = task
+
+        def _done(t: "asyncio.Task[Any]") -> None:
+            for k in keys:
+                if self._inflight.get(k) is t:
+                    del self._inflight[k]
+            if not t.cancelled():
+                t.exception()  # mark retrieved even if every waiter went away
+
+        task.add_done_callback(_done)
+        return task
+
+    async def do(self, key: Any, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn()`` for ``key`` unless an identical call is already running."""
+        task = self.join(key)
+        if task is None:
+            task = self.launch([key], fn())
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "inflight": len(self._inflight),
+            "calls": self.calls,
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
+
+
+_flights: List[SingleFlight] = []
+
+
+def coalescing_stats() -> Dict[str, dict]:
+    """Per-group single-flight counters (how many calls were coalesced)."""
+    return {f.name: f.stats() for f in _flights}
+
+
+_MB = 1024 * 1024
+
+# One shared backend for every cache; entries are namespaced by cache name.
+_backend = make_backend()
+
 # Content-addressed embedding cache: identical text -> identical vector, so a
-# long TTL is fine. Keyed by (model, task_type, text_hash).
-embedding_cache = TTLCache(ttl=24 * 3600, max_size=8000)
+# long TTL is fine. Keyed by (model, task_type, text_hash). Vectors are compact
+# NumPy rows (EMBEDDING_CACHE_DTYPE, ~6KB each in float16 at 3072 dims), so the
+# byte budget, not the entry count, is what normally bounds it.
+embedding_cache = TTLCache(
+    ttl=24 * 3600, max_size=40000, max_bytes=256 * _MB, name="embedding", backend=_backend
+)
 
 # OpenAlex citation/reference responses, keyed by (url, params).
-openalex_cache = TTLCache(ttl=3600, max_size=3000)
+openalex_cache = TTLCache(
+    ttl=3600, max_size=3000, max_bytes=128 * _MB, name="openalex", backend=_backend
+)
 
 # Semantic Scholar citation counts, keyed by the S2 id (DOI:.. / ARXIV:..).
-s2_cache = TTLCache(ttl=3600, max_size=5000)
+s2_cache = TTLCache(ttl=3600, max_size=5000, max_bytes=8 * _MB, name="s2", backend=_backend)
 
 # Full ranked search result lists, keyed by intent signature. Lets pagination
-# ("load more") slice a stable ranking without re-fetching/re-ranking. Short TTL
-# since it holds large lists; bounded entry count to cap memory.
-search_results_cache = TTLCache(ttl=600, max_size=100)
+# ("load more") slice a stable ranking without re-fetching/re-ranking. The byte
+# budget (not the entry count) is what really caps memory, as one entry can
+# hold hundreds of full paper dicts. Past the soft TTL a ranking is still served
+# while a background refresh runs (stale-while-revalidate); only past the hard
+# TTL does a caller wait for a fresh pipeline run. Sharing it via the backend is
+# what keeps "load more" working when the page request lands on a different
+# worker than the first one.
+search_results_cache = TTLCache(
+    ttl=SEARCH_CACHE_TTL,
+    soft_ttl=SEARCH_CACHE_SOFT_TTL,
+    max_size=100,
+    max_bytes=128 * _MB,
+    name="search_results",
+    backend=_backend,
+)
+
+# Runs that found nothing (every source failed or came back empty), keyed like
+# search_results. A short TTL spares the upstreams a retry storm without
+# pinning an outage's empty page for the full SEARCH_CACHE_TTL.
+search_negative_cache = TTLCache(
+    ttl=60, max_size=1000, max_bytes=8 * _MB, name="search_negative", backend=_backend
+)
+
+# How far into each ranking (intent signature -> result count) pages have been
+# served. A late source merges in behind that prefix, so pages a client already
+# has never shift under it.
+search_served_cache = TTLCache(
+    ttl=SEARCH_CACHE_TTL, max_size=5000, max_bytes=2 * _MB, name="search_served", backend=_backend
+)
+
+# Earlier stages of the same pipeline, so an intent that changes nothing a
+# source queries by (e.g. hybrid vs relevance sort) re-ranks cached data
+# instead of going back to the network:
+#   search_fetch_cache  -> one connector page, keyed by (source, provider
+#                          query, offset, limit)
+#   search_pool_cache   -> the merged + enriched candidate pool, keyed by the
+#                          provider queries of the selected sources; a complete
+#                          plain-relevance pool serves every sort and filter
+#   rerank_scores_cache -> relevance scores by paper, keyed by the query text,
+#                          reranker setup and the set of papers scored (most
+#                          providers score relative to that set)
+# Same lifetimes as the rankings built from them; stale entries are refetched
+# rather than served, since a refresh is what asked for them.
+search_fetch_cache = TTLCache(
+    ttl=SEARCH_CACHE_TTL,
+    soft_ttl=SEARCH_CACHE_SOFT_TTL,
+    max_size=400,
+    max_bytes=128 * _MB,
+    name="search_fetch",
+    backend=_backend,
+)
+search_pool_cache = TTLCache(
+    ttl=SEARCH_CACHE_TTL,
+    soft_ttl=SEARCH_CACHE_SOFT_TTL,
+    max_size=100,
+    max_bytes=128 * _MB,
+    name="search_pool",
+    backend=_backend,
+)
+rerank_scores_cache = TTLCache(
+    ttl=SEARCH_CACHE_TTL, max_size=500, max_bytes=16 * _MB, name="rerank_scores", backend=_backend
+)
+
+# Extracted SearchIntents (model_dump), keyed by (normalized text, today's
+# date): relative dates ("last 3 years") resolve against today, so an entry
+# never outlives its day. Saves the 1-3s LLM round trip on repeat queries.
+intent_cache = TTLCache(
+    ttl=24 * 3600, max_size=5000, max_bytes=16 * _MB, name="intent", backend=_backend
+)
+
+# Legacy research_client lookups (get_paper_by_doi), keyed by request hash.
+research_cache = TTLCache(
+    ttl=3600, max_size=2000, max_bytes=32 * _MB, name="research", backend=_backend
+)
+
+# Empty legacy lookups ("not found", or a lookup that failed during an upstream
+# outage) get their own short TTL instead of pinning a miss for an hour.
+research_negative_cache = TTLCache(
+    ttl=120, max_size=2000, max_bytes=2 * _MB, name="research_negative", backend=_backend
+)
+
+# Legacy fetch_paper_citations / fetch_paper_references payloads. These are the
+# bulkiest legacy entries (up to 1000 references each), so they sit under
+# their own byte budget rather than sharing one with the small DOI lookups.
+legacy_citation_cache = TTLCache(
+    ttl=3600, max_size=500, max_bytes=64 * _MB, name="legacy_citations", backend=_backend
+)
+
+# Coalescing groups, one per expensive miss path. Keys match the cache keys.
+search_flight = SingleFlight("search")
+openalex_flight = SingleFlight("openalex")
+embedding_flight = SingleFlight("embedding")
+intent_flight = SingleFlight("intent")
+fetch_flight = SingleFlight("search_fetch")
@@ -20,7 +20,7 @@ from urllib.parse import quote
 
 from app.config import OPENALEX_MAILTO
 
-from .cache import openalex_cache
+from .cache import openalex_cache, openalex_flight
 from .clustering import cluster_papers
 from .search.connectors.base import get_with_retry
 
@@ -36,9 +36,6 @@ _TOP_DEFAULT = 25
 _ALL_CAP = 200            # protect the frontend graph from thousands of nodes
 _CANDIDATE_MULT = 4       # over-fetch factor before connection-based reranking
 _MAX_SEEDS = 30           # cap seeds (a coming-from-search request can have ~100 DOIs)
-_CONCURRENCY = 8          # polite cap on simultaneous OpenAlex requests
-
-_sema = asyncio.Semaphore(_CONCURRENCY)
 
 
 def _short(oaid: Optional[str]) -> str:
@@ -60,12 +57,18 @@ class OpenAlexNetworkBuilder:
         # Cache key ignores mailto and is order-independent, so repeated
         # resolve/cites/cited_by calls within the TTL are served for free.
         cache_key = (url, tuple(sorted((k, str(v)) for k, v in params.items())))
-        cached = openalex_cache.get(cache_key)
+        cached = await openalex_cache.aget(cache_key)
         if cached is not None:
             return cached
+        # Overlapping network builds ask for the same works/cites pages; share
+        # one request per key instead of racing duplicates to OpenAlex.
+        return await openalex_flight.do(cache_key, lambda: self._fetch(url, params, cache_key))
+
+    async def _fetch(self, url: str, params: Dict[str, Any], cache_key: Any) -> Optional[dict]:
         req = {**params, "mailto": self.mailto} if self.mailto else params
-        async with _sema:  # bound concurrency to stay within OpenAlex's polite pool
-            resp = await get_with_retry(url, params=req)
+        # OpenAlex's per-host limiter (services/ratelimit.py) keeps this within
+        # the polite pool, shared with concurrent searches.
+        resp = await get_with_retry(url, params=req)
         if resp is None:
             return None
         try:
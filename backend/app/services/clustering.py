@@ -2,7 +2,11 @@
 
 Used by both trend analysis (theme discovery) and the citation network (coloring
 nodes by sub-topic). Reuses the cached Gemini embedder, so papers already
-embedded during search are clustered for free.
+embedded during search are clustered for free — including across restarts when
+the on-disk embedding store is enabled (its rows arrive as memmap views and are
+only copied once, into the matrix below). Cached vectors may be float16 or int8
+(``EMBEDDING_CACHE_DTYPE``); they are dequantized into one normalized float32
+matrix before k-means.
 """
 from __future__ import annotations
 
@@ -13,6 +17,8 @@ from typing import Any, Dict, List, Tuple
 
 import numpy as np
 
+from .embedding_codec import unit_matrix
+from .metrics import CLUSTER_SECONDS, instrument
 from .search.rerank import embed_texts, paper_embedding_text
 
 logger = logging.getLogger(__name__)
@@ -52,6 +58,7 @@ def cluster_keywords(papers: List[Dict[str, Any]], n: int = 4) -> List[str]:
     return [w for w, _ in counts.most_common(n)]
 
 
+@instrument(CLUSTER_SECONDS)
 async def cluster_papers(
     papers: List[Dict[str, Any]],
     *,
@@ -74,8 +81,7 @@ async def cluster_papers(
     if not vecs or len(vecs) != n:
         return [-1] * n, []
 
-    X = np.asarray(vecs, dtype="float32")
-    X /= np.linalg.norm(X, axis=1, keepdims=True) + 1e-8
+    X = unit_matrix(vecs)
     k = max(2, min(max_k, n // per_cluster))
     labels, centroids = _kmeans(X, k)
 
@@ -0,0 +1,73 @@
+"""Compact in-memory encoding of embedding vectors.
+
+A 3072-dim Gemini embedding as a Python ``list[float]`` costs ~100KB (a boxed
+float per component); as a contiguous NumPy row it is 12KB in float32, 6KB in
+float16 and 3KB in int8. ``embedding_cache`` stores vectors in the
+``EMBEDDING_CACHE_DTYPE`` encoding:
+
+- ``float32`` / ``float16``: a 1-D array;
+- ``int8``: an ``Int8Vector`` — codes plus one per-vector scale
+  (``v ~= codes * scale``, symmetric, ``scale = max|v| / 127``).
+
+Consumers only ever compare vectors by cosine, so they read them through
+``unit_matrix``: one float32 matrix of L2-normalized rows. For int8 rows the
+scale cancels under normalization, so the codes are used as-is.
+"""
+from __future__ import annotations
+
+from typing import Any, Sequence, Union
+
+import numpy as np
+
+from app.config import EMBEDDING_CACHE_DTYPE
+
+
+class Int8Vector:
+    """int8 codes + float scale for one vector."""
+
+    __slots__ = ("codes", "scale")
+
+    def __init__(self, codes: np.ndarray, scale: float) -> None:
+        self.codes = codes
+        self.scale = scale
+
+    @property
+    def nbytes(self) -> int:  # read by cache.estimate_size
+        return self.codes.nbytes + 8
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+Encoded = Union[np.ndarray, Int8Vector]
+_DTYPES = ("float32", "float16", "int8")
+
+
+def encode(vec: Sequence[float], dtype: str = EMBEDDING_CACHE_DTYPE) -> Encoded:
+    """``vec`` in the cache encoding (``float32``, ``float16`` or ``int8``)."""
+    if dtype not in _DTYPES:
+        raise ValueError(f"unknown embedding encoding {dtype!r}")
+    v = np.asarray(vec, dtype=np.float32)
+    if dtype == "int8":
+        peak = float(np.abs(v).max()) if v.size else 0.0
+        scale = peak / 127.0 or 1.0
+        return Int8Vector(np.round(v / scale).astype(np.int8), scale)
+    return v.astype(np.float16 if dtype == "float16" else np.float32)
+
+
+def decode(vec: Any) -> np.ndarray:
+    """float32 array for any encoding (or a plain list / store memmap row)."""
+    if isinstance(vec, Int8Vector):
+        return vec.codes.astype(np.float32) * np.float32(vec.scale)
+    return np.asarray(vec, dtype=np.float32)
+
+
+def unit_matrix(vectors: Sequence[Any]) -> np.ndarray:
+    """``(len(vectors), dim)`` float32 matrix of L2-normalized rows, for cosine
+    via plain dot products."""
+    rows = [v.codes if isinstance(v, Int8Vector) else v for v in vectors]
+    X = np.array(rows, dtype=np.float32)
+    if X.ndim == 1:
+        X = X.reshape(len(rows), -1)
+    X /= np.linalg.norm(X, axis=1, keepdims=True) + 1e-8
+    return X
@@ -0,0 +1,274 @@
+"""Disk-backed, memory-mapped embedding store.
+
+``embedding_cache`` lives in process memory, so every restart/deploy (and every
+extra uvicorn worker) starts cold and pays Gemini again for papers it has
+already embedded. This store keeps vectors on disk, keyed by
+``(model, task_type, text_key)``:
+
+- one matrix file per (model, task_type), rows of ``dim`` float16/float32,
+  opened read-only with ``np.memmap`` so lookups return zero-copy row views and
+  all workers share the same page cache;
+- a compact append-only index next to it: 16 bytes (the md5 ``text_key``) per
+  row, where the record's position *is* its row number.
+
+Writers append under an exclusive ``flock``: vectors are written at
+``row * rowbytes`` first and the index records second, so a crash in between
+only leaves an unreferenced tail that the next writer overwrites. Readers see
+an immutable index/memmap snapshot (no lock, no I/O on the event loop); rows
+written by other workers are picked up by ``refresh``, which re-reads the
+index tail in a worker thread after a miss and swaps in a new snapshot.
+
+Opt-in via ``EMBEDDING_STORE_DIR``; point it at a persistent disk for vectors
+to survive deploys.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config import EMBEDDING_STORE_DIR, EMBEDDING_STORE_DTYPE, EMBEDDING_STORE_MAX_ROWS
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX dev machines: single-process locking only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_KEY_BYTES = 16          # md5 digest of the embedded text
+_REFRESH_S = 1.0         # min seconds between index re-reads on a miss
+
+
+def _slug(*parts: str) -> str:
+    return "__".join(re.sub(r"[^A-Za-z0-9._-]+", "-", p) for p in parts)
+
+
+class _Snapshot:
+    """Index (digest -> row) plus a memmap covering every indexed row.
+
+    Never mutated: a refresh builds a new one and swaps it in with a single
+    attribute assignment, so readers on the event loop take no lock and never
+    wait on a writer holding ``flock`` or doing file I/O.
+    """
+
+    __slots__ = ("rows", "mm")
+
+    def __init__(self, rows: Dict[bytes, int], mm: Optional[np.memmap]) -> None:
+        self.rows = rows
+        self.mm = mm
+
+
+_EMPTY = _Snapshot({}, None)
+
+
+class _Shard:
+    """All vectors for one (model, task_type)."""
+
+    def __init__(self, root: str, model: str, task_type: str, dtype: np.dtype) -> None:
+        base = os.path.join(root, _slug(model, task_type))
+        self.vec_path = base + ".vec"
+        self.idx_path = base + ".idx"
+        self.meta_path = base + ".json"
+        self.lock_path = base + ".lock"
+        self.dtype = dtype
+        self.dim: Optional[int] = None
+        self.count = 0  # index records on disk (== rows in the matrix)
+        self._snap = _EMPTY
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()  # writers and refreshes only
+        self.full = False
+        self._load_meta()
+        self.refresh(force=True)
+
+    # --- metadata ---------------------------------------------------------
+    def _load_meta(self) -> None:
+        try:
+            with open(self.meta_path) as f:
+                meta = json.load(f)
+            self.dim = int(meta["dim"])
+            self.dtype = np.dtype(meta["dtype"])
+        except FileNotFoundError:
+            pass
+
+    def _write_meta(self, dim: int) -> None:
+        tmp = self.meta_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"dim": dim, "dtype": self.dtype.name}, f)
+        os.replace(tmp, self.meta_path)
+        self.dim = dim
+
+    # --- reading ----------------------------------------------------------
+    def stale(self) -> bool:
+        return time.monotonic() - self._last_refresh >= _REFRESH_S
+
+    def refresh(self, force: bool = False) -> bool:
+        """Load index records appended (by any process) since the last look.
+        Does file I/O: call it from a worker thread, not the event loop.
+        Returns whether new rows appeared."""
+        with self._lock:
+            return self._refresh(force)
+
+    def _refresh(self, force: bool) -> bool:
+        now = time.monotonic()
+        if not force and now - self._last_refresh < _REFRESH_S:
+            return False
+        self._last_refresh = now
+        try:
+            size = os.path.getsize(self.idx_path)
+        except FileNotFoundError:
+            return False
+        n = size // _KEY_BYTES
+        if n <= self.count:
+            return False
+        if self.dim is None:
+            self._load_meta()
+            if self.dim is None:
+                return False
+        with open(self.idx_path, "rb") as f:
+            f.seek(self.count * _KEY_BYTES)
+            tail = f.read((n - self.count) * _KEY_BYTES)
+        rows = dict(self._snap.rows)
+        for i in range(len(tail) // _KEY_BYTES):
+            rows.setdefault(tail[i * _KEY_BYTES:(i + 1) * _KEY_BYTES], self.count + i)
+        mm = np.memmap(self.vec_path, dtype=self.dtype, mode="r", shape=(n, self.dim))
+        self._snap = _Snapshot(rows, mm)
+        self.count = n
+        return True
+
+    def get(self, digest: bytes) -> Optional[np.ndarray]:
+        """Lock-free lookup in the current snapshot (no file I/O)."""
+        snap = self._snap
+        row = snap.rows.get(digest)
+        if row is None or snap.mm is None:
+            return None
+        return snap.mm[row]
+
+    # --- writing ----------------------------------------------------------
+    def put_many(self, items: List[Tuple[bytes, Sequence[float]]]) -> int:
+        with self._lock, open(self.lock_path, "a+b") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self._refresh(force=True)
+                rows = self._snap.rows
+                new = [(d, v) for d, v in items if d not in rows]
+                if not new or self.full:
+                    return 0
+                room = EMBEDDING_STORE_MAX_ROWS - self.count
+                if room <= 0:
+                    self.full = True
+                    logger.warning("Embedding store %s is full (%d rows); read-only from now on",
+                                   self.vec_path, self.count)
+                    return 0
+                new = new[:room]
+                mat = np.asarray([v for _, v in new], dtype=self.dtype)
+                if mat.ndim != 2:
+                    return 0
+                if self.dim is None:
+                    self._write_meta(mat.shape[1])
+                if mat.shape[1] != self.dim:
+                    logger.warning("Embedding store dim mismatch (%d != %d); skipping write",
+                                   mat.shape[1], self.dim)
+                    return 0
+                n = self.count
+                mode = "r+b" if os.path.exists(self.vec_path) else "w+b"
+                with open(self.vec_path, mode) as f:
+                    f.seek(n * self.dim * self.dtype.itemsize)
+                    f.write(mat.tobytes())
+                    f.flush()
+                with open(self.idx_path, "ab") as f:
+                    f.truncate(n * _KEY_BYTES)  # drop a torn trailing record
+                    f.write(b"".join(d for d, _ in new))
+                    f.flush()
+                self._refresh(force=True)
+                return len(new)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class EmbeddingStore:
+    """Lookups (``get``) are lock-free and never touch the disk, so they are
+    safe on the event loop. ``refresh`` and ``put_many`` do file I/O and run
+    in worker threads (``asyncio.to_thread``)."""
+
+    def __init__(self, root: str, dtype: str = "float16") -> None:
+        self.root = root
+        self.dtype = np.dtype(dtype)
+        os.makedirs(root, exist_ok=True)
+        self._shards: Dict[Tuple[str, str], _Shard] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _shard(self, model: str, task_type: str) -> _Shard:
+        key = (model, task_type)
+        shard = self._shards.get(key)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.get(key)
+                if shard is None:
+                    shard = self._shards[key] = _Shard(self.root, model, task_type, self.dtype)
+        return shard
+
+    def get(self, model: str, task_type: str, tkey: str) -> Optional[np.ndarray]:
+        """Zero-copy row view for ``tkey`` (an md5 hex ``text_key``), or None.
+        A shard not opened yet (see ``refresh``) counts as a miss."""
+        shard = self._shards.get((model, task_type))
+        vec = shard.get(bytes.fromhex(tkey)) if shard is not None else None
+        if vec is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return vec
+
+    def needs_refresh(self, model: str, task_type: str) -> bool:
+        shard = self._shards.get((model, task_type))
+        return shard is None or shard.stale()
+
+    def refresh(self, model: str, task_type: str) -> bool:
+        """Open the shard or pick up rows other workers appended (at most once
+        per ``_REFRESH_S``). Blocking; returns whether new rows appeared."""
+        if (model, task_type) not in self._shards:
+            return self._shard(model, task_type).count > 0
+        return self._shard(model, task_type).refresh()
+
+    def put_many(self, model: str, task_type: str, items: List[Tuple[str, Sequence[float]]]) -> int:
+        """Append ``(text_key, vector)`` pairs; returns how many rows were added."""
+        if not items:
+            return 0
+        try:
+            return self._shard(model, task_type).put_many(
+                [(bytes.fromhex(k), v) for k, v in items]
+            )
+        except OSError as e:
+            logger.warning("Embedding store write failed (%s)", e)
+            return 0
+
+    def stats(self) -> dict:
+        return {
+            "rows": sum(s.count for s in self._shards.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "dtype": self.dtype.name,
+        }
+
+
+def _open_store() -> Optional[EmbeddingStore]:
+    if not EMBEDDING_STORE_DIR:
+        return None
+    try:
+        return EmbeddingStore(EMBEDDING_STORE_DIR, EMBEDDING_STORE_DTYPE)
+    except Exception as e:  # noqa: BLE001 - the store is an optimization only
+        logger.error("Embedding store unavailable (%s); using in-memory cache only", e)
+        return None
+
+
+embedding_store = _open_store()
@@ -0,0 +1,102 @@
+"""Shared outbound HTTP connection pools.
+
+One ``httpx.AsyncClient`` per upstream host, created on first use and reused
+by every caller (search connectors, enrichment, the citation network builder,
+the legacy research client, Reviewer3), so repeated calls to a host ride warm
+keep-alive connections instead of paying TCP + TLS setup each time. Each host
+gets its own connection limits (sized to its rate limiter's concurrency,
+``services/ratelimit.py``), optional HTTP/2 (``HTTP2``, needs ``pip install
+h2``) and a longer keep-alive than httpx's default, so pollers spaced a few
+seconds apart still find the connection open.
+
+A client's connections belong to the event loop that opened them, so the
+pools are kept per running loop (the server has one; tests and scripts may
+start several). Timeouts and auth headers stay per request. ``close_all()``
+runs at app shutdown (``main.py`` lifespan).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.config import HTTP2, HTTP_KEEPALIVE_EXPIRY
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "MetasciencePlatform/2.0 (https://metascience.fqxi.org; research tool)"
+DEFAULT_TIMEOUT = httpx.Timeout(25.0, connect=10.0)
+
+# host -> (max connections, max idle keep-alive connections). A little above
+# each host's concurrency cap so a slot never waits on the pool itself.
+_HOST_LIMITS: Dict[str, Tuple[int, int]] = {
+    "export.arxiv.org": (2, 1),
+    "api.openalex.org": (12, 8),
+    "inspirehep.net": (4, 3),
+    "api.adsabs.harvard.edu": (4, 3),
+    "api.semanticscholar.org": (4, 2),
+    "reviewer3.com": (4, 2),
+}
+_DEFAULT_LIMITS = (8, 4)
+
+try:  # HTTP/2 is optional: httpx needs the h2 package for it.
+    import h2  # noqa: F401
+
+    _H2_AVAILABLE = True
+except ImportError:
+    _H2_AVAILABLE = False
+
+if HTTP2 and not _H2_AVAILABLE:
+    logger.warning("HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+
+# event loop -> host -> client. Clients of closed loops (whose connections
+# can't be closed any more) are dropped when a new loop shows up.
+_clients: Dict[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]] = {}
+
+
+def _new_client(host: str) -> httpx.AsyncClient:
+    max_conns, keepalive = _HOST_LIMITS.get(host, _DEFAULT_LIMITS)
+    return httpx.AsyncClient(
+        timeout=DEFAULT_TIMEOUT,
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+        http2=HTTP2 and _H2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=max_conns,
+            max_keepalive_connections=keepalive,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def client_for(url: str) -> httpx.AsyncClient:
+    """The shared client for ``url``'s host on the running event loop (call
+    it from a coroutine). Created lazily, so importing a caller never opens a
+    socket (matters for scripts and cold starts)."""
+    host = urlsplit(url).hostname or ""
+    loop = asyncio.get_running_loop()
+    clients = _clients.get(loop)
+    if clients is None:
+        for closed in [lp for lp in _clients if lp.is_closed()]:
+            del _clients[closed]
+        clients = _clients[loop] = {}
+    client = clients.get(host)
+    if client is None or client.is_closed:
+        client = clients[host] = _new_client(host)
+    return client
+
+
+async def close_all() -> None:
+    """Close the running loop's pooled clients (app shutdown). Later calls
+    reopen lazily."""
+    clients = list(_clients.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:  # noqa: BLE001 - shutdown is best effort
+            logger.warning("Closing HTTP client failed: %s", e)
+    if clients:
+        logger.info("Closed %d pooled HTTP clients", len(clients))
@@ -0,0 +1,262 @@
+"""Process-local metrics in Prometheus text format.
+
+Deliberately tiny (no prometheus_client dependency): latency histograms and
+counters recorded by the search pipeline, plus a snapshot of every cache and
+single-flight group at scrape time. Exposed at ``GET /api/metrics``. Each
+uvicorn worker reports its own numbers; scrape per worker (or sum in the
+dashboard) when running several.
+"""
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+PREFIX = "metascience_"
+
+# Seconds. Covers a cached hit (ms) up to a slow source hitting its timeout.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _fmt_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    esc = lambda v: v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')  # noqa: E731
+    return "{" + ",".join(f'{k}="{esc(v)}"' for k, v in pairs) + "}"
+
+
+def _fmt_value(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return str(int(v)) if float(v).is_integer() else repr(float(v))
+
+
+class Histogram:
+    def __init__(
+        self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, List[float]] = {}  # bucket counts + [sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            for i, b in enumerate(self.buckets):
+                if value <= b:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        full = PREFIX + self.name
+        lines = [f"# HELP {full} {self.help}", f"# TYPE {full} histogram"]
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._series.items()]
+        for key, series in sorted(items):
+            for b, c in zip(self.buckets, series):
+                lines.append(f"{full}_bucket{_fmt_labels(key, (('le', _fmt_value(b)),))} {int(c)}")
+            lines.append(f"{full}_bucket{_fmt_labels(key, (('le', '+Inf'),))} {int(series[-1])}")
+            lines.append(f"{full}_sum{_fmt_labels(key)} {series[-2]!r}")
+            lines.append(f"{full}_count{_fmt_labels(key)} {int(series[-1])}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self._series: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, value: float = 1.0, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + value
+
+    def render(self) -> List[str]:
+        full = PREFIX + self.name
+        lines = [f"# HELP {full} {self.help}", f"# TYPE {full} counter"]
+        with self._lock:
+            items = sorted(self._series.items())
+        lines += [f"{full}{_fmt_labels(k)} {_fmt_value(v)}" for k, v in items]
+        return lines
+
+
+_registry: Dict[str, Any] = {}
+_registry_lock = threading.Lock()
+
+
+def histogram(name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+    with _registry_lock:
+        h = _registry.get(name)
+        if h is None:
+            h = _registry[name] = Histogram(name, help_text, buckets)
+        return h
+
+
+def counter(name: str, help_text: str) -> Counter:
+    with _registry_lock:
+        c = _registry.get(name)
+        if c is None:
+            c = _registry[name] = Counter(name, help_text)
+        return c
+
+
+@contextmanager
+def timed(hist: Histogram, **labels: Any) -> Iterator[None]:
+    """Observe the wall time of the ``with`` block (awaits included)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        hist.observe(time.perf_counter() - start, **labels)
+
+
+def instrument(
+    hist: Histogram, **labels: Any
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorator form of ``timed`` for coroutine functions."""
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            with timed(hist, **labels):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# --- Pipeline metrics --------------------------------------------------------
+CONNECTOR_SECONDS = histogram(
+    "search_connector_seconds", "Latency of one connector search call, by source."
+)
+ENRICH_S2_SECONDS = histogram(
+    "search_enrich_s2_seconds", "Latency of Semantic Scholar citation enrichment."
+)
+RERANK_SECONDS = histogram(
+    "search_rerank_seconds",
+    "Latency of relevance reranking, by provider that produced the order.",
+)
+EMBED_BATCH_SIZE = histogram(
+    "embedding_batch_texts",
+    "Texts per embedding API call (misses from concurrent requests share batches).",
+    (1, 2, 4, 8, 16, 32, 48, 64),
+)
+INTENT_REQUESTS = counter(
+    "search_intent_requests_total",
+    "Intent extractions by what served them (fast_path, cache, llm, fallback).",
+)
+SPECULATIVE_FETCHES = counter(
+    "search_speculative_fetches_total",
+    "Speculative connector fetches by outcome (reused, discarded), by source.",
+)
+CLUSTER_SECONDS = histogram(
+    "cluster_papers_seconds", "Latency of embedding-based paper clustering."
+)
+HTTP_LIMITER_WAIT_SECONDS = histogram(
+    "http_limiter_wait_seconds",
+    "Time outbound requests queue for their host's rate limiter, by host.",
+    (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+HTTP_THROTTLED = counter(
+    "http_throttled_total", "Upstream 429/503 responses, by host and status."
+)
+
+
+# --- Exposition ---------------------------------------------------------------
+def _gauge_block(
+    name: str, help_text: str, kind: str, rows: List[Tuple[LabelKey, float]]
+) -> List[str]:
+    full = PREFIX + name
+    lines = [f"# HELP {full} {help_text}", f"# TYPE {full} {kind}"]
+    lines += [f"{full}{_fmt_labels(k)} {_fmt_value(v)}" for k, v in rows]
+    return lines
+
+
+def _cache_lines() -> List[str]:
+    from app.services.cache import cache_stats, coalescing_stats
+    from app.services.embedding_store import embedding_store
+    from app.services.ratelimit import limiter_stats
+
+    caches = cache_stats()
+    lines: List[str] = []
+    for field, name, help_text, kind in (
+        ("size", "cache_entries", "Entries held in the in-process (L1) tier.", "gauge"),
+        ("bytes", "cache_bytes", "Estimated bytes held in the L1 tier.", "gauge"),
+        ("max_bytes", "cache_max_bytes", "L1 byte budget (0 = unbounded).", "gauge"),
+        ("hits", "cache_hits_total", "Lookups served from L1 or L2.", "counter"),
+        ("misses", "cache_misses_total", "Lookups that found nothing.", "counter"),
+        ("evictions", "cache_evictions_total", "Entries evicted by the LRU/byte budget.",
+         "counter"),
+        ("expirations", "cache_expirations_total", "Entries dropped after their TTL.", "counter"),
+        ("stale_hits", "cache_stale_hits_total", "Hits served past the soft TTL.", "counter"),
+        ("l2_hits", "cache_l2_hits_total", "Hits served by the shared backend.", "counter"),
+        ("l2_errors", "cache_l2_errors_total", "Shared backend failures.", "counter"),
+        ("l2_dropped", "cache_l2_dropped_total",
+         "Shared backend writes dropped (write queue full).", "counter"),
+    ):
+        rows = [
+            (_label_key({"cache": c}), float(st.get(field) or 0))
+            for c, st in sorted(caches.items())
+        ]
+        lines += _gauge_block(name, help_text, kind, rows)
+
+    flights = coalescing_stats()
+    for field, name, help_text, kind in (
+        ("calls", "singleflight_calls_total",
+         "Calls that went through a single-flight group.", "counter"),
+        ("leaders", "singleflight_leaders_total",
+         "Calls that started a new computation.", "counter"),
+        ("coalesced", "singleflight_coalesced_total",
+         "Calls that joined an in-flight computation.", "counter"),
+        ("inflight", "singleflight_inflight", "Keys currently being computed.", "gauge"),
+    ):
+        rows = [(_label_key({"group": g}), float(st[field])) for g, st in sorted(flights.items())]
+        lines += _gauge_block(name, help_text, kind, rows)
+
+    limiters = limiter_stats()
+    for field, name, help_text in (
+        ("rate", "http_limiter_rate",
+         "Current adaptive request rate per host (requests/s)."),
+        ("max_rate", "http_limiter_max_rate", "Configured request rate per host (requests/s)."),
+        ("blocked_s", "http_limiter_blocked_seconds", "Remaining Retry-After pause per host."),
+    ):
+        rows = [(_label_key({"host": h}), st[field]) for h, st in sorted(limiters.items())]
+        lines += _gauge_block(name, help_text, "gauge", rows)
+
+    if embedding_store is not None:
+        st = embedding_store.stats()
+        lines += _gauge_block("embedding_store_rows", "Vectors in the on-disk store.", "gauge",
+                              [((), float(st["rows"]))])
+        lines += _gauge_block("embedding_store_hits_total", "Vectors served from disk.", "counter",
+                              [((), float(st["hits"]))])
+        lines += _gauge_block("embedding_store_misses_total", "Store lookups that missed.",
+                              "counter", [((), float(st["misses"]))])
+    return lines
+
+
+def render_prometheus() -> str:
+    lines = _cache_lines()
+    with _registry_lock:
+        metrics = list(_registry.values())
+    for m in metrics:
+        lines += m.render()
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,176 @@
+"""Per-host rate limiting for outbound HTTP.
+
+Every upstream API call (search connectors, citation enrichment, the citation
+network builder, the legacy research client, Reviewer3) goes through the
+limiter of its host, so all traffic to one API shares one budget:
+
+* a token bucket (``rate`` requests/second, ``burst`` at once) spaces
+  requests out instead of firing them and sleeping after a 429;
+* a concurrency cap bounds simultaneous connections per host;
+* ``Retry-After`` on a 429/503 blocks the whole host until that moment,
+  rather than each caller backing off on its own guess;
+* the rate adapts to what the host tolerates (AIMD): halved on a 429/503,
+  nudged back up towards the configured rate after each success.
+
+Time spent queueing is recorded in ``http_limiter_wait_seconds`` and throttling
+responses in ``http_throttled_total``, both by host; ``/api/metrics`` also
+shows each host's current rate.
+
+A limiter's lock and semaphore belong to one event loop, so limiters are kept
+per running loop (the server has one; tests and scripts may start several).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+from app.config import HTTP_RATE_LIMITS
+from app.services.metrics import HTTP_LIMITER_WAIT_SECONDS, HTTP_THROTTLED
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# host -> (requests per second, burst, simultaneous requests). Rates follow
+# each API's published policy where there is one.
+_HOSTS: Dict[str, Tuple[float, int, int]] = {
+    "export.arxiv.org": (1 / 3, 2, 1),        # "one request every three seconds"
+    "api.openalex.org": (10.0, 10, 8),        # polite pool: 10/s
+    "inspirehep.net": (3.0, 5, 3),            # 15 requests per 5 seconds
+    "api.adsabs.harvard.edu": (5.0, 5, 3),
+    "api.semanticscholar.org": (1.0, 2, 2),   # 1/s per API key
+}
+_DEFAULT = (5.0, 5, 4)
+
+_MIN_FRACTION = 1 / 16      # adaptive floor, as a fraction of the configured rate
+_INCREASE = 0.05            # additive step per success, as a fraction of it
+_MAX_RETRY_AFTER = 60.0     # longer waits are not worth honoring inline
+THROTTLE_STATUS = (429, 503)
+
+
+def retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostLimiter:
+    """Token bucket + concurrency cap + ``Retry-After`` block for one host."""
+
+    def __init__(self, host: str, rate: float, burst: int, concurrency: int) -> None:
+        self.host = host
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._slots = asyncio.Semaphore(max(1, concurrency))
+        self._lock = asyncio.Lock()  # FIFO: callers get tokens in arrival order
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    async def _take(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                await asyncio.sleep(wait)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one request's turn: a connection slot and a token."""
+        queued = time.perf_counter()
+        async with self._slots:
+            await self._take()
+            HTTP_LIMITER_WAIT_SECONDS.observe(time.perf_counter() - queued, host=self.host)
+            yield
+
+    def observe(self, status: int, retry_after_header: Optional[str] = None) -> Optional[float]:
+        """Feed back one response. Returns the host's ``Retry-After`` delay in
+        seconds when it sent one (so callers can decide whether to wait)."""
+        now = time.monotonic()
+        if status not in THROTTLE_STATUS:
+            if status < 400 and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * _INCREASE)
+            return None
+
+        HTTP_THROTTLED.inc(host=self.host, status=status)
+        delay = retry_after(retry_after_header)
+        # One burst of requests tends to come back as a burst of 429s; count it
+        # as a single signal.
+        if now - self._last_decrease >= 1 / self.rate:
+            self.rate = max(self.max_rate * _MIN_FRACTION, self.rate / 2)
+            self._last_decrease = now
+        self._tokens = min(self._tokens, 0.0)
+        pause = delay if delay is not None else 1 / self.rate
+        self._blocked_until = max(self._blocked_until, now + min(pause, _MAX_RETRY_AFTER))
+        logger.warning("%s throttled (%s); rate now %.2f/s, paused %.1fs",
+                       self.host, status, self.rate, min(pause, _MAX_RETRY_AFTER))
+        return delay
+
+    def stats(self) -> Dict[str, float]:
+        return {"rate": self.rate, "max_rate": self.max_rate,
+                "blocked_s": max(0.0, self._blocked_until - time.monotonic())}
+
+
+# event loop -> host -> limiter. Limiters of closed loops are dropped when a
+# new loop shows up.
+_limiters: Dict[asyncio.AbstractEventLoop, Dict[str, HostLimiter]] = {}
+
+
+def limiter_for(url: str) -> HostLimiter:
+    """The shared limiter of ``url``'s host on the running event loop (call
+    it from a coroutine)."""
+    host = urlsplit(url).hostname or ""
+    loop = asyncio.get_running_loop()
+    limiters = _limiters.get(loop)
+    if limiters is None:
+        for closed in [lp for lp in _limiters if lp.is_closed()]:
+            del _limiters[closed]
+        limiters = _limiters[loop] = {}
+    limiter = limiters.get(host)
+    if limiter is None:
+        rate, burst, concurrency = _HOSTS.get(host, _DEFAULT)
+        if host in HTTP_RATE_LIMITS:
+            rate = HTTP_RATE_LIMITS[host]
+        limiter = limiters[host] = HostLimiter(host, rate, burst, concurrency)
+    return limiter
+
+
+async def send(url: str, request: Callable[[], Awaitable[T]]) -> T:
+    """Run ``request()`` (one HTTP call to ``url``) under its host's limiter
+    and feed the response status back."""
+    limiter = limiter_for(url)
+    async with limiter.slot():
+        resp: Any = await request()
+    limiter.observe(resp.status_code, resp.headers.get("retry-after"))
+    return resp
+
+
+def limiter_stats() -> Dict[str, Dict[str, float]]:
+    return {
+        host: lim.stats() for limiters in list(_limiters.values()) for host, lim in limiters.items()
+    }
@@ -3,64 +3,87 @@ import asyncio
 import sys
 import hashlib
 import logging
-from datetime import datetime
 from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 from typing import List, Dict, Any, Union
 from app.core.exceptions import safe_execution
 from app.config import SEMANTIC_SCHOLAR_API_KEY
+from app.services.http_pool import client_for
+from app.services.ratelimit import send
+from app.services.search.connectors.arxiv_connector import ArxivConnector, fetch_entries as fetch_arxiv_entries
+from app.services.search.connectors.base import PageFetchError
+from app.services.cache import (
+    TTLCache,
+    legacy_citation_cache,
+    research_cache,
+    research_negative_cache,
+)
 
 
-try:
-    import arxiv
-    logger.info("arxiv package is installed successfully")
-except ImportError as e:
-    logger.error(f"arxiv package import failed: {e}")
-    arxiv = None
-
 class AdvancedResearchAPIClient:
     def __init__(self):
         # Authenticate Semantic Scholar calls when a key is configured (lifts the
         # unauthenticated rate limits that made the legacy citation fallback flaky).
         # OpenAlex / OpenCitations ignore the extra header harmlessly.
-        headers = {"x-api-key": SEMANTIC_SCHOLAR_API_KEY} if SEMANTIC_SCHOLAR_API_KEY else {}
-        self.httpx_client = httpx.AsyncClient(timeout=30.0, headers=headers)  # Reduced from 60s
-        # OPTIMIZATION: In-memory cache with TTL
-        self._cache = {}
-        self._cache_ttl = 3600  # 1 hour TTL
+        self.headers = {"x-api-key": SEMANTIC_SCHOLAR_API_KEY} if SEMANTIC_SCHOLAR_API_KEY else {}
+        self.timeout = 30.0  # Reduced from 60s
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """One call on the host's pooled client (services/http_pool.py), paced
+        by its shared rate limiter (services/ratelimit.py)"""
+        kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        kwargs.setdefault("timeout", self.timeout)
+        return await send(url, lambda: client_for(url).request(method, url, **kwargs))
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        return await self._request("GET", url, **kwargs)
+
+    async def _post(self, url: str, **kwargs) -> httpx.Response:
+        return await self._request("POST", url, **kwargs)
 
     def _get_cache_key(self, *args) -> str:
         """Generate cache key from arguments"""
         return hashlib.md5(str(args).encode()).hexdigest()
 
-    def _get_from_cache(self, key: str):
-        """Get value from cache if not expired"""
-        if key in self._cache:
-            data, timestamp = self._cache[key]
-            if datetime.now().timestamp() - timestamp < self._cache_ttl:
-                return data
-            # Expired - remove from cache
-            del self._cache[key]
-        return None
-
-    def _set_cache(self, key: str, data):
-        """Store value in cache with timestamp"""
-        self._cache[key] = (data, datetime.now().timestamp())
+    @staticmethod
+    def _cache_for(kind: str) -> TTLCache:
+        """Bounded shared cache for a lookup kind ('doi', 'cits', 'refs')."""
+        return legacy_citation_cache if kind in ("cits", "refs") else research_cache
+
+    @staticmethod
+    def _is_negative(data) -> bool:
+        """Empty result: nothing found, or the upstream call failed."""
+        if not data:
+            return True
+        if "citations" in data or "references" in data:
+            return not (data.get("citations") or data.get("references"))
+        return False
+
+    async def _get_from_cache(self, kind: str, key: str):
+        """Cached value (positive or recent negative), or None"""
+        hit = await self._cache_for(kind).aget(key)
+        if hit is None:
+            hit = await research_negative_cache.aget(key)
+        return hit
+
+    def _set_cache(self, kind: str, key: str, data):
+        """Store a result; empty results get the short negative TTL"""
+        if self._is_negative(data):
+            research_negative_cache.set(key, data)
+        else:
+            self._cache_for(kind).set(key, data)
 
     @safe_execution("look up citation count", default_val=0)
     async def _get_citation_count_for_arxiv(self, arxiv_id: str, title: str) -> int:
         """Fetch citation count for an ArXiv paper using Semantic Scholar API"""
         try:
-            # Increase rate limiting to avoid API throttling
-            await asyncio.sleep(0.5)  # Increased from 0.1s
-
             # First try by ArXiv ID
             url = f"https://api.semanticscholar.org/graph/v1/paper/ARXIV:{arxiv_id}"
             params = {"fields": "citationCount"}
 
             try:
-                r = await self.httpx_client.get(url, params=params)
+                r = await self._get(url, params=params)
                 if r.status_code == 200:
                     data = r.json()
                     citation_count = data.get('citationCount', 0)
@@ -68,22 +91,21 @@ class AdvancedResearchAPIClient:
                         logger.info(f"Found {citation_count} citations for {arxiv_id}")
                         return citation_count
                 elif r.status_code == 429:
-                    logger.warning(f"Rate limited for {arxiv_id}, waiting longer...")
-                    await asyncio.sleep(2.0)
+                    # The S2 limiter has already paused the host (Retry-After aware)
+                    logger.warning(f"Rate limited for {arxiv_id}")
                 else:
                     logger.warning(f"ArXiv ID lookup failed for {arxiv_id}: {r.status_code}")
             except Exception as e:
                 logger.error(f"ArXiv ID lookup error for {arxiv_id}: {e}")
 
-            # If ArXiv ID doesn't work, try by title search with longer delay
-            await asyncio.sleep(0.5)
+            # If ArXiv ID doesn't work, try by title search
             search_url = "https://api.semanticscholar.org/graph/v1/paper/search"
             # Clean and truncate title for better search
             clean_title = title.replace('\n', ' ').strip()[:100]
             search_params = {"query": clean_title, "limit": 3, "fields": "citationCount,title,arxivId"}
 
             try:
-                search_r = await self.httpx_client.get(search_url, params=search_params)
+                search_r = await self._get(search_url, params=search_params)
                 if search_r.status_code == 200:
                     search_data = search_r.json()
                     results = search_data.get("data", [])
@@ -103,7 +125,6 @@ class AdvancedResearchAPIClient:
                             return citation_count
                 elif search_r.status_code == 429:
                     logger.warning(f"Rate limited on title search for {arxiv_id}")
-                    await asyncio.sleep(2.0)
                 else:
                     logger.warning(f"Title search failed for {arxiv_id}: {search_r.status_code}")
             except Exception as e:
@@ -116,8 +137,12 @@ class AdvancedResearchAPIClient:
 
     @safe_execution("search enhanced arxiv", default_val=[])
     async def search_arxiv_enhanced(self, query: str, category: str | None = None, max_results: int= 0) -> List[Dict]:
-        if not arxiv:
-            return []
+        """ArXiv search in the legacy paper shape.
+
+        Fetches the Atom API asynchronously through the search connector's
+        fetcher (shared arXiv rate limiter and connection pool, parsing off the
+        event loop) instead of the blocking ``arxiv`` package client.
+        """
         try:
             # If query is in 'author:"Name"' format, convert to arxiv format 'au:"Name"'
             if query.strip().startswith("author:"):
@@ -167,129 +192,69 @@ class AdvancedResearchAPIClient:
             # Add logging to debug category issues
             logger.info(f"ArXiv query constructed: {q}")
 
-            search = arxiv.Search(
-                query=q,
-                max_results=max_results,
-                sort_by=arxiv.SortCriterion.Relevance,
-                sort_order=arxiv.SortOrder.Descending
-            )
-            # Use a smaller page size to avoid timeouts/429s on complex queries
-            # This splits the request into multiple smaller chunks (e.g. 20 at a time)
-            # Define search strategies: Original -> Simplified
             strategies = [q]
-            # Try to simplify if we have category filters which might be causing 429s/timeouts
+            # If the query with category filters fails, retry it without them
             if "cat:" in q:
                 import re
                 # Strip category filters: (cat:A OR cat:B) or cat:A
-                simple = re.sub(r'\(?cat:[^\s)]+\s*(?:OR\s*cat:[^\s)]+)*\)?', '', q).strip()
+                simple = re.sub(r'\(?cat:[^\s)]+(?:\s*OR\s*cat:[^\s)]+)*\)?', '', q).strip()
                 # Clean up multiple spaces
                 simple = " ".join(simple.split())
                 if simple and simple != q:
                     strategies.append(simple)
                     logger.info(f"Added fallback strategy: '{simple}'")
 
-            # Iterate through strategies (Complex -> Simple)
+            # Iterate through strategies (Complex -> Simple), moving on only when
+            # a query fails: no results is an answer. Retries and 429 handling
+            # (Retry-After) happen inside the fetch.
             for strategy_idx, current_q in enumerate(strategies):
                 if strategy_idx > 0:
-                     logger.warning(f"Fallback: Trying simplified query: '{current_q}'")
+                    logger.warning(f"Fallback: Trying simplified query: '{current_q}'")
+                try:
+                    entries = await fetch_arxiv_entries(current_q, max_results or 10)
+                except PageFetchError as e:
+                    logger.warning(f"ArXiv query failed: {e}")
+                    continue
+                return [self._legacy_arxiv_paper(e) for e in entries]
 
-                search = arxiv.Search(
-                    query=current_q,
-                    max_results=max_results,
-                    sort_by=arxiv.SortCriterion.Relevance,
-                    sort_order=arxiv.SortOrder.Descending
-                )
-                
-                # Use a smaller page size to avoid timeouts/429s on complex queries
-                client = arxiv.Client(
-                    page_size=20,  # Reduced page size for stability
-                    delay_seconds=3.0,
-                    num_retries=3
-                )
-                
-                # Manual retry strategy for ArXiv API rate limits (429)
-                papers = []
-                max_retries = 2  # Reduced from 3 to fail faster
-                backoff_base = 2.0  # Reduced from 5.0 to 2.0
-
-                for attempt in range(max_retries):
-                    try:
-                        # Enforce a small delay before every request to be safe
-                        if attempt > 0:
-                            wait_time = backoff_base * (2 ** (attempt - 1))
-                            logger.warning(f"ArXiv retry attempt {attempt + 1}/{max_retries}. Waiting {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                        else:
-                            # Initial delay to space out requests slightly
-                            await asyncio.sleep(0.5)  # Reduced from 1.0
-
-                        # Consume the generator fully into a list
-                        results_list = list(client.results(search))
-                        
-                        for result in results_list:
-                            doi = getattr(result, "doi", None)
-                            if not doi and getattr(result, "journal_ref", None):
-                                doi = self._extract_doi_from_text(result.journal_ref)
-                            if not doi and getattr(result, "comment", None):
-                                doi = self._extract_doi_from_text(result.comment)
-
-                            arxiv_id = result.get_short_id()
-
-                            papers.append({
-                                'id': arxiv_id,
-                                'arxiv_id': arxiv_id,
-                                'doi': doi,
-                                'title': result.title,
-                                'authors': [a.name for a in result.authors],
-                                'abstract': result.summary,
-                                'published': result.published.isoformat() if result.published else '',
-                                'updated': result.updated.isoformat() if result.updated else '',
-                                'categories': result.categories,
-                                'pdf_url': result.pdf_url,
-                                'abs_url': result.entry_id,
-                                'journal_ref': getattr(result, 'journal_ref', None),
-                                'comment': getattr(result, 'comment', None),
-                                'source': 'arxiv',
-                                'source_name': 'ArXiv',
-                                'venue': result.journal_ref if getattr(result, 'journal_ref', None) else 'ArXiv Preprints',
-                                'year': result.published.year if result.published else 0,
-                                'citationCount': 0,
-                                'isOpenAccess': True,
-                                'fieldsOfStudy': result.categories,
-                                'publicationTypes': ['Preprint'] if not getattr(result, 'journal_ref', None) else ['Article', 'Preprint'],
-                                'citation_fetched': False,
-                            })
-                        
-                        # If we succeed, verify we actually got results (sometimes empty list is success)
-                        # But even if empty, it means the query worked but found nothing. 
-                        # Or maybe we want to fallback if 0 results? 
-                        # For now, if no exception, return papers.
-                        return papers
-
-                    except Exception as e:
-                        # Check for rate limit
-                        is_rate_limit = "429" in str(e) or (hasattr(e, 'status') and e.status == 429)
-                        
-                        if is_rate_limit:
-                            logger.warning(f"ArXiv rate limit (429) hit on attempt {attempt + 1}: {e}")
-                            if attempt < max_retries - 1:
-                                continue  # Retry
-                            else:
-                                logger.error(f"ArXiv rate limit persisted after {max_retries} retries for query '{current_q}'.")
-                                # Break inner loop to try next strategy
-                                break 
-                        else:
-                            logger.error(f"ArXiv error: {e}")
-                            # Break inner loop to try next strategy
-                            break
-
-            # If all strategies failed
             logger.error("All ArXiv search strategies failed.")
             return []
         except Exception as e:
             logger.error(f"ArXiv error: {e}")
             return []
 
+    def _legacy_arxiv_paper(self, entry) -> Dict[str, Any]:
+        """Legacy dict for one Atom entry, on top of the connector's parsing"""
+        rec = ArxivConnector.parse_entry(entry)
+        journal_ref = getattr(entry, "arxiv_journal_ref", None)
+        comment = getattr(entry, "arxiv_comment", None)
+        doi = rec.get("doi") or self._extract_doi_from_text(journal_ref) or self._extract_doi_from_text(comment)
+        categories = list(rec.get("categories") or [])
+        return {
+            'id': rec.get("arxiv_id"),
+            'arxiv_id': rec.get("arxiv_id"),
+            'doi': doi,
+            'title': rec.get("title"),
+            'authors': [a["name"] for a in rec.get("authors") or []],
+            'abstract': rec.get("abstract"),
+            'published': rec.get("published") or '',
+            'updated': getattr(entry, "updated", '') or '',
+            'categories': categories,
+            'pdf_url': rec.get("pdf_url"),
+            'abs_url': rec.get("abs_url"),
+            'journal_ref': journal_ref,
+            'comment': comment,
+            'source': 'arxiv',
+            'source_name': 'ArXiv',
+            'venue': journal_ref if journal_ref else 'ArXiv Preprints',
+            'year': rec.get("year") or 0,
+            'citationCount': 0,
+            'isOpenAccess': True,
+            'fieldsOfStudy': categories,
+            'publicationTypes': ['Preprint'] if not journal_ref else ['Article', 'Preprint'],
+            'citation_fetched': False,
+        }
+
     def _extract_doi_from_text(self, text: str | None) -> str | None:
         if not text:
             return None
@@ -312,7 +277,7 @@ class AdvancedResearchAPIClient:
         try:
             url = "https://api.openalex.org/works"
             params = {"search": query, "per-page": per_page, "sort": "publication_date:desc", "filter": "type:article"}
-            r = await self.httpx_client.get(url, params=params)
+            r = await self._get(url, params=params)
             if r.status_code == 200:
                 return self._parse_openalex(r.json().get("results", []))
         except Exception as e:
@@ -322,11 +287,10 @@ class AdvancedResearchAPIClient:
     @safe_execution("search semantic scholar", default_val=[])
     async def search_semantic_scholar_with_backoff(self, query: str, limit: int = 10) -> List[Dict]:
         try:
-            await asyncio.sleep(1.5)
             url = "https://api.semanticscholar.org/graph/v1/paper/search"
             params = {"query": query, "limit": limit,
                       "fields": "paperId,title,authors,year,citationCount,referenceCount,abstract,venue,fieldsOfStudy"}
-            r = await self.httpx_client.get(url, params=params)
+            r = await self._get(url, params=params)
             if r.status_code == 200:
                 return self._parse_s2(r.json().get("data", []))
         except Exception as e:
@@ -336,7 +300,7 @@ class AdvancedResearchAPIClient:
     async def fetch_paper_citations(self, paper_id: str, source: str = "semantic_scholar") -> Dict[str, Any]:
         # OPTIMIZATION: Check cache first
         cache_key = self._get_cache_key('cits', paper_id, source)
-        cached = self._get_from_cache(cache_key)
+        cached = await self._get_from_cache('cits', cache_key)
         if cached is not None:
             return cached
 
@@ -345,14 +309,14 @@ class AdvancedResearchAPIClient:
             if source == "semantic_scholar":
                 url = f"https://api.semanticscholar.org/graph/v1/paper/{paper_id}/citations"
                 params = {"fields": "paperId,title,authors,year,citationCount,abstract,venue", "limit": 50}
-                r = await self.httpx_client.get(url, params=params)
+                r = await self._get(url, params=params)
                 if r.status_code == 200:
                     data = r.json()
                     result = {"citations": [d.get("citingPaper", {}) for d in data.get("data", [])],
                             "total": len(data.get("data", []))}
             elif source == "openalex":
                 work_id = paper_id.replace('https://openalex.org/', '') if paper_id.startswith('https://openalex.org/') else paper_id
-                meta = await self.httpx_client.get(
+                meta = await self._get(
                     f"https://api.openalex.org/works/{work_id}",
                     params={"select": "cited_by_api_url,cited_by_count"}
                 )
@@ -360,7 +324,7 @@ class AdvancedResearchAPIClient:
                     j = meta.json()
                     url = j.get("cited_by_api_url")
                     if url and j.get("cited_by_count", 0) > 0:
-                        cr = await self.httpx_client.get(f"{url}?per-page=50")
+                        cr = await self._get(f"{url}?per-page=50")
                         if cr.status_code == 200:
                             res = cr.json().get("results", [])
                             result = {"citations": self._parse_openalex(res), "total": len(res)}
@@ -368,13 +332,13 @@ class AdvancedResearchAPIClient:
             logger.error(f"Citations fetch error: {e}")
 
         # Cache the result
-        self._set_cache(cache_key, result)
+        self._set_cache('cits', cache_key, result)
         return result
 
     async def fetch_paper_references(self, paper_id: str, source: str = "semantic_scholar") -> Dict[str, Any]:
         # OPTIMIZATION: Check cache first
         cache_key = self._get_cache_key('refs', paper_id, source)
-        cached = self._get_from_cache(cache_key)
+        cached = await self._get_from_cache('refs', cache_key)
         if cached is not None:
             return cached
 
@@ -382,20 +346,20 @@ class AdvancedResearchAPIClient:
         if source == "semantic_scholar":
             url = f"https://api.semanticscholar.org/graph/v1/paper/{paper_id}/references"
             params = {"fields": "paperId,title,authors,year,journal,venue", "limit": 1000}
-            r = await self.httpx_client.get(url, params=params)
+            r = await self._get(url, params=params)
             if r.status_code == 200:
                 data = r.json()
                 refs = data.get("data") or []
                 result = {"references": [d.get("citedPaper", {}) for d in refs], "count": len(refs)}
 
         # Cache the result
-        self._set_cache(cache_key, result)
+        self._set_cache('refs', cache_key, result)
         return result
 
     async def get_paper_by_doi(self, doi: str, source: str = "semantic_scholar") -> Dict[str, Any]:
         # OPTIMIZATION: Check cache first
         cache_key = self._get_cache_key('doi', doi, source)
-        cached = self._get_from_cache(cache_key)
+        cached = await self._get_from_cache('doi', cache_key)
         if cached is not None:
             return cached
 
@@ -415,7 +379,7 @@ class AdvancedResearchAPIClient:
                     url = f"https://api.semanticscholar.org/graph/v1/paper/DOI:{quote(clean)}"
                     params = {"fields": "paperId,title,authors,year,citationCount,referenceCount,abstract,venue,fieldsOfStudy,url,externalIds"}
                     try:
-                        r = await self.httpx_client.get(url, params=params)
+                        r = await self._get(url, params=params)
                         if r.status_code == 200:
                             data = r.json()
                             if data and data.get("paperId"):
@@ -430,7 +394,7 @@ class AdvancedResearchAPIClient:
                     url = f"https://api.semanticscholar.org/graph/v1/paper/ARXIV:{arxiv_id}"
                     params = {"fields": "paperId,title,authors,year,citationCount,referenceCount,abstract,venue,fieldsOfStudy,url,externalIds"}
                     try:
-                        r = await self.httpx_client.get(url, params=params)
+                        r = await self._get(url, params=params)
                         if r.status_code == 200:
                             data = r.json()
                             if data and data.get("paperId"):
@@ -440,7 +404,7 @@ class AdvancedResearchAPIClient:
 
             elif source == "openalex":
                 url = f"https://api.openalex.org/works/doi:{quote(clean)}"
-                r = await self.httpx_client.get(url)
+                r = await self._get(url)
                 if r.status_code == 200:
                     result = self._parse_openalex([r.json()])[0]
                 elif r.status_code == 404 and arxiv_match:
@@ -449,7 +413,7 @@ class AdvancedResearchAPIClient:
                     # OpenAlex uses fully qualified IDs usually, but let's try searching works
                     url = "https://api.openalex.org/works"
                     params = {"filter": f"ids.arxiv:{arxiv_id}"}
-                    r = await self.httpx_client.get(url, params=params)
+                    r = await self._get(url, params=params)
                     if r.status_code == 200:
                         results = r.json().get("results", [])
                         if results:
@@ -458,8 +422,9 @@ class AdvancedResearchAPIClient:
         except Exception as e:
             logger.error(f"DOI fetch error: {e}")
 
-        # Cache the result (even if empty to avoid repeated failed lookups)
-        self._set_cache(cache_key, result)
+        # Cache the result. Empty results are cached too (so repeated failed
+        # lookups don't hammer the APIs), but only for the short negative TTL.
+        self._set_cache('doi', cache_key, result)
         return result
 
     def _clean_doi(self, doi: str) -> str:
@@ -531,7 +496,7 @@ class AdvancedResearchAPIClient:
             url = "https://opencitations.net/index/api/v1/metadata"
             payload = ', '.join(ids)
             headers = {'Content-Type': 'text/plain'}
-            r = await self.httpx_client.post(url, content=payload, headers=headers)
+            r = await self._post(url, content=payload, headers=headers)
             if r.status_code == 200:
                 return self._parse_open_citations_response(r.json())
         except Exception as e:
@@ -572,15 +537,12 @@ class AdvancedResearchAPIClient:
                 title = paper.get('title', '')
                 paper_updated = paper.copy()
 
-                # Add some spread to requests
-                await asyncio.sleep(0.1 * (idx % 10))
-
                 if arxiv_id and paper.get('source') == 'arxiv':
                     new_count = await self._get_citation_count_for_arxiv(arxiv_id, title)
                     paper_updated['citationCount'] = new_count
                 elif paper.get('paperId') and paper.get('source') == 'semantic_scholar':
                     url = f"https://api.semanticscholar.org/graph/v1/paper/{paper['paperId']}"
-                    r = await self.httpx_client.get(url, params={"fields": "citationCount"})
+                    r = await self._get(url, params={"fields": "citationCount"})
                     if r.status_code == 200:
                         paper_updated['citationCount'] = r.json().get('citationCount', 0)
 
@@ -22,6 +22,8 @@ from typing import Any, Dict, Optional
 import httpx
 
 from ..config import REVIEWER3_API_KEY, REVIEWER3_BASE_URL, REVIEWER3_USER_ID
+from .http_pool import client_for
+from .ratelimit import THROTTLE_STATUS, limiter_for
 
 logger = logging.getLogger(__name__)
 
@@ -161,13 +163,17 @@ class Reviewer3Service:
         """
         self._ensure_configured()
         url = f"{self.base_url}{path}"
+        # Pooled keep-alive client: status polls reuse the warm connection.
+        client = client_for(url)
+        limiter = limiter_for(url)
 
         for attempt in range(MAX_ATTEMPTS):
             is_last = attempt == MAX_ATTEMPTS - 1
             try:
-                async with httpx.AsyncClient(timeout=timeout) as client:
+                async with limiter.slot():
                     response = await client.request(
-                        method, url, headers=self._headers(), **kwargs
+                        method, url, headers=self._headers(), timeout=timeout,
+                        follow_redirects=False, **kwargs
                     )
             except _CONNECT_ERRORS as exc:
                 # Never reached the server — always safe to retry.
@@ -186,13 +192,17 @@ class Reviewer3Service:
                 logger.error(f"Reviewer3 request failed: {method} {path}: {exc!r}")
                 raise Reviewer3Error(_unreachable_message(exc), 502)
 
+            limiter.observe(response.status_code, response.headers.get("retry-after"))
             if (
                 response.status_code in RETRYABLE_STATUS
                 and idempotent
                 and not is_last
             ):
+                # On 429/503 the limiter has already paused the host (for
+                # Retry-After when given); the next attempt queues behind it.
                 await self._backoff(
-                    attempt, method, path, f"HTTP {response.status_code}"
+                    attempt, method, path, f"HTTP {response.status_code}",
+                    paused=response.status_code in THROTTLE_STATUS,
                 )
                 continue
 
@@ -210,8 +220,10 @@ class Reviewer3Service:
         raise Reviewer3Error("Could not reach Reviewer3", 502)
 
     @staticmethod
-    async def _backoff(attempt: int, method: str, path: str, reason: str) -> None:
-        delay = BACKOFF_BASE_S * (2 ** attempt)
+    async def _backoff(
+        attempt: int, method: str, path: str, reason: str, paused: bool = False
+    ) -> None:
+        delay = 0.0 if paused else BACKOFF_BASE_S * (2 ** attempt)
         logger.warning(
             f"Reviewer3 {method} {path} retry {attempt + 1}/{MAX_ATTEMPTS} "
             f"in {delay:.1f}s ({reason})"
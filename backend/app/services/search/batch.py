@@ -0,0 +1,134 @@
+"""Columnar view of a candidate pool for the ranking stages.
+
+Candidates stay plain dicts (they are what the API returns), but filtering,
+sorting and blending only need a handful of numeric fields. ``PaperBatch``
+reads those once into NumPy arrays next to the list of records, so each stage
+is a few vectorized operations plus one final reorder of the list instead of
+repeated ``p.get(...)`` passes and intermediate lists.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .schema import SearchIntent
+
+_YEAR_BITS = 12  # years fit below 4096, so (citations, year) packs into one int64
+
+
+def descending(key: np.ndarray, head: Optional[int] = None) -> np.ndarray:
+    """Indices ordering ``key`` from high to low, ties in input order (the
+    order a stable ``sorted(..., reverse=True)`` gives).
+
+    With ``head``, only the first ``head`` positions are ordered (top-k via
+    ``argpartition``); the remaining indices follow in input order.
+    """
+    n = len(key)
+    neg = -key
+    if head is None or head >= n:
+        return np.argsort(neg, kind="stable")
+    if head <= 0:
+        return np.arange(n)
+    kth = neg[np.argpartition(neg, head - 1)[head - 1]]
+    # Everything up to the k-th value (ties included), then a stable sort of
+    # just those, so the head matches a full sort exactly.
+    cand = np.flatnonzero(neg <= kth)
+    top = cand[np.argsort(neg[cand], kind="stable")[:head]]
+    rest = np.ones(n, dtype=bool)
+    rest[top] = False
+    return np.concatenate([top, np.flatnonzero(rest)])
+
+
+class PaperBatch:
+    """Struct-of-arrays over ``papers``: citations, year and open-access flags
+    up front; relevance and date keys on first use (not every stage needs
+    them)."""
+
+    __slots__ = ("papers", "citations", "year", "oa", "_relevance", "_date")
+
+    def __init__(self, papers: List[Dict[str, Any]]) -> None:
+        n = len(papers)
+        self.papers = papers
+        # Records come from schema.make_paper, so these are ints (or None).
+        citations = np.fromiter((p.get("citationCount") or 0 for p in papers), np.int64, n)
+        self.citations = np.maximum(citations, 0)
+        self.year = np.fromiter((p.get("year") or 0 for p in papers), np.int64, n)
+        self.oa = np.fromiter((bool(p.get("isOpenAccess")) for p in papers), bool, n)
+        self._relevance: Optional[np.ndarray] = None
+        self._date: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.papers)
+
+    @property
+    def relevance(self) -> np.ndarray:
+        if self._relevance is None:
+            self._relevance = np.fromiter(
+                (p.get("relevance_score") or 0.0 for p in self.papers), np.float64, len(self.papers)
+            )
+        return self._relevance
+
+    @property
+    def date_key(self) -> np.ndarray:
+        """Integer rank of ``published`` (falling back to the year), so ISO
+        dates sort as the strings would."""
+        if self._date is None:
+            keys = [p.get("published") or str(p.get("year") or "") for p in self.papers]
+            rank = {k: i for i, k in enumerate(sorted(set(keys)))}
+            self._date = np.fromiter((rank[k] for k in keys), np.int64, len(keys))
+        return self._date
+
+    def take(self, idx: np.ndarray) -> "PaperBatch":
+        sub = PaperBatch.__new__(PaperBatch)
+        sub.papers = [self.papers[i] for i in idx.tolist()]
+        sub.citations = self.citations[idx]
+        sub.year = self.year[idx]
+        sub.oa = self.oa[idx]
+        sub._relevance = None if self._relevance is None else self._relevance[idx]
+        sub._date = None if self._date is None else self._date[idx]
+        return sub
+
+    # --- stages -----------------------------------------------------------
+    def filter(self, intent: SearchIntent) -> "PaperBatch":
+        """Apply the intent's post-filters (min citations, open access,
+        excluded terms)."""
+        keep = np.ones(len(self), dtype=bool)
+        if intent.min_citations:
+            keep &= self.citations >= intent.min_citations
+        if intent.open_access_only:
+            keep &= self.oa
+        terms = [t.lower() for t in intent.exclude or () if t]
+        if terms:
+            # Substring search has no vector form; only scan the survivors.
+            for i in np.flatnonzero(keep).tolist():
+                p = self.papers[i]
+                hay = f"{p.get('title', '')} {p.get('abstract', '')}".lower()
+                if any(t in hay for t in terms):
+                    keep[i] = False
+        if keep.all():
+            return self
+        return self.take(np.flatnonzero(keep))
+
+    def impact_order(self, head: Optional[int] = None) -> np.ndarray:
+        """Most-cited first, newer first among equals."""
+        year = np.clip(self.year, 0, (1 << _YEAR_BITS) - 1)
+        return descending((self.citations << _YEAR_BITS) | year, head)
+
+    def date_order(self, head: Optional[int] = None) -> np.ndarray:
+        return descending(self.date_key, head)
+
+    def relevance_order(self, head: Optional[int] = None) -> np.ndarray:
+        return descending(self.relevance, head)
+
+    def blend_scores(self, alpha: float) -> np.ndarray:
+        """``alpha * relevance_norm + (1 - alpha) * citations_norm``, both
+        min-max normalized over the batch (citations log-scaled)."""
+        rel = self.relevance
+        cit = np.log1p(self.citations.astype(np.float64))
+        rn = (rel - rel.min()) / ((rel.max() - rel.min()) or 1.0)
+        cn = (cit - cit.min()) / ((cit.max() - cit.min()) or 1.0)
+        return np.round(alpha * rn + (1.0 - alpha) * cn, 4)
+
+    def ordered(self, order: np.ndarray) -> List[Dict[str, Any]]:
+        return [self.papers[i] for i in order.tolist()]
@@ -9,16 +9,17 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.config import ADS_API_TOKEN
 
 from ..schema import SearchIntent, make_paper
-from .base import get_with_retry
+from .base import PageFetchError, fetch_pages, get_with_retry
 
 logger = logging.getLogger(__name__)
 
 ADS_API = "https://api.adsabs.harvard.edu/v1/search/query"
+_PAGE_SIZE = 200
 _FIELDS = "bibcode,title,author,abstract,year,pubdate,citation_count,doi,identifier,bibstem,pub"
 
 
@@ -59,27 +60,46 @@ class AdsConnector:
     def available(self) -> bool:
         return bool(ADS_API_TOKEN)
 
-    async def search(self, intent: SearchIntent, limit: int) -> List[Dict[str, Any]]:
-        papers = await self._run(intent, limit, broaden=False)
+    def query_key(self, intent: SearchIntent) -> str:
+        broaden = build_q(intent, broaden=True) if len(intent.keyword_terms()) > 1 else ""
+        sort = {"date": "date desc", "citations": "citation_count desc"}.get(intent.sort, "score desc")
+        return f"{build_q(intent)}|{broaden}|{sort}"
+
+    async def search(self, intent: SearchIntent, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        papers = await self._run(intent, limit, broaden=False, offset=offset)
+        if offset:  # deeper pages continue the strict query only
+            return papers
         if len(papers) < max(5, limit // 6) and len(intent.keyword_terms()) > 1:
-            more = await self._run(intent, limit, broaden=True)
+            try:
+                more = await self._run(intent, limit, broaden=True)
+            except PageFetchError as e:  # keep what the strict query found
+                logger.warning("ADS: broadened query failed (%s)", e)
+                return papers
             seen = {p["id"] for p in papers}
             papers.extend(p for p in more if p["id"] not in seen)
         return papers
 
-    async def _run(self, intent: SearchIntent, limit: int, broaden: bool) -> List[Dict[str, Any]]:
+    async def _run(
+        self, intent: SearchIntent, limit: int, broaden: bool, offset: int = 0
+    ) -> List[Dict[str, Any]]:
         sort = {"date": "date desc", "citations": "citation_count desc"}.get(intent.sort, "score desc")
-        params = {"q": build_q(intent, broaden=broaden), "fl": _FIELDS, "rows": min(limit, 200), "sort": sort}
-        logger.info("ADS q: %s (sort=%s)", params["q"], sort)
-        resp = await get_with_retry(ADS_API, params=params, headers={"Authorization": f"Bearer {ADS_API_TOKEN}"})
-        if resp is None:
-            return []
-        try:
-            docs = resp.json().get("response", {}).get("docs", [])
-        except Exception as e:  # noqa: BLE001
-            logger.error("ADS parse error: %s", e)
-            return []
-        return [self._parse(d) for d in docs if d.get("title")]
+        params = {"q": build_q(intent, broaden=broaden), "fl": _FIELDS, "sort": sort}
+        headers = {"Authorization": f"Bearer {ADS_API_TOKEN}"}
+        logger.info("ADS q: %s (sort=%s, limit=%d, offset=%d)", params["q"], sort, limit, offset)
+
+        async def page(index: int, size: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+            resp = await get_with_retry(
+                ADS_API, params={**params, "rows": size, "start": index * size}, headers=headers
+            )
+            if resp is None:
+                raise PageFetchError(f"ADS page {index} failed")
+            try:
+                body = resp.json().get("response", {})
+            except Exception as e:  # noqa: BLE001
+                raise PageFetchError(f"ADS page {index}: unreadable response ({e})") from e
+            return [self._parse(d) for d in body.get("docs", []) if d.get("title")], body.get("numFound")
+
+        return await fetch_pages(page, limit, _PAGE_SIZE, offset=offset)
 
     @staticmethod
     def _parse(d: Dict[str, Any]) -> Dict[str, Any]:
@@ -7,18 +7,22 @@ deterministically from the structured intent.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import feedparser
 
 from ..schema import SearchIntent, make_paper
-from .base import get_with_retry
+from .base import PageFetchError, fetch_pages, get_with_retry
 
 logger = logging.getLogger(__name__)
 
 ARXIV_API = "http://export.arxiv.org/api/query"
+# arXiv serves up to 2000 per call but asks clients not to parallelize, so deep
+# pools are walked sequentially in fairly large slices.
+_PAGE_SIZE = 500
 
 # Map our coarse field -> arXiv top-level category prefix, used only as a
 # fallback when the intent has no specific arxiv_categories.
@@ -32,6 +36,30 @@ _FIELD_TO_ARXIV = {
 }
 
 
+async def fetch_entries(
+    query: str, limit: int, *, sort_by: str = "relevance", offset: int = 0
+) -> List[Any]:
+    """Atom entries (feedparser) for an arXiv ``search_query``: ``limit`` of
+    them from rank ``offset``, walked page by page through the shared arXiv
+    limiter. Feeds are parsed in a worker thread (a 500-entry page takes long
+    enough to stall the event loop). Raises ``PageFetchError`` when a page
+    can't be fetched, so callers can tell a failure from no results."""
+    params = {"search_query": query, "sortBy": sort_by, "sortOrder": "descending"}
+
+    async def page(index: int, size: int) -> Tuple[List[Any], Optional[int]]:
+        resp = await get_with_retry(
+            ARXIV_API, params={**params, "start": index * size, "max_results": size}
+        )
+        if resp is None:
+            raise PageFetchError(f"arXiv page {index} failed")
+        feed = await asyncio.to_thread(feedparser.parse, resp.text)
+        total = getattr(feed.feed, "opensearch_totalresults", None)
+        entries = [e for e in feed.entries if getattr(e, "title", None)]
+        return entries, int(total) if str(total or "").isdigit() else None
+
+    return await fetch_pages(page, limit, _PAGE_SIZE, offset=offset, concurrent=False)
+
+
 def _q(term: str) -> str:
     """A title-or-abstract group for one term, phrase-quoted."""
     t = term.replace('"', "").strip()
@@ -95,35 +123,38 @@ class ArxivConnector:
     def available(self) -> bool:
         return True
 
-    async def search(self, intent: SearchIntent, limit: int) -> List[Dict[str, Any]]:
-        papers = await self._run(intent, limit, broaden=False)
+    def query_key(self, intent: SearchIntent) -> str:
+        broaden = build_query(intent, broaden=True) if len(intent.keyword_terms()) > 1 else ""
+        sort_by = "submittedDate" if intent.sort == "date" else "relevance"
+        return f"{build_query(intent)}|{broaden}|{sort_by}"
+
+    async def search(self, intent: SearchIntent, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        papers = await self._run(intent, limit, broaden=False, offset=offset)
+        if offset:  # deeper pages continue the strict query only
+            return papers
         # Recall fallback: if a strict AND of several terms found little, retry OR.
         if len(papers) < max(5, limit // 6) and len(intent.keyword_terms()) > 1:
             logger.info("arXiv: broadening query (strict found %d)", len(papers))
-            more = await self._run(intent, limit, broaden=True)
+            try:
+                more = await self._run(intent, limit, broaden=True)
+            except PageFetchError as e:  # keep what the strict query found
+                logger.warning("arXiv: broadened query failed (%s)", e)
+                return papers
             seen = {p["id"] for p in papers}
             papers.extend(p for p in more if p["id"] not in seen)
         return papers
 
-    async def _run(self, intent: SearchIntent, limit: int, broaden: bool) -> List[Dict[str, Any]]:
+    async def _run(
+        self, intent: SearchIntent, limit: int, broaden: bool, offset: int = 0
+    ) -> List[Dict[str, Any]]:
         query = build_query(intent, broaden=broaden)
         sort_by = "submittedDate" if intent.sort == "date" else "relevance"
-        params = {
-            "search_query": query,
-            "start": 0,
-            "max_results": min(limit, 200),
-            "sortBy": sort_by,
-            "sortOrder": "descending",
-        }
-        logger.info("arXiv query: %s (sort=%s)", query, sort_by)
-        resp = await get_with_retry(ARXIV_API, params=params)
-        if resp is None:
-            return []
-        feed = feedparser.parse(resp.text)
-        return [self._parse_entry(e) for e in feed.entries if getattr(e, "title", None)]
+        logger.info("arXiv query: %s (sort=%s, limit=%d, offset=%d)", query, sort_by, limit, offset)
+        entries = await fetch_entries(query, limit, sort_by=sort_by, offset=offset)
+        return [self.parse_entry(e) for e in entries]
 
     @staticmethod
-    def _parse_entry(e: Any) -> Dict[str, Any]:
+    def parse_entry(e: Any) -> Dict[str, Any]:
         arxiv_id = ""
         if getattr(e, "id", None):
             # e.id looks like http://arxiv.org/abs/2401.01234v1
@@ -1,39 +1,41 @@
 """Shared HTTP plumbing for source connectors.
 
-One async client is reused across connectors. Every connector is expected to
-catch its own errors and return ``[]`` so one failing source never sinks a
-whole search (the orchestrator also guards with ``return_exceptions``).
+Requests use the shared per-host connection pools (``services/http_pool.py``).
+A connector whose request fails raises (``PageFetchError`` for a failed page)
+rather than returning ``[]``: the orchestrator records the source as failed
+and searches on without it, while ``[]`` means the source has no (more)
+results.
+
+Requests go through their host's shared rate limiter (``services/ratelimit.py``)
+so deep, multi-page retrieval stays polite, and ``fetch_pages`` turns any
+page/offset-numbered API into "give me up to N records".
 """
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Protocol
+import math
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple, TypeVar
 
 import httpx
 
+from app.services.http_pool import client_for
+from app.services.ratelimit import THROTTLE_STATUS, limiter_for
+
 from ..schema import SearchIntent
 
 logger = logging.getLogger(__name__)
 
-_USER_AGENT = (
-    "MetasciencePlatform/2.0 (https://metascience.fqxi.org; research tool)"
-)
+T = TypeVar("T")
+
 
-# Single shared client. Created lazily so importing connectors never opens a
-# socket at import time (matters for tests / cold starts).
-_client: Optional[httpx.AsyncClient] = None
+class PageFetchError(Exception):
+    """A page request failed after its retries (as opposed to an empty page)."""
 
 
-def get_client() -> httpx.AsyncClient:
-    global _client
-    if _client is None or _client.is_closed:
-        _client = httpx.AsyncClient(
-            timeout=httpx.Timeout(25.0, connect=10.0),
-            headers={"User-Agent": _USER_AGENT},
-            follow_redirects=True,
-        )
-    return _client
+# A Retry-After longer than this isn't worth waiting for inside a search:
+# give up on the request and let the source's deadline move on.
+_MAX_WAIT = 10.0
 
 
 async def get_with_retry(
@@ -44,21 +46,36 @@ async def get_with_retry(
     retries: int = 2,
     backoff: float = 1.5,
 ) -> Optional[httpx.Response]:
-    """GET with light retry on 429/5xx. Returns None on persistent failure."""
-    client = get_client()
+    """GET with light retry on 429/5xx. Returns None on persistent failure.
+
+    Each attempt waits its turn in the host's limiter. A 429/503 pauses the
+    whole host (for ``Retry-After`` when given), so the retry simply queues
+    behind that pause instead of sleeping on a guess; other 5xx back off
+    exponentially.
+    """
+    client = client_for(url)
+    limiter = limiter_for(url)
     for attempt in range(retries + 1):
         try:
-            resp = await client.get(url, params=params, headers=headers)
+            async with limiter.slot():  # held per attempt, never across backoff
+                resp = await client.get(url, params=params, headers=headers)
+            delay = limiter.observe(resp.status_code, resp.headers.get("retry-after"))
             if resp.status_code == 200:
                 return resp
-            if resp.status_code in (429, 500, 502, 503, 504) and attempt < retries:
+            if resp.status_code in THROTTLE_STATUS and attempt < retries:
+                if delay is not None and delay > _MAX_WAIT:
+                    logger.warning("%s -> %s, Retry-After %.0fs; giving up", url, resp.status_code, delay)
+                    return None
+                logger.warning("%s -> %s, retrying after the host's pause", url, resp.status_code)
+                continue
+            if resp.status_code in (500, 502, 504) and attempt < retries:
                 wait = backoff * (2 ** attempt)
                 logger.warning("%s -> %s, retrying in %.1fs", url, resp.status_code, wait)
                 await asyncio.sleep(wait)
                 continue
             logger.warning("GET %s failed: %s", url, resp.status_code)
             return None
-        except Exception as e:  # noqa: BLE001 - connectors must never raise
+        except Exception as e:  # noqa: BLE001 - reported as None, like a bad status
             if attempt < retries:
                 await asyncio.sleep(backoff * (2 ** attempt))
                 continue
@@ -67,6 +84,66 @@ async def get_with_retry(
     return None
 
 
+# Hard ceiling on records one connector returns, however large the requested
+# pool (SEARCH_CANDIDATES_PER_SOURCE / candidates_per_source).
+MAX_RECORDS_PER_SOURCE = 2000
+
+
+async def fetch_pages(
+    fetch: Callable[[int, int], Awaitable[Tuple[List[T], Optional[int]]]],
+    limit: int,
+    page_size: int,
+    *,
+    offset: int = 0,
+    concurrent: bool = True,
+) -> List[T]:
+    """Collect records ``[offset, offset + limit)`` from a paged API.
+
+    ``fetch(index, size)`` returns page ``index`` (0-based, ``size`` records per
+    page) plus the API's total hit count (None if unknown), and raises
+    ``PageFetchError`` on failure (after ``get_with_retry``'s retries). A failed
+    page fails the whole call: returning the pages around it would leave a gap,
+    and a short result would read as the end of the source. The first page is
+    fetched alone to learn the total; the remaining pages go out together when
+    ``concurrent`` (bounded by the per-host cap), otherwise one by one,
+    stopping at the first empty page. An ``offset`` that isn't page-aligned
+    costs a partial page, trimmed here.
+    """
+    limit = min(limit, MAX_RECORDS_PER_SOURCE - offset)
+    if limit <= 0:
+        return []
+    size = max(1, min(page_size, limit))
+    first_page = offset // size
+    skip = offset - first_page * size
+    first, total = await fetch(first_page, size)
+    out = list(first)
+    end = offset + limit if total is None else min(offset + limit, total)
+    last_page = math.ceil(end / size) - 1
+    # Without a total, a short first page is the only end-of-results signal
+    # (with one, a short page may just be records the connector filtered out).
+    if last_page <= first_page or (total is None and len(first) < size):
+        return out[skip : skip + limit]
+
+    rest = range(first_page + 1, last_page + 1)
+    if concurrent:
+        tasks = [asyncio.ensure_future(fetch(i, size)) for i in rest]
+        try:
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            for t in tasks:  # the call has failed; don't finish its other pages
+                t.cancel()
+            raise
+        for records, _ in pages:
+            out.extend(records)
+    else:
+        for i in rest:
+            records, _ = await fetch(i, size)
+            out.extend(records)
+            if not records:
+                break
+    return out[skip : skip + limit]
+
+
 class Connector(Protocol):
     """A literature source. Turns a SearchIntent into normalized papers."""
 
@@ -75,4 +152,15 @@ class Connector(Protocol):
 
     def available(self) -> bool: ...
 
-    async def search(self, intent: SearchIntent, limit: int) -> List[Dict[str, Any]]: ...
+    def query_key(self, intent: SearchIntent) -> str:
+        """The provider query ``search`` would send for ``intent`` (strict and
+        broadened forms, sort, filters). Intents with equal keys fetch the same
+        records, so the orchestrator caches and shares fetches by it."""
+        ...
+
+    async def search(
+        self, intent: SearchIntent, limit: int, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Up to ``limit`` records starting at rank ``offset``. Deeper pages
+        (``offset > 0``) always continue the strict query, never a broadened one."""
+        ...
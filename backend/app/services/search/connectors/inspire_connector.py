@@ -8,14 +8,15 @@ subfields, which is exactly the FQxI foundational-physics audience.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..schema import SearchIntent, make_paper
-from .base import get_with_retry
+from .base import PageFetchError, fetch_pages, get_with_retry
 
 logger = logging.getLogger(__name__)
 
 INSPIRE_API = "https://inspirehep.net/api/literature"
+_PAGE_SIZE = 200
 
 _FIELDS = ",".join([
     "titles", "authors.full_name", "abstracts", "arxiv_eprints", "dois",
@@ -75,35 +76,47 @@ class InspireConnector:
     def available(self) -> bool:
         return True
 
-    async def search(self, intent: SearchIntent, limit: int) -> List[Dict[str, Any]]:
-        papers = await self._run(intent, limit, broaden=False)
+    def query_key(self, intent: SearchIntent) -> str:
+        broaden = build_q(intent, broaden=True) if len(intent.keyword_terms()) > 1 else ""
+        sort = {"date": "mostrecent", "citations": "mostcited"}.get(intent.sort, "")
+        return f"{build_q(intent)}|{broaden}|{sort}"
+
+    async def search(self, intent: SearchIntent, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        papers = await self._run(intent, limit, broaden=False, offset=offset)
+        if offset:  # deeper pages continue the strict query only
+            return papers
         if len(papers) < max(5, limit // 6) and len(intent.keyword_terms()) > 1:
             logger.info("INSPIRE: broadening query (strict found %d)", len(papers))
-            more = await self._run(intent, limit, broaden=True)
+            try:
+                more = await self._run(intent, limit, broaden=True)
+            except PageFetchError as e:  # keep what the strict query found
+                logger.warning("INSPIRE: broadened query failed (%s)", e)
+                return papers
             seen = {p["id"] for p in papers}
             papers.extend(p for p in more if p["id"] not in seen)
         return papers
 
-    async def _run(self, intent: SearchIntent, limit: int, broaden: bool) -> List[Dict[str, Any]]:
+    async def _run(
+        self, intent: SearchIntent, limit: int, broaden: bool, offset: int = 0
+    ) -> List[Dict[str, Any]]:
         sort = {"date": "mostrecent", "citations": "mostcited"}.get(intent.sort, "")
-        params: Dict[str, Any] = {
-            "q": build_q(intent, broaden=broaden),
-            "size": min(limit, 200),
-            "page": 1,
-            "fields": _FIELDS,
-        }
+        params: Dict[str, Any] = {"q": build_q(intent, broaden=broaden), "fields": _FIELDS}
         if sort:
             params["sort"] = sort
-        logger.info("INSPIRE q: %s (sort=%s)", params["q"], sort or "bestmatch")
-        resp = await get_with_retry(INSPIRE_API, params=params)
-        if resp is None:
-            return []
-        try:
-            hits = resp.json().get("hits", {}).get("hits", [])
-        except Exception as e:  # noqa: BLE001
-            logger.error("INSPIRE parse error: %s", e)
-            return []
-        return [self._parse(h) for h in hits if h.get("metadata", {}).get("titles")]
+        logger.info("INSPIRE q: %s (sort=%s, limit=%d, offset=%d)", params["q"], sort or "bestmatch", limit, offset)
+
+        async def page(index: int, size: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+            resp = await get_with_retry(INSPIRE_API, params={**params, "size": size, "page": index + 1})
+            if resp is None:
+                raise PageFetchError(f"INSPIRE page {index} failed")
+            try:
+                hits = resp.json().get("hits", {})
+            except Exception as e:  # noqa: BLE001
+                raise PageFetchError(f"INSPIRE page {index}: unreadable response ({e})") from e
+            records = [self._parse(h) for h in hits.get("hits", []) if h.get("metadata", {}).get("titles")]
+            return records, hits.get("total")
+
+        return await fetch_pages(page, limit, _PAGE_SIZE, offset=offset)
 
     @staticmethod
     def _parse(hit: Dict[str, Any]) -> Dict[str, Any]:
@@ -8,16 +8,17 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.config import OPENALEX_MAILTO
 
 from ..schema import SearchIntent, make_paper
-from .base import get_with_retry
+from .base import PageFetchError, fetch_pages, get_with_retry
 
 logger = logging.getLogger(__name__)
 
 OPENALEX_API = "https://api.openalex.org/works"
+_PAGE_SIZE = 200  # OpenAlex per-page maximum
 
 
 def _reconstruct_abstract(inv_index: Dict[str, List[int]]) -> str:
@@ -44,7 +45,7 @@ class OpenAlexConnector:
     def available(self) -> bool:
         return True
 
-    def _build_params(self, intent: SearchIntent, limit: int) -> Dict[str, Any]:
+    def _build_params(self, intent: SearchIntent) -> Dict[str, Any]:
         # Relevance text: topics + synonyms + must terms (natural phrase).
         search_text = " ".join(
             intent.topics + intent.should_include + intent.must_include + intent.phrases
@@ -62,10 +63,7 @@ class OpenAlexConnector:
         if intent.open_access_only:
             filters.append("is_oa:true")
 
-        params: Dict[str, Any] = {
-            "filter": ",".join(filters),
-            "per-page": min(limit, 200),
-        }
+        params: Dict[str, Any] = {"filter": ",".join(filters)}
         if search_text:
             params["search"] = search_text
 
@@ -80,18 +78,28 @@ class OpenAlexConnector:
             params["mailto"] = OPENALEX_MAILTO
         return params
 
-    async def search(self, intent: SearchIntent, limit: int) -> List[Dict[str, Any]]:
-        params = self._build_params(intent, limit)
-        logger.info("OpenAlex params: %s", {k: v for k, v in params.items() if k != "mailto"})
-        resp = await get_with_retry(OPENALEX_API, params=params)
-        if resp is None:
-            return []
-        try:
-            results = resp.json().get("results", [])
-        except Exception as e:  # noqa: BLE001
-            logger.error("OpenAlex parse error: %s", e)
-            return []
-        return [self._parse(w) for w in results]
+    def query_key(self, intent: SearchIntent) -> str:
+        params = {k: v for k, v in self._build_params(intent).items() if k != "mailto"}
+        return "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+    async def search(self, intent: SearchIntent, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        params = self._build_params(intent)
+        logger.info("OpenAlex params: %s (limit=%d, offset=%d)",
+                    {k: v for k, v in params.items() if k != "mailto"}, limit, offset)
+
+        async def page(index: int, size: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+            resp = await get_with_retry(
+                OPENALEX_API, params={**params, "per-page": size, "page": index + 1}
+            )
+            if resp is None:
+                raise PageFetchError(f"OpenAlex page {index} failed")
+            try:
+                data = resp.json()
+            except Exception as e:  # noqa: BLE001
+                raise PageFetchError(f"OpenAlex page {index}: unreadable response ({e})") from e
+            return [self._parse(w) for w in data.get("results", [])], (data.get("meta") or {}).get("count")
+
+        return await fetch_pages(page, limit, _PAGE_SIZE, offset=offset)
 
     @staticmethod
     def _parse(w: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,274 @@
+"""Cross-source deduplication of candidate papers.
+
+Two records are the same work if they share any identity key (DOI, arXiv id,
+normalized title — see ``schema.candidate_keys``) or if their titles are near
+duplicates (a preprint and its journal version often differ by a word or some
+punctuation). Matches are unioned in a disjoint-set structure, so transitive
+identity links merge too: a record carrying both a DOI and an arXiv id joins a
+DOI-only record and an arXiv-only one into one work. Fuzzy links don't chain:
+two groups only merge if every record of one is a near duplicate of every
+record of the other.
+
+Near-duplicate titles are found with MinHash over character shingles and LSH
+banding, which only compares records that land in a shared bucket, keeping the
+pass roughly linear as pools grow into the thousands. Every LSH candidate pair
+is verified with the exact shingle Jaccard plus cheap guards (publication year,
+arXiv ids, DOIs of one registrant, "Part I"/"Part II"-style markers) before it
+is merged.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .schema import candidate_keys, normalize_title
+
+_SHINGLE = 3             # characters per title shingle
+_MIN_TITLE = 16          # shorter normalized titles are too generic to fuzzy-match
+_BANDS, _ROWS = 16, 4    # 64 MinHash permutations; pairs from J~0.5 up become candidates
+_JACCARD = 0.8           # verified similarity needed to merge
+_MAX_YEAR_GAP = 1        # preprint vs. journal year
+_MAX_BUCKET = 64         # skip degenerate buckets (boilerplate titles)
+_CHUNK = 512             # papers per vectorized MinHash block (bounds memory)
+
+
+# Title words that distinguish otherwise near-identical works: numbering
+# ("Part II", "... 3") and companion pieces ("A review", "Comment on", "Reply").
+_MARKER = re.compile(
+    r"^(?:\d+|i{1,3}|iv|vi{0,3}|ix|x|review|comment|comments|reply|response|erratum|"
+    r"corrigendum|addendum|correction|retraction)$"
+)
+
+
+class DisjointSet:
+    """Union-find over ``0..n-1`` with path halving and union by size."""
+
+    def __init__(self, n: int) -> None:
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+
+
+def merge_into(primary: Dict[str, Any], other: Dict[str, Any]) -> None:
+    for k in ("citationCount", "referenceCount"):
+        primary[k] = max(primary.get(k, 0) or 0, other.get(k, 0) or 0)
+    for k in ("doi", "arxiv_id", "paperId", "pdf_url", "abs_url", "published"):
+        if not primary.get(k) and other.get(k):
+            primary[k] = other[k]
+    if not primary.get("year") and other.get("year"):
+        primary["year"] = other["year"]
+    o_abs = other.get("abstract", "")
+    longer = len(o_abs or "") > len(primary.get("abstract", "") or "")
+    if o_abs and o_abs != "No abstract available" and longer:
+        primary["abstract"] = o_abs
+    cats = list(dict.fromkeys([*(primary.get("categories") or ()),
+                               *(other.get("categories") or ())]))
+    primary["categories"] = cats
+    primary["concepts"] = cats[:5]
+    srcs = set(primary.get("sources") or [primary.get("source")])
+    srcs.add(other.get("source"))
+    primary["sources"] = sorted(s for s in srcs if s)
+
+
+# --- near-duplicate titles ----------------------------------------------------
+# Normalized titles only contain [a-z0-9 ], so a shingle packs exactly into a
+# base-37 integer (< 37**3 for 3-char shingles): no string hashing needed.
+_ALPHABET = " 0123456789abcdefghijklmnopqrstuvwxyz"
+_LUT = np.zeros(256, dtype=np.uint64)
+_LUT[np.frombuffer(_ALPHABET.encode(), dtype=np.uint8)] = np.arange(len(_ALPHABET), dtype=np.uint64)
+_POW = np.array([len(_ALPHABET) ** k for k in range(_SHINGLE - 1, -1, -1)], dtype=np.uint64)
+
+# The shingle universe is tiny (37**3 codes), so each MinHash permutation is a
+# precomputed lookup table (multiply-shift hash, top 16 bits): hashing becomes
+# a gather, and a band's 4 uint16 rows pack exactly into one uint64 bucket key.
+_perm_table: Optional[np.ndarray] = None
+
+
+def _permutations() -> np.ndarray:
+    global _perm_table
+    if _perm_table is None:
+        rng = np.random.default_rng(0x5EED)
+        a = rng.integers(1, 2**63, size=_BANDS * _ROWS, dtype=np.uint64) | np.uint64(1)
+        b = rng.integers(0, 2**63, size=_BANDS * _ROWS, dtype=np.uint64)
+        codes = np.arange(len(_ALPHABET) ** _SHINGLE, dtype=np.uint64)
+        # Row per shingle code, column per permutation (gathers are row copies),
+        # plus a trailing all-max row that pads ragged titles in a block.
+        table = ((codes[:, None] * a[None, :] + b[None, :]) >> np.uint64(48)).astype(np.uint16)
+        _perm_table = np.vstack([table, np.full((1, table.shape[1]), 0xFFFF, dtype=np.uint16)])
+    return _perm_table
+
+
+def _shingles(title: str) -> Set[str]:
+    return {title[i:i + _SHINGLE] for i in range(len(title) - _SHINGLE + 1)}
+
+
+def _shingle_codes(titles: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """All shingles of all titles as base-37 codes, plus shingles per title."""
+    codes = _LUT[np.frombuffer("".join(titles).encode("ascii"), dtype=np.uint8)]
+    lens = np.fromiter((len(t) for t in titles), dtype=np.int64, count=len(titles))
+    counts = lens - _SHINGLE + 1
+    title_start = np.cumsum(lens) - lens
+    first_shingle = np.cumsum(counts) - counts
+    pos = np.repeat(title_start - first_shingle, counts) + np.arange(int(counts.sum()))
+    values = sum(codes[pos + k] * _POW[k] for k in range(_SHINGLE))
+    return values, counts
+
+
+def _signatures(titles: Sequence[str]) -> np.ndarray:
+    """MinHash signatures, shape ``(len(titles), _BANDS * _ROWS)``."""
+    table = _permutations()
+    pad = len(table) - 1
+    out = np.empty((len(titles), _BANDS * _ROWS), dtype=np.uint16)
+    for start in range(0, len(titles), _CHUNK):
+        values, counts = _shingle_codes(titles[start:start + _CHUNK])
+        # One padded (title, shingle) index grid per block, gathered and min'd.
+        idx = np.full((len(counts), int(counts.max())), pad, dtype=np.intp)
+        idx[np.arange(idx.shape[1])[None, :] < counts[:, None]] = values
+        out[start:start + len(counts)] = table[idx].min(axis=1)
+    return out
+
+
+def _candidate_pairs(sig: np.ndarray) -> Set[Tuple[int, int]]:
+    """Pairs of rows sharing at least one LSH band."""
+    pairs: Set[Tuple[int, int]] = set()
+    for band in range(_BANDS):
+        rows = sig[:, band * _ROWS:(band + 1) * _ROWS].astype(np.uint64)
+        key = rows[:, 0].copy()
+        for r in range(1, _ROWS):
+            key |= rows[:, r] << np.uint64(16 * r)
+        _, inverse, counts = np.unique(key, return_inverse=True, return_counts=True)
+        sizes = counts[inverse]
+        shared = np.flatnonzero((sizes >= 2) & (sizes <= _MAX_BUCKET))
+        buckets: Dict[int, List[int]] = {}
+        for j in shared.tolist():
+            buckets.setdefault(int(inverse[j]), []).append(j)
+        for members in buckets.values():
+            for x, j in enumerate(members):
+                for k in members[x + 1:]:
+                    pairs.add((j, k))
+    return pairs
+
+
+def _arxiv_base(p: Dict[str, Any]) -> str:
+    return re.sub(r"v\d+$", "", str(p.get("arxiv_id") or "")).lower()
+
+
+def _doi(p: Dict[str, Any]) -> str:
+    return next((k[4:] for k in candidate_keys(p) if k.startswith("doi:")), "")
+
+
+def _compatible(a: Dict[str, Any], b: Dict[str, Any], ta: str, tb: str) -> bool:
+    """Guards for a fuzzy title match that identity keys can't vouch for."""
+    xa, xb = _arxiv_base(a), _arxiv_base(b)
+    if xa and xb and xa != xb:
+        return False
+    # One registrant (DOI prefix) never gives a work two DOIs; a preprint
+    # server and a journal do.
+    da, db = _doi(a), _doi(b)
+    if da and db and da != db and da.split("/", 1)[0] == db.split("/", 1)[0]:
+        return False
+    ya, yb = a.get("year") or 0, b.get("year") or 0
+    if ya and yb and abs(ya - yb) > _MAX_YEAR_GAP:
+        return False
+    # "... Part I" vs "... Part II", "X" vs "X: a review": different works.
+    markers = lambda t: {w for w in t.split() if _MARKER.match(w)}  # noqa: E731
+    return markers(ta) == markers(tb)
+
+
+class _Titles:
+    """Normalized titles and their shingles, computed once per record."""
+
+    def __init__(self, papers: List[Dict[str, Any]]) -> None:
+        self.papers = papers
+        self.titles = [normalize_title(p.get("title", "")) for p in papers]
+        self._shingles: Dict[int, Set[str]] = {}
+
+    def jaccard(self, i: int, j: int) -> float:
+        if self.titles[i] == self.titles[j]:
+            return 1.0
+        si = self._shingles.get(i) or self._shingles.setdefault(i, _shingles(self.titles[i]))
+        sj = self._shingles.get(j) or self._shingles.setdefault(j, _shingles(self.titles[j]))
+        inter = len(si & sj)
+        return inter / (len(si) + len(sj) - inter)
+
+    def same_work(self, i: int, j: int) -> bool:
+        """Near-duplicate titles that pass the guards. Titles too short to
+        compare only need the guards."""
+        ti, tj = self.titles[i], self.titles[j]
+        if len(ti) >= _MIN_TITLE and len(tj) >= _MIN_TITLE and self.jaccard(i, j) < _JACCARD:
+            return False
+        return _compatible(self.papers[i], self.papers[j], ti, tj)
+
+
+def _near_duplicate_pairs(titles: _Titles) -> List[Tuple[int, int]]:
+    """Verified near-duplicate pairs, most similar first."""
+    idx = [i for i, t in enumerate(titles.titles) if len(t) >= _MIN_TITLE]
+    if len(idx) < 2:
+        return []
+    sig = _signatures([titles.titles[i] for i in idx])
+    pairs = sorted(
+        (-titles.jaccard(idx[j], idx[k]), idx[j], idx[k]) for j, k in _candidate_pairs(sig)
+    )
+    return [(i, j) for _, i, j in pairs if titles.same_work(i, j)]
+
+
+# --- entry point --------------------------------------------------------------
+def dedupe(papers: List[Dict[str, Any]], *, fuzzy: bool = True) -> List[Dict[str, Any]]:
+    """Collapse records of the same work into one, preserving first-seen order.
+
+    The earliest record of each work is the primary (callers list the richest
+    sources first) and the rest are merged into it with ``merge_into``.
+    ``fuzzy=False`` skips near-duplicate title matching.
+    """
+    n = len(papers)
+    if n < 2:
+        for p in papers:
+            p.setdefault("sources", [p.get("source")] if p.get("source") else [])
+        return papers
+
+    dsu = DisjointSet(n)
+    first_with: Dict[str, int] = {}
+    for i, p in enumerate(papers):
+        for k in candidate_keys(p):
+            j: Optional[int] = first_with.setdefault(k, i)
+            if j != i:
+                dsu.union(i, j)
+    groups: Dict[int, List[int]] = {}
+    for i in range(n):
+        groups.setdefault(dsu.find(i), []).append(i)
+    if fuzzy:
+        # Complete linkage: A~B and B~C must not pull in C unless A~C too.
+        titles = _Titles(papers)
+        for i, j in _near_duplicate_pairs(titles):
+            ri, rj = dsu.find(i), dsu.find(j)
+            if ri == rj or not all(titles.same_work(a, b) for a in groups[ri] for b in groups[rj]):
+                continue
+            dsu.union(ri, rj)
+            root = dsu.find(ri)
+            groups[root] = sorted(groups.pop(ri) + groups.pop(rj))
+
+    result: List[Dict[str, Any]] = []
+    for members in sorted(groups.values(), key=lambda m: m[0]):
+        primary = papers[members[0]]
+        primary.setdefault("sources", [primary.get("source")] if primary.get("source") else [])
+        for i in members[1:]:
+            merge_into(primary, papers[i])
+        result.append(primary)
+    return result
@@ -13,8 +13,9 @@ from typing import Any, Dict, List
 
 from app.config import SEMANTIC_SCHOLAR_API_KEY
 from app.services.cache import s2_cache
-
-from .connectors.base import get_client
+from app.services.http_pool import client_for
+from app.services.metrics import ENRICH_S2_SECONDS, instrument
+from app.services.ratelimit import send
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,7 @@ def _apply(papers: List[Dict[str, Any]], count: int) -> None:
             p["citationsCount"] = count
 
 
+@instrument(ENRICH_S2_SECONDS)
 async def enrich_citations_s2(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     if not SEMANTIC_SCHOLAR_API_KEY:
         return papers
@@ -54,20 +56,21 @@ async def enrich_citations_s2(papers: List[Dict[str, Any]]) -> List[Dict[str, An
 
     ids = list(by_id)[:_MAX_IDS]
     misses: List[str] = []
-    for sid in ids:
-        cached = s2_cache.get(sid)
+    for sid, cached in zip(ids, await s2_cache.aget_many(ids)):
         if cached is not None:
             _apply(by_id[sid], cached)
         else:
             misses.append(sid)
 
     if misses:
-        client = get_client()
+        client = client_for(S2_BATCH)
         headers = {"x-api-key": SEMANTIC_SCHOLAR_API_KEY}
         for i in range(0, len(misses), 200):  # S2 batch caps at 500; stay modest
             chunk = misses[i : i + 200]
             try:
-                r = await client.post(S2_BATCH, params={"fields": "citationCount"}, json={"ids": chunk}, headers=headers)
+                r = await send(S2_BATCH, lambda: client.post(
+                    S2_BATCH, params={"fields": "citationCount"}, json={"ids": chunk}, headers=headers
+                ))
                 if r.status_code != 200:
                     logger.warning("S2 batch enrich -> %s", r.status_code)
                     continue
@@ -5,16 +5,23 @@ parsing JSON out of free text), and crucially separates "understand the
 request" from "speak each provider's query syntax". Relative dates are resolved
 against today's date, which is the single biggest fix for the old time-frame
 filtering failures.
+
+Most searches never reach the model, though: plain keyword queries (optionally
+with "since YYYY" / "by Author") are parsed locally, and extracted intents are
+cached per normalized text and day.
 """
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from anthropic import Anthropic
 
-from app.config import ANTHROPIC_API_KEY, ANTHROPIC_MODEL
+from app.config import ANTHROPIC_API_KEY, ANTHROPIC_MODEL, INTENT_FAST_PATH
+from app.services.cache import intent_cache, intent_flight
+from app.services.metrics import INTENT_REQUESTS
 
 from .schema import SearchIntent, today_iso
 
@@ -79,18 +86,145 @@ def _build_tool() -> dict:
     }
 
 
-async def extract_intent(natural_language: str) -> SearchIntent:
-    """Extract a SearchIntent. Falls back to a basic intent on any failure."""
-    nl = (natural_language or "").strip()
-    if not nl:
-        return SearchIntent(topics=[], canonical_query="")
+# --- Fast path ------------------------------------------------------------------
+# A query qualifies only if it is nothing but keywords plus at most one
+# "since YYYY" and one "by Author" clause. Any word that hints at sorting,
+# filtering, negation, time ranges or a question goes to the model instead,
+# and so does a "by ..." that doesn't look like a person's name.
+_SINCE = re.compile(r"\s+since\s+((?:19|20)\d{2})$", re.IGNORECASE)
+_BY = re.compile(
+    r"\s+by\s+([A-Z][\w.'-]*(?:\s+(?:(?:van|von|de|der|den|da|di|du|del|dos|la|le)\s+)*"
+    r"[A-Z][\w.'-]*){0,3})$"
+)
+_INITIALS = re.compile(r"(?:[A-Z]\.-?)+")
+_KEYWORDS = re.compile(r"[\w][\w'/+.-]*(?:\s+[\w][\w'/+.-]*){0,7}")
+_YEAR = re.compile(r"(?:19|20)\d{2}")
+_SIGNALS = frozenset("""
+    about after articles before best between by cited citation citations during except
+    excluding find free from give how i influential important key last latest me months my
+    need new newest no not open or papers paper past preprints recent recently review reviews
+    search seminal show since survey top until want what which who why without work works year
+    years
+""".split())
+
+
+# Unambiguous subfield phrases -> (field, arXiv categories), so fast-path
+# intents scope arXiv the way the model would. Several matches OR their
+# categories; the field is only set when they agree.
+_SUBFIELDS: Tuple[Tuple[re.Pattern, str, Tuple[str, ...]], ...] = tuple(
+    (re.compile(rf"\b{phrase}\b"), field, cats)
+    for phrase, field, cats in (
+        (r"quantum (?:computing|computation|information|error correction)", "physics",
+         ("quant-ph",)),
+        (r"quantum foundations|foundations of quantum mechanics", "physics", ("quant-ph",)),
+        (r"quantum gravity", "physics", ("gr-qc", "hep-th")),
+        (r"general relativity|gravitational waves?", "physics", ("gr-qc",)),
+        (r"string theory|ads/cft", "physics", ("hep-th",)),
+        (r"cosmology|dark energy|cosmic microwave background", "physics", ("astro-ph.CO",)),
+        (r"(?:machine|deep|reinforcement) learning", "computer_science", ("cs.LG", "stat.ML")),
+    )
+)
+
+
+def _person_like(name: str) -> bool:
+    """Two to four name parts (initials allowed, particles like "van der"
+    skipped), the last a real word. A single capitalized word ("by Design",
+    "by Doing") is too ambiguous to call a person."""
+    parts = [w for w in name.split() if not w.islower()]
+    if len(parts) < 2 or _INITIALS.fullmatch(parts[-1]):
+        return False
+    return all(
+        _INITIALS.fullmatch(w) or (any(c.islower() for c in w) and w.lower() not in _SIGNALS)
+        for w in parts
+    )
+
+
+def _subfields(text: str) -> Tuple[Optional[str], List[str]]:
+    hits = [(field, cats) for rx, field, cats in _SUBFIELDS if rx.search(text)]
+    fields = {field for field, _ in hits}
+    cats = list(dict.fromkeys(c for _, cs in hits for c in cs))
+    return (fields.pop() if len(fields) == 1 else None), cats
+
+
+def _fast_intent(nl: str, today: str) -> Optional[SearchIntent]:
+    """Build the intent locally for simple queries; None means "ask the LLM"."""
+    text = " ".join(nl.split())
+    year = author = None
+    for _ in range(2):  # the two clauses may come in either order
+        m = _SINCE.search(text)
+        if m and year is None:
+            year, text = m.group(1), text[: m.start()]
+            continue
+        m = _BY.search(text)
+        if m and author is None:
+            if not _person_like(m.group(1)):
+                return None
+            author, text = m.group(1), text[: m.start()]
+    if year is not None and year > today[:4]:
+        return None
+    if not _KEYWORDS.fullmatch(text):
+        return None
+    words = text.lower().split()
+    if any(w in _SIGNALS or _YEAR.fullmatch(w) for w in words):
+        return None
+
+    field, categories = _subfields(text.lower())
+    summary = text
+    if author:
+        summary += f" by {author}"
+    if year:
+        summary += f", since {year}"
+    return SearchIntent(
+        topics=[text],
+        authors=[author] if author else [],
+        arxiv_categories=categories,
+        field=field,
+        date_from=f"{year}-01-01" if year else None,
+        canonical_query=summary,
+        reasoning="Simple keyword query; parsed without the model.",
+    )
+
+
+# Request phrasing around the topic ("find me recent papers about ..."). It
+# carries no retrieval terms, so the provisional intent drops it.
+_LEAD = re.compile(
+    r"^(?:(?:please|can you|could you|i want|i need|give me|show me|find me|find|search for|"
+    r"search|look for|get|list)\s+)*(?:(?:some|the|a few|any|all|recent|latest|new|newest|key|"
+    r"important|seminal|influential|good|top)\s+)*(?:papers?|articles?|preprints?|works?|"
+    r"research|publications?|literature|studies)\s+(?:on|about|regarding|concerning|into|in|of|"
+    r"for|related to)\s+",
+    re.IGNORECASE,
+)
+
 
+def provisional_intent(natural_language: str) -> SearchIntent:
+    """A best guess at the intent without the model, for speculative retrieval.
+
+    Queries the fast path handles get exactly the intent ``extract_intent``
+    will return; anything else becomes a plain topic search over the text with
+    the request phrasing and trailing punctuation stripped.
+    """
+    nl = " ".join((natural_language or "").split())
+    fast = _fast_intent(nl, today_iso()) if INTENT_FAST_PATH and nl else None
+    if fast is not None:
+        return fast
+    text = _LEAD.sub("", nl).rstrip("?.!") or nl
+    return SearchIntent(topics=[text] if text else [], canonical_query=text)
+
+
+def _served(path: str, nl: str) -> None:
+    INTENT_REQUESTS.inc(path=path)
+    logger.info("Intent for %r served by %s", nl[:80], path)
+
+
+async def _extract_llm(nl: str, today: str) -> Optional[Dict[str, Any]]:
+    """One model call; the intent as a dict, or None if extraction failed."""
     def _call():
         return _client.messages.create(
             model=ANTHROPIC_MODEL,
             max_tokens=1024,
             temperature=0,
-            system=_SYSTEM.format(today=today_iso()),
+            system=_SYSTEM.format(today=today),
             tools=[_build_tool()],
             tool_choice={"type": "tool", "name": _TOOL_NAME},
             messages=[{"role": "user", "content": nl}],
@@ -109,7 +243,45 @@ async def extract_intent(natural_language: str) -> SearchIntent:
         if not intent.canonical_query:
             intent.canonical_query = intent.semantic_text() or nl
         logger.info("Intent extracted: %s", intent.canonical_query)
-        return intent
+        return intent.model_dump()
     except Exception as e:  # noqa: BLE001 - never break search on extraction
         logger.error("Intent extraction failed (%s); using fallback", e)
+        return None
+
+
+async def extract_intent(natural_language: str) -> SearchIntent:
+    """Extract a SearchIntent. Falls back to a basic intent on any failure.
+
+    Simple queries take the local fast path (``INTENT_FAST_PATH``); the rest
+    go to the model once per normalized text and day (``intent_cache``), with
+    concurrent identical requests sharing one call.
+    """
+    nl = (natural_language or "").strip()
+    if not nl:
+        return SearchIntent(topics=[], canonical_query="")
+    today = today_iso()
+
+    if INTENT_FAST_PATH:
+        fast = _fast_intent(nl, today)
+        if fast is not None:
+            _served("fast_path", nl)
+            return fast
+
+    key = (" ".join(nl.casefold().split()), today)
+    hit = await intent_cache.aget(key)
+    if hit is not None:
+        _served("cache", nl)
+        return SearchIntent(**hit)
+
+    async def _extract() -> Optional[Dict[str, Any]]:
+        data = await _extract_llm(nl, today)
+        if data is not None:  # failures are retried next time, not cached
+            intent_cache.set(key, data)
+        return data
+
+    data = await intent_flight.do(key, _extract)
+    if data is None:
+        _served("fallback", nl)
         return SearchIntent(topics=[nl], canonical_query=nl)
+    _served("llm", nl)
+    return SearchIntent(**data)
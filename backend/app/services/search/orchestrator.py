@@ -10,16 +10,38 @@ import hashlib
 import json
 import logging
 import math
-from typing import Any, Dict, List, Optional
-
-from app.config import RELEVANCE_BLEND_ALPHA, SEARCH_CANDIDATES_PER_SOURCE
-from app.services.cache import search_results_cache
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from app.config import (
+    RELEVANCE_BLEND_ALPHA,
+    SEARCH_BUDGET_S,
+    SEARCH_CANDIDATES_PER_SOURCE,
+    SEARCH_SOURCE_DEADLINE_S,
+    SEARCH_SOURCE_DEADLINES,
+)
+from app.services.cache import (
+    TTLCache,
+    fetch_flight,
+    rerank_scores_cache,
+    search_fetch_cache,
+    search_flight,
+    search_negative_cache,
+    search_pool_cache,
+    search_results_cache,
+    search_served_cache,
+    text_key,
+)
+from app.services.metrics import CONNECTOR_SECONDS, SPECULATIVE_FETCHES, timed
 
 from .connectors import AdsConnector, ArxivConnector, InspireConnector, OpenAlexConnector
 from .connectors.base import Connector
+from .batch import PaperBatch, descending
+from .dedup import dedupe
 from .enrich import enrich_citations_s2
-from .rerank import rerank
-from .schema import SearchIntent, candidate_keys
+from .intent import extract_intent, provisional_intent
+from .rerank import primary_provider, rerank, rerank_setup
+from .schema import SearchIntent, candidate_keys, dedup_key
 
 logger = logging.getLogger(__name__)
 
@@ -42,65 +64,16 @@ def _select_connectors(sources: Optional[List[str]]) -> List[Connector]:
     return [c for c in _ALL_CONNECTORS if c.source_id in wanted and c.available()]
 
 
-def _merge_into(primary: Dict[str, Any], other: Dict[str, Any]) -> None:
-    primary["citationCount"] = max(primary.get("citationCount", 0) or 0, other.get("citationCount", 0) or 0)
-    primary["referenceCount"] = max(primary.get("referenceCount", 0) or 0, other.get("referenceCount", 0) or 0)
-    for k in ("doi", "arxiv_id", "paperId", "pdf_url", "abs_url", "published"):
-        if not primary.get(k) and other.get(k):
-            primary[k] = other[k]
-    if not primary.get("year") and other.get("year"):
-        primary["year"] = other["year"]
-    o_abs = other.get("abstract", "")
-    if o_abs and o_abs != "No abstract available" and len(o_abs) > len(primary.get("abstract", "") or ""):
-        primary["abstract"] = o_abs
-    cats = list(dict.fromkeys((primary.get("categories") or []) + (other.get("categories") or [])))
-    primary["categories"] = cats
-    primary["concepts"] = cats[:5]
-    srcs = set(primary.get("sources") or [primary.get("source")])
-    srcs.add(other.get("source"))
-    primary["sources"] = sorted(s for s in srcs if s)
-
-
-def _dedupe(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    by_key: Dict[str, int] = {}
-    result: List[Dict[str, Any]] = []
-    for p in papers:
-        keys = candidate_keys(p)
-        hit = next((by_key[k] for k in keys if k in by_key), None)
-        if hit is None:
-            idx = len(result)
-            p.setdefault("sources", [p.get("source")] if p.get("source") else [])
-            result.append(p)
-            for k in keys:
-                by_key[k] = idx
-        else:
-            _merge_into(result[hit], p)
-            for k in candidate_keys(result[hit]):
-                by_key.setdefault(k, hit)
-    return result
-
-
-def _post_filter(papers: List[Dict[str, Any]], intent: SearchIntent) -> List[Dict[str, Any]]:
-    out = papers
-    if intent.min_citations:
-        out = [p for p in out if (p.get("citationCount", 0) or 0) >= intent.min_citations]
-    if intent.open_access_only:
-        out = [p for p in out if p.get("isOpenAccess")]
-    if intent.exclude:
-        terms = [t.lower() for t in intent.exclude if t]
-        def blocked(p: Dict[str, Any]) -> bool:
-            hay = f"{p.get('title','')} {p.get('abstract','')}".lower()
-            return any(t in hay for t in terms)
-        out = [p for p in out if not blocked(p)]
-    return out
-
-
-def _sort_without_rerank(papers: List[Dict[str, Any]], intent: SearchIntent) -> List[Dict[str, Any]]:
+def _sort_without_rerank(
+    batch: PaperBatch, intent: SearchIntent, head: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Order by date or impact; ``head`` limits the full ordering to the top
+    ``head`` results (the rest follow unordered)."""
     if intent.sort == "date":
-        return sorted(papers, key=lambda p: (p.get("published") or str(p.get("year") or "")), reverse=True)
+        return batch.ordered(batch.date_order(head))
     # 'citations', 'hybrid' (with no relevance signal) and the rerank-unavailable
     # 'relevance' fallback all collapse to impact-first ordering.
-    return sorted(papers, key=lambda p: (p.get("citationCount", 0) or 0, p.get("year", 0) or 0), reverse=True)
+    return batch.ordered(batch.impact_order(head))
 
 
 def _blend_relevance_citations(
@@ -116,19 +89,11 @@ def _blend_relevance_citations(
     if len(papers) <= 1:
         return papers
 
-    rel = [float(p.get("relevance_score", 0.0) or 0.0) for p in papers]
-    cit = [math.log1p(max(0, int(p.get("citationCount", 0) or 0))) for p in papers]
-    rmin, rmax = min(rel), max(rel)
-    cmin, cmax = min(cit), max(cit)
-    rspan = (rmax - rmin) or 1.0
-    cspan = (cmax - cmin) or 1.0
-
-    for p, r, c in zip(papers, rel, cit):
-        rn = (r - rmin) / rspan
-        cn = (c - cmin) / cspan
-        p["blend_score"] = round(alpha * rn + (1.0 - alpha) * cn, 4)
-
-    ranked = sorted(papers, key=lambda p: p.get("blend_score", 0.0), reverse=True)
+    batch = PaperBatch(papers)
+    scores = batch.blend_scores(alpha)
+    for p, score in zip(papers, scores.tolist()):
+        p["blend_score"] = score
+    ranked = batch.ordered(descending(scores))
     for i, p in enumerate(ranked):
         p["relevance_rank"] = i + 1
     return ranked
@@ -140,48 +105,590 @@ def _intent_signature(intent: SearchIntent, sources: Optional[List[str]]) -> str
     return hashlib.md5(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
 
 
-async def _execute(
+def _pool_signature(intent: SearchIntent, sources: Optional[List[str]]) -> str:
+    """Key of the candidate pool: the provider query of every selected source.
+
+    Intents share a pool only when no source would query differently for
+    them (e.g. "hybrid" vs "relevance" sort, or a different canonical summary
+    of the same terms). Anything a connector sends upstream (date sort,
+    citation floor, open access, exclusions) gets a pool of its own, since a
+    pool fetched without it and filtered afterwards is the wrong slice.
+    """
+    payload = {c.source_id: c.query_key(intent) for c in _select_connectors(sources)}
+    return hashlib.md5(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+# Fields ``_rank`` applies locally (PaperBatch sorts and filters): a pool
+# fetched without them can serve them, once it holds every match.
+_LOCAL_FIELDS = {
+    "sort": "relevance", "min_citations": None, "open_access_only": False, "exclude": [],
+}
+
+
+def _retrieval_intent(intent: SearchIntent) -> SearchIntent:
+    """``intent`` as a plain retrieval: topic, author and scope terms fetched
+    in relevance order, without the sort and post-filters."""
+    return intent.model_copy(update=_LOCAL_FIELDS)
+
+
+def _complete(entry: Dict[str, Any]) -> bool:
+    """Every source's matches are in the pool (all exhausted, none failed or
+    cut off), so any sort or filter of it is exact."""
+    depth = entry.get("depth") or {}
+    return bool(depth) and set(depth) <= set(entry.get("exhausted") or ())
+
+
+async def _choose_pool(
+    intent: SearchIntent, sources: Optional[List[str]]
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Key of the pool serving ``intent``, and that pool if cached and fresh.
+
+    An intent whose sort or filters a source sends upstream normally gets a
+    pool of its own (``_pool_signature``). When the plain retrieval pool of the
+    same search is cached and complete, it serves instead: re-sorting and
+    filtering it locally is exact and costs no network calls.
+    """
+    pool_key = _pool_signature(intent, sources)
+    retrieval_key = _pool_signature(_retrieval_intent(intent), sources)
+    if retrieval_key != pool_key:
+        base = await _fresh(search_pool_cache, retrieval_key)
+        if base is not None and _complete(base):
+            return retrieval_key, base
+    return pool_key, await _fresh(search_pool_cache, pool_key)
+
+
+async def _fresh(cache: TTLCache, key: Any) -> Optional[Any]:
+    """Cached value unless missing or past the soft TTL."""
+    entry = await cache.aget_entry(key)
+    return None if entry is None or entry[1] else entry[0]
+
+
+async def _timed_search(
+    connector: Connector, intent: SearchIntent, limit: int, offset: int = 0
+) -> List[Dict[str, Any]]:
+    with timed(CONNECTOR_SECONDS, source=connector.source_id):
+        return await connector.search(intent, limit, offset=offset)
+
+
+def _wave_size(needed: int, n_sources: int) -> int:
+    """Per-source fetch size for ``needed`` more ranked results, over-fetching
+    to survive cross-source duplicates and post-filters."""
+    return max(_MIN_WAVE, math.ceil(_OVERFETCH * needed / max(1, n_sources)))
+
+
+def _interleave(batches: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Round-robin by source rank, so no single source floods the top before
+    rerank has had a say."""
+    depth = max((len(b) for b in batches), default=0)
+    return [b[i] for i in range(depth) for b in batches if i < len(b)]
+
+
+def _provisional(
     intent: SearchIntent,
-    sources: Optional[List[str]],
-    candidates_per_source: Optional[int],
-) -> Dict[str, Any]:
-    """Run the full pipeline once, returning the complete ranked list + meta."""
-    connectors = _select_connectors(sources)
-    per_source = candidates_per_source or SEARCH_CANDIDATES_PER_SOURCE
+    connectors: List[Connector],
+    results: Dict[str, List[Dict[str, Any]]],
+    head: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Cheap ranking of what has arrived so far (no enrichment, no rerank).
+
+    Dedupes shallow copies: ``merge_into`` mutates the primary record, and
+    the originals still have to go through the final pipeline untouched.
+    Only the first ``head`` results (the pages being streamed) are sorted.
+    """
+    batches = [results[c.source_id] for c in connectors if c.source_id in results]
+    merged = dedupe([p.copy() for p in _interleave(batches)])
+    filtered = PaperBatch(merged).filter(intent)
+    if intent.sort in ("relevance", "hybrid"):
+        return filtered.papers
+    return _sort_without_rerank(filtered, intent, head)
+
+
+def _deadline_for(source_id: str) -> float:
+    """Soft deadline (seconds) for one source, capped by the overall budget."""
+    return min(SEARCH_BUDGET_S, SEARCH_SOURCE_DEADLINES.get(source_id, SEARCH_SOURCE_DEADLINE_S))
+
+
+def _collect(
+    task: "asyncio.Task[List[Dict[str, Any]]]",
+    connector: Connector,
+    results: Dict[str, List[Dict[str, Any]]],
+    errors: Dict[str, str],
+) -> None:
+    if task.cancelled():
+        errors[connector.source_id] = "cancelled"
+        return
+    exc = task.exception()
+    if exc is not None:
+        errors[connector.source_id] = str(exc)
+        logger.error("Connector %s failed: %s", connector.source_id, exc)
+        return
+    res = task.result() or []
+    results[connector.source_id] = res
+    logger.info("Connector %s returned %d", connector.source_id, len(res))
+
+
+def _fetch_key(connector: Connector, intent: SearchIntent, limit: int, offset: int) -> Tuple[Any, ...]:
+    # Keyed by the provider query, not the intent: intents that differ only in
+    # fields a source ignores share its fetch.
+    return (connector.source_id, connector.query_key(intent), offset, limit)
+
+
+async def _fetch_uncached(
+    connector: Connector, intent: SearchIntent, key: Tuple[Any, ...], limit: int, offset: int
+) -> List[Dict[str, Any]]:
+    res = await _timed_search(connector, intent, limit, offset=offset)
+    if res:  # an empty page may be a swallowed upstream error; don't pin it
+        search_fetch_cache.set(key, res)
+    return res
 
-    tasks = [c.search(intent, per_source) for c in connectors]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
 
+async def _fetch(
+    connector: Connector, intent: SearchIntent, limit: int, offset: int = 0
+) -> List[Dict[str, Any]]:
+    """One connector call through the fetch cache (stage 1). Records are
+    cached as fetched; later stages work on copies. A call already in flight
+    for the same provider query (e.g. a speculative one) is joined."""
+    key = _fetch_key(connector, intent, limit, offset)
+    hit = await _fresh(search_fetch_cache, key)
+    if hit is not None:
+        return hit
+    return await fetch_flight.do(key, lambda: _fetch_uncached(connector, intent, key, limit, offset))
+
+
+async def _build_pool(
+    connectors: List[Connector],
+    results: Dict[str, List[Dict[str, Any]]],
+    errors: Dict[str, str],
+    cut_off: List[str],
+    per_source: int,
+) -> Dict[str, Any]:
+    """Merge and enrich the connector results that have arrived (stage 2).
+
+    ``per_source`` is what each connector was asked for: a source that
+    returned less has nothing deeper to give (see ``_grow_pool``). A source
+    that failed is not exhausted; deepening asks it again from the start.
+    """
+    # Pool in connector order (not arrival order): the first record seen for a
+    # work becomes the dedupe primary, so the richest sources must come first.
+    # Copies, because ``merge_into`` mutates the primary and the fetched
+    # records are cached.
     pool: List[Dict[str, Any]] = []
     sources_used: List[str] = []
-    errors: Dict[str, str] = {}
-    for connector, res in zip(connectors, results):
-        if isinstance(res, Exception):
-            errors[connector.source_id] = str(res)
-            logger.error("Connector %s failed: %s", connector.source_id, res)
-            continue
+    for connector in connectors:
+        res = results.get(connector.source_id)
         if res:
             sources_used.append(connector.source_id)
-            pool.extend(res)
-        logger.info("Connector %s returned %d", connector.source_id, len(res or []))
+            pool.extend(p.copy() for p in res)
+
+    merged = await enrich_citations_s2(dedupe(pool))  # backfill missing citation counts (S2)
+    return {
+        "pool": merged,
+        "sources_used": sources_used,
+        "errors": errors,
+        "cut_off": cut_off,
+        # Lazy deepening state: records taken from each source so far, and
+        # the sources known to have no more.
+        "depth": {c.source_id: len(results.get(c.source_id) or []) for c in connectors},
+        "exhausted": sorted(
+            c.source_id for c in connectors
+            if c.source_id in results and len(results[c.source_id]) < per_source
+        ),
+    }
+
+
+async def _score(intent: SearchIntent, papers: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bool]:
+    """Relevance-order ``papers`` (stage 3): from the cached scores when this
+    exact set of papers was scored for this query under the same reranker
+    setup, otherwise by reranking (and remembering the new scores). Returns
+    ``(ranked, reranked)``.
 
-    merged = _dedupe(pool)
-    merged = await enrich_citations_s2(merged)  # backfill missing citation counts (S2)
-    filtered = _post_filter(merged, intent)
+    Scores are keyed by the whole set because most providers score relative
+    to it (see ``rerank``). Scores from a fallback provider are not cached, so
+    a passing embedding outage doesn't pin them.
+    """
+    query = intent.semantic_text() or intent.canonical_query
+    ids = [dedup_key(p) for p in papers]
+    key = (text_key(query), rerank_setup(), text_key("\n".join(sorted(ids))))
+    known: Optional[Dict[str, Optional[float]]] = await rerank_scores_cache.aget(key)
+    if papers and known is not None:
+        for p, i in zip(papers, ids):
+            if known.get(i) is not None:
+                p["relevance_score"] = known[i]
+        # Papers the reranker left unscored (LLM tail) follow in pool order.
+        ranked = sorted(papers, key=lambda p: p.get("relevance_score", float("-inf")), reverse=True)
+        for i, p in enumerate(ranked):
+            p["relevance_rank"] = i + 1
+        return ranked, True
+
+    ranked, provider = await rerank(query, papers, intent.keyword_terms())
+    if provider == "none" or not any("relevance_score" in p for p in ranked):
+        return ranked, False
+    if provider == primary_provider():
+        rerank_scores_cache.set(key, {dedup_key(p): p.get("relevance_score") for p in ranked})
+    return ranked, True
+
+
+async def _rank(intent: SearchIntent, pool_key: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Filter and order a candidate pool for one intent (stage 4).
+
+    Ranks copies: every sort/filter of the same pool annotates its own
+    records (``relevance_rank``, ``blend_score``).
+    """
+    batch = PaperBatch(entry["pool"]).filter(intent)
+    batch.papers = [p.copy() for p in batch.papers]
 
     reranked = False
     if intent.sort in ("relevance", "hybrid"):
-        ranked = await rerank(intent.semantic_text() or intent.canonical_query, filtered)
-        reranked = any("relevance_score" in p for p in ranked)
+        ranked, reranked = await _score(intent, batch.papers)
         if not reranked:
             # No relevance signal — degrade to impact-first ordering.
-            ranked = _sort_without_rerank(filtered, intent)
+            ranked = _sort_without_rerank(batch, intent)
         elif intent.sort == "hybrid":
             ranked = _blend_relevance_citations(ranked)
     else:
-        ranked = _sort_without_rerank(filtered, intent)
+        ranked = _sort_without_rerank(batch, intent)
+
+    return {**_pool_meta(entry), "ranked": ranked, "reranked": reranked, "pool_key": pool_key}
+
+
+def _pool_meta(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: entry[k] for k in ("sources_used", "errors", "cut_off", "depth", "exhausted")}
+
+
+# Lazy deepening: each wave fetches this multiple of the results still needed,
+# split across sources, but at least _MIN_WAVE records per source.
+_OVERFETCH = 2.0
+_MIN_WAVE = 20
+
+# Background completions of cut-off connectors (strong refs so they aren't GC'd).
+_late_tasks: Set["asyncio.Task[None]"] = set()
+_LATE_CAP_S = 60.0  # give up on a cut-off source after this long
+
+
+async def _complete_late(
+    intent: SearchIntent,
+    pool_key: str,
+    connectors: List[Connector],
+    results: Dict[str, List[Dict[str, Any]]],
+    errors: Dict[str, str],
+    late: Dict["asyncio.Task[List[Dict[str, Any]]]", Connector],
+    per_source: int,
+    on_late: Callable[[Dict[str, Any]], Awaitable[None]],
+) -> None:
+    done, stuck = await asyncio.wait(set(late), timeout=_LATE_CAP_S)
+    results, errors = dict(results), dict(errors)
+    for t in stuck:
+        t.cancel()
+        errors[late[t].source_id] = f"no response within {_LATE_CAP_S:.0f}s"
+    for t in done:
+        _collect(t, late[t], results, errors)
+    landed = {late[t].source_id: results[late[t].source_id] for t in done if results.get(late[t].source_id)}
+    if not landed:
+        return
+    entry = await search_pool_cache.aget(pool_key)
+    if entry is None:
+        entry = await _build_pool(connectors, results, errors, [], per_source)
+    else:
+        entry = await _absorb_late(entry, landed, errors, per_source)
+    search_pool_cache.set(pool_key, entry)
+    fresh = await _rank(intent, pool_key, entry)
+    logger.info("Late sources %s merged into the ranking (%d results)",
+                sorted(late[t].source_id for t in done), len(fresh["ranked"]))
+    await on_late(fresh)
+
+
+async def _absorb_late(
+    entry: Dict[str, Any],
+    landed: Dict[str, List[Dict[str, Any]]],
+    errors: Dict[str, str],
+    per_source: int,
+) -> Dict[str, Any]:
+    """Append the works late sources found to the cached pool (which may have
+    been deepened meanwhile), like ``_grow_pool`` does for a wave."""
+    pool: List[Dict[str, Any]] = entry["pool"]
+    seen = {k for p in pool for k in candidate_keys(p)}
+    fetched = [p.copy() for res in landed.values() for p in res]
+    new = [p for p in dedupe(fetched) if seen.isdisjoint(candidate_keys(p))]
+    exhausted = set(entry["exhausted"]) | {s for s, res in landed.items() if len(res) < per_source}
+    return {
+        **entry,
+        "pool": pool + await enrich_citations_s2(new),
+        "sources_used": list(entry["sources_used"]) + [s for s in landed if s not in entry["sources_used"]],
+        "errors": {**entry["errors"], **errors},
+        "cut_off": [],
+        "depth": {**entry["depth"], **{s: len(res) for s, res in landed.items()}},
+        "exhausted": sorted(exhausted),
+    }
+
+
+async def _merge_late(key: str, fresh: Dict[str, Any]) -> None:
+    """Fold a re-ranking that includes late sources into cached ranking
+    ``key``. The results already served keep their positions; everything after
+    them follows the fresh order."""
+    cached = await search_results_cache.aget(key)
+    if cached is None:
+        search_results_cache.set(key, fresh)
+        return
+    prefix: List[Dict[str, Any]] = cached["ranked"][: await search_served_cache.aget(key) or 0]
+    seen = {k for p in prefix for k in candidate_keys(p)}
+    rest = [p for p in fresh["ranked"] if seen.isdisjoint(candidate_keys(p))]
+    if cached["reranked"] or fresh["reranked"]:
+        for i, p in enumerate(rest):
+            p["relevance_rank"] = len(prefix) + i + 1
+    search_results_cache.set(key, {**fresh, "ranked": prefix + rest})
+    logger.info("Late sources merged behind %d served results of %s", len(prefix), key[:8])
+
+
+def _store_ranking(key: str, fresh: Dict[str, Any]) -> None:
+    """Cache a freshly computed ranking. A run no source returned anything for
+    (all failed or found nothing) only goes to the short-lived negative cache."""
+    if fresh["sources_used"]:
+        search_results_cache.set(key, fresh)
+    else:
+        search_negative_cache.set(key, fresh)
 
-    return {"ranked": ranked, "sources_used": sources_used, "errors": errors, "reranked": reranked}
+
+async def _cached_ranking(key: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+    """``(ranking, stale)`` for ``key``, or a recent empty run (never stale)."""
+    entry = await search_results_cache.aget_entry(key)
+    if entry is None:
+        empty = await search_negative_cache.aget(key)
+        entry = None if empty is None else (empty, False)
+    return entry
+
+
+async def _mark_served(key: str, upto: int) -> None:
+    if upto > (await search_served_cache.aget(key) or 0):
+        search_served_cache.set(key, upto)
+
+
+async def _execute(
+    intent: SearchIntent,
+    sources: Optional[List[str]],
+    candidates_per_source: Optional[int],
+    on_partial: Optional[Callable[[Dict[str, Any]], None]] = None,
+    on_late: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    partial_head: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run the full pipeline once, returning the complete ranked list + meta.
+
+    A fresh cached pool that can serve the intent (see ``_choose_pool``)
+    skips straight to ranking. Otherwise each connector
+    gets a soft deadline (``SEARCH_SOURCE_DEADLINE[S]``, capped by
+    ``SEARCH_BUDGET_S``). Once at least one source has returned records,
+    sources past their deadline are cut off: the ranking goes ahead without
+    them and lists them under ``cut_off``. They keep running, and if
+    ``on_late`` is given it receives the re-ranked result once they land
+    (otherwise they are cancelled).
+
+    ``on_partial`` (streaming) receives a provisional ranking each time a
+    connector lands, before enrichment and rerank; only its first
+    ``partial_head`` results are guaranteed to be in order."""
+    pool_key, entry = await _choose_pool(intent, sources)
+    if entry is not None:
+        return await _rank(intent, pool_key, entry)
+
+    connectors = _select_connectors(sources)
+    per_source = candidates_per_source or SEARCH_CANDIDATES_PER_SOURCE
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    tasks = {
+        asyncio.ensure_future(_fetch(c, intent, per_source)): c for c in connectors
+    }
+    deadlines = {t: started + _deadline_for(c.source_id) for t, c in tasks.items()}
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    errors: Dict[str, str] = {}
+    pending = set(tasks)
+    late: Set["asyncio.Task[List[Dict[str, Any]]]"] = set()
+    try:
+        while True:
+            now = loop.time()
+            # Never cut off into an empty result: with nothing in hand, keep
+            # waiting for the first source to deliver.
+            if any(results.values()):
+                overdue = {t for t in pending if deadlines[t] <= now}
+                pending -= overdue
+                late |= overdue
+            if not pending:
+                break
+            upcoming = [deadlines[t] - now for t in pending if deadlines[t] > now]
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=min(upcoming) if upcoming else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for t in done:
+                _collect(t, tasks[t], results, errors)
+            if on_partial is not None and done and pending:
+                on_partial({
+                    "ranked": _provisional(intent, connectors, results, partial_head),
+                    "sources_used": [c.source_id for c in connectors if results.get(c.source_id)],
+                    "sources_pending": [tasks[t].source_id for t in pending],
+                    "errors": dict(errors),
+                    "reranked": False,
+                })
+    except BaseException:
+        for t in pending | late:
+            t.cancel()
+        raise
+
+    cut_off = [c.source_id for t, c in tasks.items() if t in late]
+    if cut_off:
+        logger.warning("Sources %s missed their deadline after %.1fs; ranking without them",
+                       cut_off, loop.time() - started)
+        if on_late is None:
+            for t in late:
+                t.cancel()
+        else:
+            bg = asyncio.ensure_future(_complete_late(
+                intent, pool_key, connectors, results, errors, {t: tasks[t] for t in late}, per_source, on_late,
+            ))
+            _late_tasks.add(bg)
+            bg.add_done_callback(_late_done)
+
+    entry = await _build_pool(connectors, results, errors, cut_off, per_source)
+    if entry["sources_used"]:  # an empty pool is a failure or a miss; don't pin it
+        search_pool_cache.set(pool_key, entry)
+    return await _rank(intent, pool_key, entry)
+
+
+def _late_done(task: "asyncio.Task[None]") -> None:
+    _late_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Merging late sources failed: %s", task.exception())
+
+
+def _first_wave(
+    sources: Optional[List[str]], offset: int, limit: int, candidates_per_source: Optional[int]
+) -> int:
+    """Per-source size of the first fetch: just enough for the requested page
+    (later pages deepen the pool on demand), never more than
+    ``SEARCH_CANDIDATES_PER_SOURCE``. An explicit ``candidates_per_source``
+    is honored as-is."""
+    if candidates_per_source:
+        return candidates_per_source
+    n = len(_select_connectors(sources))
+    return min(SEARCH_CANDIDATES_PER_SOURCE, _wave_size(offset + limit, n))
+
+
+def _deepenable(entry: Dict[str, Any]) -> Set[str]:
+    """Sources a deeper wave can ask: not exhausted, and not cut off (those
+    are still being fetched and merge in when they land)."""
+    depth = entry.get("depth") or {}
+    return set(depth) - set(entry.get("exhausted") or ()) - set(entry.get("cut_off") or ())
+
+
+def _can_deepen(cached: Dict[str, Any]) -> bool:
+    return bool(_deepenable(cached))
+
+
+def _order_tail(intent: SearchIntent, tail: List[Dict[str, Any]], reranked: bool, start: int) -> List[Dict[str, Any]]:
+    if reranked and intent.sort == "relevance":
+        batch = PaperBatch(tail)
+        tail = batch.ordered(batch.relevance_order())
+    elif reranked and intent.sort == "hybrid":
+        tail = _blend_relevance_citations(tail)
+    else:
+        return _sort_without_rerank(PaperBatch(tail), intent)
+    for i, p in enumerate(tail):
+        p["relevance_rank"] = start + i + 1
+    return tail
+
+
+async def _grow_pool(
+    pool_key: str, intent: SearchIntent, sources: Optional[List[str]], entry: Dict[str, Any], limit: int
+) -> Dict[str, Any]:
+    """Append one wave from every source that has more to a cached pool.
+
+    Fetches the next records of each source (``offset`` = what was already
+    taken) and enriches only the works the pool doesn't hold yet. The pool
+    only ever grows at the end, so rankings built from it stay valid.
+    """
+    depth: Dict[str, int] = dict(entry["depth"])
+    exhausted = set(entry["exhausted"])
+    deepenable = _deepenable(entry)
+    connectors = [c for c in _select_connectors(sources) if c.source_id in deepenable]
+    wave = _wave_size(limit, len(connectors))
+    tasks = {
+        asyncio.ensure_future(_fetch(c, intent, wave, offset=depth[c.source_id])): c
+        for c in connectors
+    }
+    done, late = await asyncio.wait(set(tasks), timeout=SEARCH_BUDGET_S)
+    for t in late:
+        t.cancel()  # retried by the next deepening; no late merging here
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    errors: Dict[str, str] = {}
+    for t in done:
+        _collect(t, tasks[t], results, errors)
+
+    fetched: List[Dict[str, Any]] = []
+    for c in connectors:
+        res = results.get(c.source_id)
+        if res is None:
+            continue
+        depth[c.source_id] += len(res)
+        if len(res) < wave:
+            exhausted.add(c.source_id)
+        fetched.extend(p.copy() for p in res)
+
+    pool: List[Dict[str, Any]] = entry["pool"]
+    seen = {k for p in pool for k in candidate_keys(p)}
+    new = [p for p in dedupe(fetched) if seen.isdisjoint(candidate_keys(p))]
+    grown = {
+        **entry,
+        "pool": pool + await enrich_citations_s2(new),
+        "depth": depth,
+        "exhausted": sorted(exhausted),
+    }
+    search_pool_cache.set(pool_key, grown)
+    return grown
+
+
+async def _deepen(
+    key: str, intent: SearchIntent, sources: Optional[List[str]], limit: int, stable: int
+) -> Optional[Dict[str, Any]]:
+    """Grow a cached ranking with works from the pool it hasn't ranked yet.
+
+    The pool may already hold them (another sort or filter of the same search
+    deepened it); if not, it grows by one wave first (``_grow_pool``). The
+    first ``stable`` results (pages already served) keep their positions;
+    everything after is re-ordered together with the new records. For a
+    relevance ranking that tail is re-scored in one call with the new
+    records: BM25, LLM and cascade scores are relative to the set they were
+    computed on, so scores from separate calls are not comparable.
+    """
+    cached = await search_results_cache.aget(key)
+    if cached is None or not _can_deepen(cached):
+        return cached
+    pool_key: str = cached["pool_key"]
+    # An evicted pool restarts empty at the ranking's depth.
+    entry = await search_pool_cache.aget(pool_key) or {**_pool_meta(cached), "pool": []}
+
+    ranked: List[Dict[str, Any]] = cached["ranked"]
+    seen = {k for p in ranked for k in candidate_keys(p)}
+
+    def unranked(e: Dict[str, Any]) -> List[Dict[str, Any]]:
+        fresh = [p for p in e["pool"] if seen.isdisjoint(candidate_keys(p))]
+        return PaperBatch(fresh).filter(intent).papers
+
+    new = unranked(entry)
+    if len(new) < limit and _can_deepen(entry):
+        entry = await search_flight.do(
+            ("grow", pool_key), lambda: _grow_pool(pool_key, intent, sources, entry, limit)
+        )
+        new = unranked(entry)
+    stable = min(stable, len(ranked))
+    tail = [p.copy() for p in ranked[stable:] + new]
+    reranked = cached["reranked"]
+    if new and reranked:
+        tail, reranked = await _score(intent, tail)
+    tail = _order_tail(intent, tail, reranked, stable)
+    grown = {**cached, **_pool_meta(entry), "ranked": ranked[:stable] + tail}
+    search_results_cache.set(key, grown)
+    logger.info("Deepened %s by %d new results (pool %d, exhausted %s)",
+                key[:8], len(new), len(grown["ranked"]), grown["exhausted"])
+    return grown
 
 
 async def run_search(
@@ -192,14 +699,135 @@ async def run_search(
     sources: Optional[List[str]] = None,
     candidates_per_source: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Paginated search. The full ranked list is computed once and cached, so
-    subsequent pages ("load more") slice a stable ranking without re-fetching."""
+    """Paginated search. The ranked list is computed once and cached, so
+    subsequent pages ("load more") slice a stable ranking without re-fetching.
+
+    The first fetch is sized to the requested page; as paging nears the end of
+    the cached pool, the next wave is fetched from each source and merged in
+    behind the pages already served (``_deepen``) — in the background one page
+    ahead, or inline if the requested page itself would come up short.
+    Sources cut off by their deadline are reported in ``sources_cut_off`` and
+    folded into the cached ranking when they land, behind the results served
+    by then (``_merge_late``). Concurrent identical misses
+    share one pipeline run (single-flight), and a ranking past its soft TTL is
+    served as-is while it refreshes in the background (stale-while-revalidate),
+    as deep as paging had taken it.
+    """
     key = _intent_signature(intent, sources)
-    cached = search_results_cache.get(key)
-    if cached is None:
-        cached = await _execute(intent, sources, candidates_per_source)
-        search_results_cache.set(key, cached)
+    per_source = _first_wave(sources, offset, limit, candidates_per_source)
+
+    async def _compute(wave: int = per_source) -> Dict[str, Any]:
+        # Late sources land behind the pages served by then (``_merge_late``).
+        fresh = await _execute(intent, sources, wave, on_late=partial(_merge_late, key))
+        _store_ranking(key, fresh)
+        await _mark_served(key, offset + limit)
+        return fresh
+
+    async def _refresh(depth: int) -> None:
+        try:
+            await _compute(depth)
+        except Exception as e:  # noqa: BLE001 - nobody awaits a background refresh
+            logger.warning("Background refresh of %s failed: %s", key[:8], e)
+
+    async def _prefetch() -> None:
+        try:
+            await _deepen(key, intent, sources, limit, offset + limit)
+        except Exception as e:  # noqa: BLE001 - nobody awaits a background prefetch
+            logger.warning("Background deepening of %s failed: %s", key[:8], e)
+
+    entry = await _cached_ranking(key)
+    if entry is None:
+        cached = await search_flight.do(key, _compute)
+    else:
+        cached, stale = entry
+        if stale and not search_flight.running(key):
+            logger.info("Serving stale ranking for %s; refreshing in background", key[:8])
+            # Refetch as deep as paging took the stale ranking, so the pages
+            # served from it stay in the refreshed one.
+            depth = max([per_source, *(cached.get("depth") or {}).values()])
+            search_flight.launch([key], _refresh(depth))
+    # Before anything else can run: a late merge must already see this page as
+    # served. The worker running the merge holds the mark in L1 (its
+    # ``_compute`` set it), so this returns without suspending there.
+    await _mark_served(key, offset + limit)
+
+    pool = len(cached["ranked"])
+    deepen_key = ("deepen", key)
+    if offset + 2 * limit > pool and _can_deepen(cached):
+        if offset + limit > pool:
+            grown = await search_flight.do(
+                deepen_key, lambda: _deepen(key, intent, sources, limit, offset)
+            )
+            cached = grown or cached
+        elif not search_flight.running(deepen_key):
+            search_flight.launch([deepen_key], _prefetch())
+
+    return _page(cached, intent, offset, limit)
+
+
+async def _speculate(
+    connectors: List[Connector], guess: SearchIntent, limit: int
+) -> Dict[str, Tuple[Any, ...]]:
+    """Start first-wave fetches for a provisional intent; returns their fetch
+    keys by source. Sources whose page is already cached or in flight are
+    skipped. The fetches run as ``fetch_flight`` tasks, owned by the flight
+    table rather than the caller."""
+    keys = [_fetch_key(c, guess, limit, 0) for c in connectors]
+    cached = await search_fetch_cache.aget_many(keys)
+    started = {}
+    for c, key, hit in zip(connectors, keys, cached):
+        if hit is not None or fetch_flight.running(key):
+            continue
+        fetch_flight.launch([key], _fetch_uncached(c, guess, key, limit, 0))
+        started[c.source_id] = key
+    return started
 
+
+async def run_nl_search(
+    natural_language: str,
+    *,
+    limit: int = 100,
+    offset: int = 0,
+    sources: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """``run_search`` from natural language, with retrieval overlapping intent
+    extraction.
+
+    While ``extract_intent`` runs, each source already fetches the first wave
+    for a provisional intent (``provisional_intent``: the raw text as a topic
+    search). Once the real intent arrives, ``run_search`` proceeds as usual:
+    a source whose provider query came out the same joins its speculative
+    fetch (in flight or cached, see ``_fetch``), and the rest refetch. A
+    discarded speculative call is left to finish into the fetch cache, never
+    cancelled: it is a shared ``fetch_flight`` task that other requests may
+    have joined. For plain topic queries every fetch is reused and latency
+    approaches max(intent, retrieval) rather than their sum.
+    """
+    connectors = _select_connectors(sources)
+    speculative: Dict[str, Tuple[Any, ...]] = {}
+    if offset == 0:
+        guess = provisional_intent(natural_language)
+        speculative = await _speculate(connectors, guess, _first_wave(sources, offset, limit, None))
+    intent = await extract_intent(natural_language)
+
+    if speculative:
+        per_source = _first_wave(sources, offset, limit, None)
+        reused = []
+        for c in connectors:
+            if c.source_id not in speculative:
+                continue
+            if _fetch_key(c, intent, per_source, 0) == speculative[c.source_id]:
+                reused.append(c.source_id)
+                SPECULATIVE_FETCHES.inc(source=c.source_id, outcome="reused")
+            else:
+                SPECULATIVE_FETCHES.inc(source=c.source_id, outcome="discarded")
+        logger.info("Speculative fetches for %r: reused %s of %s",
+                    intent.canonical_query[:80], reused, sorted(speculative))
+
+    return await run_search(intent, limit=limit, offset=offset, sources=sources)
+
+
+def _page(cached: Dict[str, Any], intent: SearchIntent, offset: int, limit: int) -> Dict[str, Any]:
     ranked: List[Dict[str, Any]] = cached["ranked"]
     page = ranked[offset : offset + limit]
     return {
@@ -208,9 +836,68 @@ async def run_search(
         "returned": len(page),
         "offset": offset,
         "limit": limit,
-        "has_more": (offset + limit) < len(ranked),
+        "has_more": (offset + limit) < len(ranked) or _can_deepen(cached),
         "sources_used": cached["sources_used"],
         "errors": cached["errors"],
         "reranked": cached["reranked"],
+        "sources_cut_off": cached.get("cut_off", []),
         "intent": intent.model_dump(),
     }
+
+
+async def stream_search(
+    intent: SearchIntent,
+    *,
+    limit: int = 100,
+    offset: int = 0,
+    sources: Optional[List[str]] = None,
+    candidates_per_source: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Streaming ``run_search``: yields ``{"event": "partial", ...}`` pages as
+    connectors land, then one ``{"event": "final", ...}`` page after rerank.
+
+    Cached (or already in-flight) searches yield just the final event. The
+    pipeline runs as a single-flight task, so a client disconnecting mid-stream
+    doesn't waste the work: the ranking still lands in the cache, and identical
+    plain searches started meanwhile join it instead of starting their own.
+    """
+    key = _intent_signature(intent, sources)
+    if await _cached_ranking(key) is not None or search_flight.running(key):
+        result = await run_search(
+            intent, limit=limit, offset=offset, sources=sources,
+            candidates_per_source=candidates_per_source,
+        )
+        yield {"event": "final", **result}
+        return
+
+    partials: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+    async def _compute() -> Dict[str, Any]:
+        fresh = await _execute(
+            intent, sources, _first_wave(sources, offset, limit, candidates_per_source),
+            on_partial=partials.put_nowait, on_late=partial(_merge_late, key), partial_head=offset + limit,
+        )
+        _store_ranking(key, fresh)
+        await _mark_served(key, offset + limit)
+        return fresh
+
+    task = search_flight.launch([key], _compute())
+    nxt: Optional["asyncio.Future[Dict[str, Any]]"] = None
+    try:
+        while True:
+            nxt = asyncio.ensure_future(partials.get())
+            await asyncio.wait({nxt, task}, return_when=asyncio.FIRST_COMPLETED)
+            if not nxt.done():
+                break
+            snapshot = nxt.result()
+            yield {
+                "event": "partial",
+                **_page(snapshot, intent, offset, limit),
+                "sources_pending": snapshot["sources_pending"],
+            }
+    finally:
+        if nxt is not None and not nxt.done():
+            nxt.cancel()
+
+    final = await asyncio.shield(task)
+    yield {"event": "final", **_page(final, intent, offset, limit)}
@@ -4,33 +4,54 @@ After multi-source retrieval the candidate pool is relevance-mixed, so we
 re-score every paper by relevance to the user's intent. This is what fixes
 "results not even related to my query".
 
-Two backends, selected by ``RERANK_PROVIDER``:
-- embeddings (Google ``gemini-embedding`` ) — cheapest/fastest;
-- an Anthropic LLM listwise rerank — works without Google billing.
-In "auto" mode we try embeddings and fall back to the LLM. Reranking is always
-best-effort: on total failure papers are returned unchanged.
+Three backends, selected by ``RERANK_PROVIDER``:
+- embeddings (Google ``gemini-embedding`` ) — best quality per cost;
+- an Anthropic LLM listwise rerank — works without Google billing;
+- BM25 over title + abstract — local, milliseconds, no network.
+In "auto" mode we try embeddings and fall back to ``RERANK_FALLBACK`` (BM25
+by default). Reranking is always best-effort: on total failure papers are
+returned unchanged.
+
+Embedding (and single-prompt LLM) reranks run as a cascade: BM25 on the
+intent's keyword terms orders the whole pool, and only its top
+``RERANK_TOP_K`` go to the expensive backend; the tail keeps its BM25 order
+below them. The windowed LLM rerank sees the whole pool.
 """
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from app.config import (
     ANTHROPIC_API_KEY,
     ANTHROPIC_MODEL,
+    EMBED_BATCH_WINDOW_MS,
+    EMBED_CONCURRENCY,
     EMBEDDING_MODEL,
     GOOGLE_API_KEY,
+    LLM_RERANK_CONCURRENCY,
+    LLM_RERANK_MODE,
+    LLM_RERANK_WINDOW,
+    RERANK_FALLBACK,
     RERANK_PROVIDER,
+    RERANK_TOP_K,
 )
-from app.services.cache import embedding_cache, text_key
+from app.services.cache import embedding_cache, embedding_flight, text_key
+from app.services.embedding_codec import encode, unit_matrix
+from app.services.embedding_store import embedding_store
+from app.services.metrics import EMBED_BATCH_SIZE, RERANK_SECONDS
 
 logger = logging.getLogger(__name__)
 
 _BATCH = 64
 _MAX_CHARS = 2000
-_LLM_CAP = 150  # max papers sent to the LLM reranker (token budget)
+_LLM_CAP = 150  # max papers sent to the LLM reranker in "single" mode (token budget)
+_RRF_K = 60  # reciprocal-rank fusion constant
 
 
 def _doc_text(p: Dict[str, Any], limit: int = _MAX_CHARS) -> str:
@@ -51,6 +72,72 @@ def paper_embedding_text(p: Dict[str, Any]) -> str:
 # ---------------------------------------------------------------------------
 # Embedding backend (Google)
 # ---------------------------------------------------------------------------
+class _EmbedScheduler:
+    """Packs embedding misses into API batches and runs them concurrently.
+
+    Misses are queued per task type. Every full batch (``_BATCH`` texts) starts
+    at once; a partial one waits ``window_s`` for misses from concurrent
+    requests to top it up. At most ``concurrency`` batches are in flight, each
+    a blocking SDK call in a worker thread. Callers get one future per text;
+    texts whose futures were cancelled before their batch started are skipped.
+    """
+
+    def __init__(
+        self,
+        embed_sync: Callable[[List[str], str], List[List[float]]],
+        window_s: float,
+        concurrency: int,
+    ) -> None:
+        self._embed_sync = embed_sync
+        self._window = window_s
+        self._slots = asyncio.Semaphore(max(1, concurrency))
+        self._pending: Dict[str, List[Tuple[str, "asyncio.Future[List[float]]"]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._running: Set["asyncio.Task[None]"] = set()
+
+    def submit(self, texts: List[str], task_type: str) -> List["asyncio.Future[List[float]]"]:
+        loop = asyncio.get_running_loop()
+        queue = self._pending.setdefault(task_type, [])
+        futures = [loop.create_future() for _ in texts]
+        queue.extend(zip(texts, futures))
+        while len(queue) >= _BATCH:
+            self._start(task_type, queue[:_BATCH])
+            del queue[:_BATCH]
+        if queue and task_type not in self._timers:
+            self._timers[task_type] = loop.call_later(self._window, self._flush, task_type)
+        return futures
+
+    def _flush(self, task_type: str) -> None:
+        self._timers.pop(task_type, None)
+        queue = self._pending.pop(task_type, [])
+        if queue:
+            self._start(task_type, queue)
+
+    def _start(self, task_type: str, batch: List[Tuple[str, "asyncio.Future[List[float]]"]]) -> None:
+        task = asyncio.ensure_future(self._run(task_type, batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, task_type: str, batch: List[Tuple[str, "asyncio.Future[List[float]]"]]) -> None:
+        async with self._slots:
+            batch = [(t, fut) for t, fut in batch if not fut.cancelled()]
+            if not batch:  # every caller went away while it queued
+                return
+            EMBED_BATCH_SIZE.observe(len(batch))
+            try:
+                vecs = await asyncio.to_thread(self._embed_sync, [t for t, _ in batch], task_type)
+                if len(vecs) != len(batch):
+                    raise RuntimeError(f"embedded {len(vecs)} of {len(batch)} texts")
+            except Exception as e:  # noqa: BLE001 - handed to every waiting caller
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                return
+        for (_, fut), v in zip(batch, vecs):
+            if not fut.done():
+                fut.set_result(v)
+
+
 class _GoogleEmbedder:
     _FALLBACK_MODEL = "gemini-embedding-001"  # known-good if the configured one 404s
 
@@ -59,6 +146,7 @@ class _GoogleEmbedder:
 
         self._client = genai.Client(api_key=GOOGLE_API_KEY)
         self.model = EMBEDDING_MODEL
+        self._scheduler = _EmbedScheduler(self._embed_sync, EMBED_BATCH_WINDOW_MS / 1000, EMBED_CONCURRENCY)
 
     def _embed_sync(self, texts: List[str], task_type: str) -> List[List[float]]:
         from google.genai import types
@@ -83,31 +171,87 @@ class _GoogleEmbedder:
                     last_err = e
         raise last_err if last_err else RuntimeError("embed failed")
 
-    async def embed(self, texts: List[str], task_type: str) -> List[List[float]]:
-        # Serve from the content-addressed cache; only embed the misses.
+    async def embed(self, texts: List[str], task_type: str) -> List[Any]:
+        # Serve from the content-addressed cache, then the on-disk store (whose
+        # hits are zero-copy memmap rows); only embed the misses. A miss that
+        # another request is already embedding is awaited, not re-embedded.
+        # Vectors come back as compact rows (embedding_codec), not lists.
         results: List[Optional[List[float]]] = [None] * len(texts)
-        misses: List[str] = []
-        miss_idx: List[int] = []
-        for i, t in enumerate(texts):
-            cached = embedding_cache.get((self.model, task_type, text_key(t)))
-            if cached is not None:
-                results[i] = cached
+        waiting: List[Tuple[int, Any, "asyncio.Task[Dict[Any, List[float]]]"]] = []
+        own: Dict[Any, str] = {}
+        own_idx: List[Tuple[int, Any]] = []
+        stored = 0
+        missing: List[Tuple[int, Any]] = []
+        keys = [(self.model, task_type, text_key(t)) for t in texts]
+        # One batched shared-cache read for the whole call, off the event loop.
+        for i, (key, cached) in enumerate(zip(keys, await embedding_cache.aget_many(keys))):
+            if cached is None and embedding_store is not None:
+                cached = embedding_store.get(self.model, task_type, key[2])
+                stored += cached is not None
+            if cached is None:
+                missing.append((i, key))
             else:
-                misses.append(t)
-                miss_idx.append(i)
-
-        for start in range(0, len(misses), _BATCH):
-            chunk = misses[start : start + _BATCH]
-            vecs = await asyncio.to_thread(self._embed_sync, chunk, task_type)
-            for j, v in enumerate(vecs):
-                gi = miss_idx[start + j]
-                results[gi] = v
-                embedding_cache.set((self.model, task_type, text_key(chunk[j])), v)
+                results[i] = cached
+        if missing and embedding_store is not None and embedding_store.needs_refresh(self.model, task_type):
+            # Other workers may have stored them since our last look; the
+            # index re-read is file I/O, so it runs off the event loop.
+            if await asyncio.to_thread(embedding_store.refresh, self.model, task_type):
+                still: List[Tuple[int, Any]] = []
+                for i, key in missing:
+                    results[i] = embedding_store.get(self.model, task_type, key[2])
+                    if results[i] is None:
+                        still.append((i, key))
+                stored += len(missing) - len(still)
+                missing = still
+        for i, key in missing:
+            t = texts[i]
+            if key not in own:
+                task = embedding_flight.join(key)
+                if task is not None:
+                    waiting.append((i, key, task))
+                    continue
+                own[key] = t
+            own_idx.append((i, key))
+
+        if own:
+            task = embedding_flight.launch(own, self._embed_misses(dict(own), task_type))
+            waiting.extend((i, key, task) for i, key in own_idx)
+        for i, key, task in waiting:
+            results[i] = (await asyncio.shield(task)).get(key)
 
         if texts:
-            logger.info("Embeddings: %d new, %d cached", len(misses), len(texts) - len(misses))
+            logger.info(
+                "Embeddings: %d new, %d shared in-flight, %d cached (%d from disk)",
+                len(own), len(waiting) - len(own_idx), len(texts) - len(waiting), stored,
+            )
         return [r for r in results if r is not None]
 
+    async def _embed_misses(self, misses: Dict[Any, str], task_type: str) -> Dict[Any, List[float]]:
+        """Embed ``{cache_key: text}`` through the batch scheduler; fills the
+        cache and store. Raises the first batch failure, after keeping the
+        vectors of the batches that succeeded."""
+        keys = list(misses)
+        futures = self._scheduler.submit([misses[k] for k in keys], task_type)
+        vecs = await asyncio.gather(*futures, return_exceptions=True)
+        out: Dict[Any, List[float]] = {}
+        error: Optional[BaseException] = None
+        for key, v in zip(keys, vecs):
+            if isinstance(v, BaseException):
+                error = error or v
+                continue
+            out[key] = encode(v)
+            embedding_cache.set(key, out[key])
+        if out and embedding_store is not None:
+            await asyncio.to_thread(
+                embedding_store.put_many,
+                self.model,
+                task_type,
+                [(key[2], v) for key, v in zip(keys, vecs) if key in out],
+            )
+        if error is not None:
+            raise error
+        return out
+
 
 _embedder: Optional[_GoogleEmbedder] = None
 _embedder_disabled = False  # init or runtime failure -> stop trying for this process
@@ -135,22 +279,17 @@ async def _embedding_rerank(query_text: str, papers: List[Dict[str, Any]]) -> Op
     if embedder is None:
         return None
     try:
-        import numpy as np
-
         q_vecs = await embedder.embed([query_text], "RETRIEVAL_QUERY")
         doc_vecs = await embedder.embed([paper_embedding_text(p) for p in papers], "RETRIEVAL_DOCUMENT")
         if not q_vecs or len(doc_vecs) != len(papers):
             return None
-        q = np.asarray(q_vecs[0], dtype="float32")
-        d = np.asarray(doc_vecs, dtype="float32")
-        q /= np.linalg.norm(q) + 1e-8
-        d /= np.linalg.norm(d, axis=1, keepdims=True) + 1e-8
-        scores = d @ q
-        order = np.argsort(-scores)
+        scores = unit_matrix(doc_vecs) @ unit_matrix(q_vecs)[0]
+        order = np.argsort(-scores, kind="stable")
+        rounded = np.round(scores, 4).tolist()
         ranked: List[Dict[str, Any]] = []
-        for rank, idx in enumerate(order):
-            p = papers[int(idx)]
-            p["relevance_score"] = round(float(scores[int(idx)]), 4)
+        for rank, idx in enumerate(order.tolist()):
+            p = papers[idx]
+            p["relevance_score"] = rounded[idx]
             p["relevance_rank"] = rank + 1
             ranked.append(p)
         logger.info("Embedding rerank: %d papers (top %.3f)", len(ranked), float(scores[order[0]]))
@@ -162,6 +301,64 @@ async def _embedding_rerank(query_text: str, papers: List[Dict[str, Any]]) -> Op
         return None
 
 
+# ---------------------------------------------------------------------------
+# Lexical backend (BM25)
+# ---------------------------------------------------------------------------
+_BM25_K1, _BM25_B = 1.2, 0.75
+_WORD = re.compile(r"[a-z0-9]+")
+_BM25_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is of on or the to with via using "
+    "about paper papers study studies".split()
+)
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def bm25_scores(query_text: str, texts: List[str]) -> Optional[np.ndarray]:
+    """Okapi BM25 score of each text for ``query_text`` (IDF over ``texts``
+    themselves), or None if the query has no usable terms.
+
+    Only query terms are counted: tokens are mapped to query-term columns and
+    term frequencies come from one ``bincount``.
+    """
+    terms = list(dict.fromkeys(w for w in _words(query_text) if w not in _BM25_STOPWORDS))
+    if not terms or not texts:
+        return None
+    col = {t: j for j, t in enumerate(terms)}
+    n, m = len(texts), len(terms)
+    lengths = np.empty(n, dtype=np.float64)
+    hits: List[int] = []
+    for i, text in enumerate(texts):
+        words = _words(text)
+        lengths[i] = len(words)
+        hits.extend(i * m + col[w] for w in words if w in col)
+    tf = np.bincount(np.asarray(hits, dtype=np.int64), minlength=n * m).reshape(n, m).astype(np.float64)
+    df = (tf > 0).sum(axis=0)
+    idf = np.log1p((n - df + 0.5) / (df + 0.5))
+    norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * lengths / max(lengths.mean(), 1.0))
+    return (tf * (_BM25_K1 + 1) / (tf + norm[:, None])) @ idf
+
+
+def _bm25_rerank(query_text: str, papers: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    scores = bm25_scores(query_text, [_doc_text(p) for p in papers])
+    if scores is None:
+        return None
+    top = float(scores.max())
+    # Scaled into [0, 1] like the other providers' scores (cached and blended
+    # alongside them).
+    rounded = np.round(scores / top, 4).tolist() if top > 0 else [0.0] * len(papers)
+    ranked: List[Dict[str, Any]] = []
+    for rank, idx in enumerate(np.argsort(-scores, kind="stable").tolist()):
+        p = papers[idx]
+        p["relevance_score"] = rounded[idx]
+        p["relevance_rank"] = rank + 1
+        ranked.append(p)
+    logger.info("BM25 rerank: %d papers", len(ranked))
+    return ranked
+
+
 # ---------------------------------------------------------------------------
 # LLM backend (Anthropic listwise rerank)
 # ---------------------------------------------------------------------------
@@ -201,17 +398,13 @@ def _get_anthropic():
     return _anthropic
 
 
-async def _llm_rerank(query_text: str, papers: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
-    client = _get_anthropic()
-    if client is None:
-        return None
-
-    head = papers[:_LLM_CAP]
-    tail = papers[_LLM_CAP:]
-    listing = "\n".join(f"[{i}] {_doc_text(p, 280)}" for i, p in enumerate(head))
+async def _llm_order(client: Any, query_text: str, papers: List[Dict[str, Any]]) -> Optional[List[int]]:
+    """One listwise call: indices of ``papers`` most-relevant first (indices
+    the model dropped appended in input order), or None on failure."""
+    listing = "\n".join(f"[{i}] {_doc_text(p, 280)}" for i, p in enumerate(papers))
     prompt = (
         f"Query: {query_text}\n\n"
-        f"Rank these {len(head)} papers by how well they match the query. "
+        f"Rank these {len(papers)} papers by how well they match the query. "
         "Call submit_ranking with every index ordered most-relevant first.\n\n"
         f"{listing}"
     )
@@ -228,45 +421,115 @@ async def _llm_rerank(query_text: str, papers: List[Dict[str, Any]]) -> Optional
 
     try:
         resp = await asyncio.to_thread(_call)
-        ranking = None
-        for block in resp.content:
-            if getattr(block, "type", None) == "tool_use":
-                ranking = block.input.get("ranking")
-                break
-        if not ranking:
-            return None
+    except Exception as e:  # noqa: BLE001
+        logger.warning("LLM rerank failed (%s)", str(e)[:120])
+        return None
+    ranking = None
+    for block in resp.content:
+        if getattr(block, "type", None) == "tool_use":
+            ranking = block.input.get("ranking")
+            break
+    if not ranking:
+        return None
 
-        seen: set = set()
-        ordered_idx: List[int] = []
-        for i in ranking:
-            if isinstance(i, int) and 0 <= i < len(head) and i not in seen:
-                seen.add(i)
-                ordered_idx.append(i)
-        # Append any indices the model dropped, preserving original order.
-        ordered_idx += [i for i in range(len(head)) if i not in seen]
+    seen: set = set()
+    ordered_idx: List[int] = []
+    for i in ranking:
+        if isinstance(i, int) and 0 <= i < len(papers) and i not in seen:
+            seen.add(i)
+            ordered_idx.append(i)
+    # Append any indices the model dropped, preserving original order.
+    return ordered_idx + [i for i in range(len(papers)) if i not in seen]
+
+
+def _windows(n: int, size: int) -> List[Tuple[int, int]]:
+    """Half-overlapping ``[start, end)`` windows covering ``range(n)``."""
+    if n <= size:
+        return [(0, n)]
+    stride = max(1, size // 2)
+    starts = list(range(0, n - size + 1, stride))
+    if starts[-1] + size < n:
+        starts.append(n - size)
+    return [(s, s + size) for s in starts]
+
+
+async def _windowed_order(client: Any, query_text: str, papers: List[Dict[str, Any]]) -> Optional[List[int]]:
+    """Rank overlapping windows concurrently, then rank the windows' winners
+    against each other in one more call.
+
+    Window ranks are only comparable within a window (every window has a
+    first place), so they just pick the finalists: the top
+    ``window / len(windows)`` of each. The final pass orders the finalists;
+    everything else follows by reciprocal-rank fusion, ``1 / (_RRF_K + rank)``
+    summed over the windows that ranked it. If the final pass fails, the
+    finalists keep their fused order. Papers whose windows all failed go
+    last, in input order."""
+    spans = _windows(len(papers), LLM_RERANK_WINDOW)
+    slots = asyncio.Semaphore(LLM_RERANK_CONCURRENCY)
+
+    async def _one(lo: int, hi: int) -> Optional[List[int]]:
+        async with slots:
+            return await _llm_order(client, query_text, papers[lo:hi])
+
+    orders = await asyncio.gather(*(_one(lo, hi) for lo, hi in spans))
+    if not any(orders):
+        return None
+    fused = [0.0] * len(papers)
+    for (lo, _), order in zip(spans, orders):
+        for rank, i in enumerate(order or ()):
+            fused[lo + i] += 1.0 / (_RRF_K + rank + 1)
+    ranked = sorted(range(len(papers)), key=lambda i: -fused[i])
+    failed = sum(o is None for o in orders)
+    logger.info("LLM rerank: %d windows of %d (%d failed)", len(spans), LLM_RERANK_WINDOW, failed)
+    if len(spans) == 1:
+        return ranked
 
-        n = len(ordered_idx)
-        ranked: List[Dict[str, Any]] = []
-        for rank, idx in enumerate(ordered_idx):
-            p = head[idx]
-            p["relevance_rank"] = rank + 1
-            p["relevance_score"] = round(1.0 - rank / max(1, n), 4)  # proxy score
-            ranked.append(p)
-        ranked.extend(tail)
-        logger.info("LLM rerank: ordered %d papers (+%d tail)", n, len(tail))
+    per = max(1, LLM_RERANK_WINDOW // len(spans))
+    finalists = set()
+    for (lo, _), order in zip(spans, orders):
+        finalists.update(lo + i for i in (order or ())[:per])
+    heads = [i for i in ranked if i in finalists]
+    final = await _llm_order(client, query_text, [papers[i] for i in heads])
+    if final is None:
         return ranked
-    except Exception as e:  # noqa: BLE001
-        logger.warning("LLM rerank failed (%s)", str(e)[:120])
+    return [heads[j] for j in final] + [i for i in ranked if i not in finalists]
+
+
+async def _llm_rerank(query_text: str, papers: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    client = _get_anthropic()
+    if client is None:
+        return None
+
+    if LLM_RERANK_MODE == "windowed":
+        head, tail = papers, []
+        ordered_idx = await _windowed_order(client, query_text, head)
+    else:
+        head, tail = papers[:_LLM_CAP], papers[_LLM_CAP:]
+        ordered_idx = await _llm_order(client, query_text, head)
+    if not ordered_idx:
         return None
 
+    n = len(ordered_idx)
+    ranked: List[Dict[str, Any]] = []
+    for rank, idx in enumerate(ordered_idx):
+        p = head[idx]
+        p["relevance_rank"] = rank + 1
+        p["relevance_score"] = round(1.0 - rank / max(1, n), 4)  # proxy score
+        ranked.append(p)
+    ranked.extend(tail)
+    logger.info("LLM rerank: ordered %d papers (+%d tail)", n, len(tail))
+    return ranked
+
 
 # ---------------------------------------------------------------------------
 # Public entry point
 # ---------------------------------------------------------------------------
-async def embed_texts(texts: List[str], task_type: str = "RETRIEVAL_DOCUMENT") -> Optional[List[List[float]]]:
+async def embed_texts(texts: List[str], task_type: str = "RETRIEVAL_DOCUMENT") -> Optional[List[Any]]:
     """Embed arbitrary texts (e.g. for clustering). None if unavailable.
 
     Reuses the same Google embedder + process-level disable latch as reranking.
+    Vectors are in the cache encoding (``EMBEDDING_CACHE_DTYPE``); read them
+    with ``embedding_codec.unit_matrix`` / ``decode``.
     """
     global _embedder_disabled
     if not texts:
@@ -282,22 +545,94 @@ async def embed_texts(texts: List[str], task_type: str = "RETRIEVAL_DOCUMENT") -
         return None
 
 
-async def rerank(query_text: str, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+async def rerank(
+    query_text: str, papers: List[Dict[str, Any]], keywords: Sequence[str] = ()
+) -> Tuple[List[Dict[str, Any]], str]:
     """Reorder papers by relevance to ``query_text`` (adds ``relevance_score``).
-    No-op if reranking is disabled or every backend fails."""
+    ``keywords`` drive the lexical stage (BM25); ``query_text`` is used when
+    empty. Returns ``(ranked, provider)``; provider "none" (papers unchanged)
+    if reranking is disabled or every backend fails.
+
+    Only embedding cosines are absolute: BM25, LLM and cascade-tail scores
+    are relative to ``papers``, so compare scores from one call only.
+    """
+    start = time.perf_counter()
+    ranked, provider = await _rerank(query_text, papers, " ".join(keywords) or query_text)
+    RERANK_SECONDS.observe(time.perf_counter() - start, provider=provider)
+    return ranked, provider
+
+
+def rerank_setup() -> str:
+    """What scores depend on besides the query and the papers: the backend
+    chain, cascade size and LLM windowing (part of the score cache key)."""
+    return f"{RERANK_PROVIDER}>{RERANK_FALLBACK}|top{RERANK_TOP_K}|{LLM_RERANK_MODE}{LLM_RERANK_WINDOW}"
+
+
+def primary_provider() -> str:
+    """The backend ``rerank`` tries first; any other provider in its result
+    means it fell back."""
+    return "google" if RERANK_PROVIDER == "auto" else RERANK_PROVIDER
+
+
+async def _cascade(
+    backend: Callable[[str, List[Dict[str, Any]]], Awaitable[Optional[List[Dict[str, Any]]]]],
+    query_text: str,
+    lexical: str,
+    papers: List[Dict[str, Any]],
+) -> Optional[List[Dict[str, Any]]]:
+    """Run ``backend`` on the BM25 top ``RERANK_TOP_K`` of ``papers`` only.
+
+    The tail follows in BM25 order, scored by rank below the lowest head
+    score (one step per rank, a step being the head's mean spacing), so score
+    sorts and the hybrid blend keep it under the reranked head whatever the
+    sign of the backend's scores.
+    """
+    k = RERANK_TOP_K
+    scores = bm25_scores(lexical, [_doc_text(p) for p in papers]) if 0 < k < len(papers) else None
+    if scores is None:
+        return await backend(query_text, papers)
+    order = np.argsort(-scores, kind="stable").tolist()
+    ranked = await backend(query_text, [papers[i] for i in order[:k]])
+    if ranked is None:
+        return None
+    head = [p["relevance_score"] for p in ranked if p.get("relevance_score") is not None]
+    floor, top = (min(head), max(head)) if head else (0.0, 0.0)
+    step = max((top - floor) / len(ranked), 1e-4)
+    for j, i in enumerate(order[k:]):
+        p = papers[i]
+        p["relevance_score"] = round(floor - (j + 1) * step, 4)
+        p["relevance_rank"] = len(ranked) + 1
+        ranked.append(p)
+    logger.info("Cascade rerank: %d of %d papers sent to %s", k, len(papers), backend.__name__)
+    return ranked
+
+
+async def _rerank(
+    query_text: str, papers: List[Dict[str, Any]], lexical: str
+) -> Tuple[List[Dict[str, Any]], str]:
     if not query_text or len(papers) <= 1 or RERANK_PROVIDER == "none":
-        return papers
+        return papers, "none"
 
     if RERANK_PROVIDER in ("auto", "google"):
-        ranked = await _embedding_rerank(query_text, papers)
+        ranked = await _cascade(_embedding_rerank, query_text, lexical, papers)
         if ranked is not None:
-            return ranked
+            return ranked, "google"
         if RERANK_PROVIDER == "google":
-            return papers
-
-    if RERANK_PROVIDER in ("auto", "anthropic"):
-        ranked = await _llm_rerank(query_text, papers)
+            return papers, "none"
+
+    fallback = RERANK_FALLBACK if RERANK_PROVIDER == "auto" else RERANK_PROVIDER
+    if fallback == "anthropic":
+        # Windowed LLM rerank already covers any pool size at the latency of
+        # one window; a BM25 prefilter would only hide candidates from it.
+        if LLM_RERANK_MODE == "windowed":
+            ranked = await _llm_rerank(query_text, papers)
+        else:
+            ranked = await _cascade(_llm_rerank, query_text, lexical, papers)
+        if ranked is not None:
+            return ranked, "anthropic"
+    elif fallback == "bm25":
+        ranked = _bm25_rerank(lexical, papers)
         if ranked is not None:
-            return ranked
+            return ranked, "bm25"
 
-    return papers
+    return papers, "none"
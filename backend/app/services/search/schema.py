@@ -7,8 +7,12 @@ provider query, so adding/removing a source never changes the contract.
 from __future__ import annotations
 
 import re
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -194,6 +198,177 @@ def _year_of(date_str: Optional[str]) -> Optional[int]:
 # Normalized paper record
 # ---------------------------------------------------------------------------
 
+# Fields every record has (make_paper sets them all), then annotations the
+# pipeline adds to most records. Anything else lives in a per-record dict.
+_FIELDS: Tuple[str, ...] = (
+    "id", "paperId", "doi", "arxiv_id", "title", "abstract", "year", "published",
+    "citationCount", "referenceCount", "venue", "categories", "concepts",
+    "source", "source_name", "url", "pdf_url", "abs_url", "isOpenAccess",
+    "sources", "relevance_score", "relevance_rank", "blend_score",
+)
+_SLOTS = frozenset(_FIELDS)
+_INTERNED = frozenset(("source", "source_name", "venue"))  # few distinct values
+_SHARED = frozenset(("categories", "concepts", "sources"))  # stored as shared tuples
+
+# Category/concept/source tuples recur across records (arXiv codes, OpenAlex
+# concepts), so equal tuples are stored once. Bounded LRU: the least recently
+# used tuple goes when it fills up (records keep theirs either way).
+_shared_tuples: "OrderedDict[Tuple[str, ...], Tuple[str, ...]]" = OrderedDict()
+_shared_lock = threading.Lock()  # connectors build records in worker threads too
+_SHARED_TUPLES_MAX = 50_000
+
+
+def _shared(values: Any) -> Tuple[str, ...]:
+    t = tuple(sys.intern(v) if isinstance(v, str) else v for v in values or ())
+    with _shared_lock:
+        hit = _shared_tuples.get(t)
+        if hit is not None:
+            _shared_tuples.move_to_end(t)
+            return hit
+        _shared_tuples[t] = t
+        while len(_shared_tuples) > _SHARED_TUPLES_MAX:
+            _shared_tuples.popitem(last=False)
+    return t
+
+
+class PaperRecord(MutableMapping):
+    """Compact paper record with the same mapping interface as the dict
+    ``make_paper`` used to return.
+
+    Known fields are slots instead of dict entries; source names and venues
+    are interned; ``categories`` / ``concepts`` / ``sources`` are shared
+    tuples (read back as tuples); authors are kept as a tuple of names until
+    first read, then unpacked into the public ``[{"name": ...}]`` list (kept,
+    so changes to it stick as they would in a dict). A cached ranking holds
+    hundreds of these per search, so this is most of its footprint.
+
+    ``to_dict()`` gives the JSON shape; routes call it (via
+    ``export_papers``) before returning or storing records, which also keeps
+    the cached originals from being mutated downstream.
+    """
+
+    __slots__ = _FIELDS + ("_authors", "_extra")
+
+    def __init__(self, fields: Optional[Dict[str, Any]] = None) -> None:
+        self._authors: Any = ()
+        self._extra: Optional[Dict[str, Any]] = None
+        if fields:
+            for k, v in fields.items():
+                self[k] = v
+
+    # --- mapping protocol ---------------------------------------------------
+    def __getitem__(self, key: str) -> Any:
+        if key in _SLOTS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if key == "authors":
+            return self._author_list()
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:  # hot path: skip KeyError
+        if key in _SLOTS:
+            return getattr(self, key, default)
+        if key == "authors":
+            return self._author_list()
+        return default if self._extra is None else self._extra.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _SLOTS:
+            return hasattr(self, key)  # type: ignore[arg-type]
+        return key == "authors" or (self._extra is not None and key in self._extra)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _SLOTS:
+            if key in _INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            elif key in _SHARED and isinstance(value, (list, tuple)):
+                value = _shared(value)
+            object.__setattr__(self, key, value)
+        elif key == "authors":
+            names = [
+                a.get("name") if isinstance(a, dict) and len(a) == 1 else None for a in value or ()
+            ]
+            # Only the plain {"name": ...} shape packs into names; keep anything
+            # else as given.
+            packed = all(isinstance(n, str) for n in names)
+            self._authors = tuple(names) if packed else list(value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _SLOTS:
+            try:
+                object.__delattr__(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif key == "authors":
+            raise KeyError(key)  # always present
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for k in _FIELDS:
+            if hasattr(self, k):
+                yield k
+        yield "authors"
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def _author_list(self) -> List[Dict[str, Any]]:
+        if isinstance(self._authors, tuple):
+            self._authors = [{"name": n} for n in self._authors]
+        return self._authors
+
+    # --- conversions ----------------------------------------------------------
+    def copy(self) -> "PaperRecord":
+        """Shallow copy (like ``dict.copy``); shared tuples stay shared."""
+        out = PaperRecord()
+        for k in _FIELDS:
+            if hasattr(self, k):
+                object.__setattr__(out, k, getattr(self, k))
+        out._authors = self._authors
+        out._extra = dict(self._extra) if self._extra else None
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict; its ``authors`` and shared-tuple lists are new, so
+        changing them leaves this record alone (and a packed record packed)."""
+        out = {k: getattr(self, k) for k in _FIELDS if hasattr(self, k)}
+        a = self._authors
+        out["authors"] = (
+            [{"name": n} for n in a] if isinstance(a, tuple)
+            else [dict(x) if isinstance(x, dict) else x for x in a]
+        )
+        if self._extra:
+            out.update(self._extra)
+        for k in _SHARED:
+            if isinstance(out.get(k), tuple):
+                out[k] = list(out[k])
+        return out
+
+    def __reduce__(self) -> Any:  # pickled by the L2 cache backends
+        return (PaperRecord, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"PaperRecord({self.to_dict()!r})"
+
+
+def export_papers(papers: List[Any]) -> List[Dict[str, Any]]:
+    """Plain-dict copies of records, in the JSON shape the frontend expects."""
+    return [p.to_dict() if isinstance(p, PaperRecord) else dict(p) for p in papers]
+
+
 def make_paper(
     *,
     source: str,
@@ -215,15 +390,15 @@ def make_paper(
     abs_url: str = "",
     is_open_access: bool = False,
     extra: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
-    """Build a paper dict with the shape the frontend + downstream expect.
+) -> PaperRecord:
+    """Build a paper record with the shape the frontend + downstream expect.
 
     Authors are normalized to ``[{"name": ...}]`` (PaperCard, the citation
     analyzer and trends all accept this shape).
     """
     doi = _clean_doi(doi)
     canonical = doi or (f"arxiv:{arxiv_id}" if arxiv_id else None) or paper_id or url
-    paper: Dict[str, Any] = {
+    paper = PaperRecord({
         "id": canonical or title[:60],
         "paperId": paper_id,
         "doi": doi,
@@ -244,7 +419,7 @@ def make_paper(
         "pdf_url": pdf_url,
         "abs_url": abs_url,
         "isOpenAccess": is_open_access,
-    }
+    })
     if extra:
         paper.update(extra)
     return paper
@@ -0,0 +1,102 @@
+"""Benchmark embedding-cache encodings: memory per vector vs. ranking fidelity.
+
+For each encoding (list[float], float32, float16, int8) prints the cached size
+per vector and for a full 8000-entry cache, plus — against float32 — the mean
+Spearman rank correlation of query/document cosine scores, the top-10 overlap,
+and how often k-means (the trend clustering) assigns the same clusters.
+
+Runs on synthetic topic-clustered 3072-dim vectors by default; pass
+``--vectors file.npy`` (an ``(n, dim)`` array, e.g. dumped from the embedding
+store) to measure real embeddings. Makes no API calls.
+
+    cd backend && python scripts/bench_quantization.py [--vectors X.npy]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+# app.config insists on API keys at import; the benchmark never calls them.
+os.environ.setdefault("ANTHROPIC_API_KEY", "unused")
+os.environ.setdefault("GOOGLE_API_KEY", "unused")
+
+from app.services.cache import estimate_size  # noqa: E402
+from app.services.clustering import _kmeans  # noqa: E402
+from app.services.embedding_codec import encode, unit_matrix  # noqa: E402
+
+_CACHE_ENTRIES = 8000
+
+
+def _synthetic(n_docs: int, n_queries: int, dim: int, topics: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((topics, dim)).astype(np.float32)
+    docs = centers[rng.integers(topics, size=n_docs)] + 1.5 * rng.standard_normal((n_docs, dim))
+    queries = centers[rng.integers(topics, size=n_queries)] + 1.5 * rng.standard_normal((n_queries, dim))
+    # Gemini vectors are small per component (unit norm); match that scale.
+    docs /= np.linalg.norm(docs, axis=1, keepdims=True)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    return docs.astype(np.float32), queries.astype(np.float32)
+
+
+def _ranks(x: np.ndarray) -> np.ndarray:
+    r = np.empty(len(x))
+    r[np.argsort(x, kind="stable")] = np.arange(len(x))
+    return r
+
+
+def _spearman(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.corrcoef(_ranks(a), _ranks(b))[0, 1])
+
+
+def _rand_index(a: np.ndarray, b: np.ndarray) -> float:
+    """Fraction of point pairs on which two clusterings agree."""
+    same_a = a[:, None] == a[None, :]
+    same_b = b[:, None] == b[None, :]
+    iu = np.triu_indices(len(a), 1)
+    return float((same_a == same_b)[iu].mean())
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--vectors", help="(n, dim) .npy of real embeddings; rows split into docs/queries")
+    ap.add_argument("--docs", type=int, default=480)
+    ap.add_argument("--queries", type=int, default=50)
+    ap.add_argument("--dim", type=int, default=3072)
+    ap.add_argument("--k", type=int, default=8, help="k-means clusters")
+    args = ap.parse_args()
+
+    if args.vectors:
+        data = np.load(args.vectors).astype(np.float32)
+        queries, docs = data[: args.queries], data[args.queries :]
+    else:
+        docs, queries = _synthetic(args.docs, args.queries, args.dim, args.k)
+    print(f"{len(docs)} docs, {len(queries)} queries, dim {docs.shape[1]}\n")
+
+    base_scores = unit_matrix(list(docs)) @ unit_matrix(list(queries)).T
+    base_labels, _ = _kmeans(unit_matrix(list(docs)), args.k)
+
+    list_bytes = estimate_size(docs[0].tolist())
+    print(f"{'encoding':<10}{'bytes/vec':>11}{'8000 vecs':>12}{'spearman':>10}{'top10':>8}{'kmeans':>8}")
+    print(f"{'list':<10}{list_bytes:>11,}{list_bytes * _CACHE_ENTRIES / 2**20:>10.0f}MB"
+          f"{1.0:>10.4f}{1.0:>8.3f}{1.0:>8.3f}")
+    for dtype in ("float32", "float16", "int8"):
+        enc_docs = [encode(v, dtype) for v in docs]
+        enc_queries = [encode(v, dtype) for v in queries]
+        size = estimate_size(enc_docs[0])
+        scores = unit_matrix(enc_docs) @ unit_matrix(enc_queries).T
+        rho = np.mean([_spearman(base_scores[:, j], scores[:, j]) for j in range(len(queries))])
+        top = np.mean([
+            len(set(np.argsort(-base_scores[:, j])[:10]) & set(np.argsort(-scores[:, j])[:10])) / 10
+            for j in range(len(queries))
+        ])
+        labels, _ = _kmeans(unit_matrix(enc_docs), args.k)
+        print(f"{dtype:<10}{size:>11,}{size * _CACHE_ENTRIES / 2**20:>10.0f}MB"
+              f"{rho:>10.4f}{top:>8.3f}{_rand_index(base_labels, labels):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
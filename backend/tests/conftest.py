@@ -0,0 +1,117 @@
+"""Shared fixtures for the backend tests.
+
+``app.config`` refuses to import without API keys; the tests never call the
+real APIs, so placeholders are enough.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "test")
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+import pytest  # noqa: E402
+
+from app.services.cache import TTLCache  # noqa: E402
+from app.services.search import orchestrator  # noqa: E402
+from app.services.search import rerank as rerank_module  # noqa: E402
+from app.services.search.schema import SearchIntent, make_paper  # noqa: E402
+
+
+class FakeSource:
+    """In-memory literature source that behaves like an upstream API: sort,
+    citation floor and open-access filter are applied server-side, before
+    paging, exactly as OpenAlex does with ``sort`` / ``cited_by_count`` /
+    ``is_oa``.
+
+    Paper ``i`` of ``n``: relevance rank ``i``, published in month order (so
+    the newest papers are the least relevant), ``citations(i)`` citations.
+    """
+
+    name = "Fake"
+
+    def __init__(
+        self,
+        source_id: str = "fake",
+        n: int = 1000,
+        delay: float = 0.0,
+        citations=lambda i: (i * 7919) % 1000,
+        abstract=lambda i: "quantum gravity",
+        failures: int = 0,
+    ) -> None:
+        self.source_id = source_id
+        self.delay = delay
+        self.failures = failures  # calls that raise before the source recovers
+        self.calls: List[Dict[str, Any]] = []
+        self.corpus = [
+            make_paper(
+                source=source_id,
+                source_name=self.name,
+                title=f"{source_id}{i} quantum gravity",
+                authors=["A. Author"],
+                abstract=abstract(i),
+                year=1990 + i // 12 % 35,
+                published=f"{1990 + i // 12 % 35:04d}-{i % 12 + 1:02d}-01",
+                doi=f"10.1234/{source_id}.{i}",
+                citation_count=citations(i),
+                is_open_access=i % 2 == 0,
+            )
+            for i in range(n)
+        ]
+        for i, p in enumerate(self.corpus):
+            p["rank"] = i
+
+    def available(self) -> bool:
+        return True
+
+    def query_key(self, intent: SearchIntent) -> str:
+        sort = {"date": "date", "citations": "citations"}.get(intent.sort, "relevance")
+        return f"{intent.keyword_terms()}|{sort}|{intent.min_citations}|{intent.open_access_only}"
+
+    def _matches(self, intent: SearchIntent) -> List[Dict[str, Any]]:
+        hits = [
+            p for p in self.corpus
+            if (not intent.min_citations or p["citationCount"] >= intent.min_citations)
+            and (not intent.open_access_only or p["isOpenAccess"])
+        ]
+        if intent.sort == "date":
+            hits.sort(key=lambda p: (p["published"], p["rank"]), reverse=True)
+        elif intent.sort == "citations":
+            hits.sort(key=lambda p: p["citationCount"], reverse=True)
+        return hits
+
+    async def search(self, intent: SearchIntent, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        self.calls.append({"limit": limit, "offset": offset, "sort": intent.sort})
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError(f"{self.source_id} unavailable")
+        return [p.copy() for p in self._matches(intent)[offset : offset + limit]]
+
+
+@pytest.fixture
+def search_env(monkeypatch):
+    """Run the search orchestrator against ``FakeSource``s with fresh caches,
+    no citation enrichment and the local BM25 reranker. Returns a function
+    that installs the given sources."""
+    for name in (
+        "search_fetch_cache", "search_pool_cache", "search_results_cache",
+        "search_served_cache", "search_negative_cache", "rerank_scores_cache",
+    ):
+        monkeypatch.setattr(orchestrator, name, TTLCache(ttl=3600, soft_ttl=600, name=name))
+
+    async def _no_enrich(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return papers
+
+    monkeypatch.setattr(orchestrator, "enrich_citations_s2", _no_enrich)
+    monkeypatch.setattr(rerank_module, "RERANK_PROVIDER", "bm25")
+
+    def install(*sources: FakeSource, deadline: Optional[float] = None) -> None:
+        monkeypatch.setattr(orchestrator, "_ALL_CONNECTORS", list(sources))
+        if deadline is not None:
+            monkeypatch.setattr(orchestrator, "SEARCH_SOURCE_DEADLINE_S", deadline)
+
+    return install
@@ -0,0 +1,118 @@
+"""PaperBatch against the pure-Python filters and sorts it replaced.
+
+The reference functions below are the pre-vectorization implementations
+(``_post_filter``, ``_sort_without_rerank``, ``_blend_relevance_citations``);
+the batch must give the same records in the same order, ties included.
+"""
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from app.services.search.batch import PaperBatch, descending
+from app.services.search.schema import SearchIntent
+
+
+def _old_filter(papers, intent):
+    out = papers
+    if intent.min_citations:
+        out = [p for p in out if (p.get("citationCount", 0) or 0) >= intent.min_citations]
+    if intent.open_access_only:
+        out = [p for p in out if p.get("isOpenAccess")]
+    if intent.exclude:
+        terms = [t.lower() for t in intent.exclude if t]
+        out = [
+            p for p in out
+            if not any(t in f"{p.get('title', '')} {p.get('abstract', '')}".lower() for t in terms)
+        ]
+    return out
+
+
+def _old_impact(papers):
+    return sorted(
+        papers, key=lambda p: (p.get("citationCount", 0) or 0, p.get("year", 0) or 0), reverse=True
+    )
+
+
+def _old_date(papers):
+    return sorted(papers, key=lambda p: p.get("published") or str(p.get("year") or ""), reverse=True)
+
+
+def _old_blend(papers, alpha):
+    rel = [float(p.get("relevance_score", 0.0) or 0.0) for p in papers]
+    cit = [math.log1p(max(0, int(p.get("citationCount", 0) or 0))) for p in papers]
+    rspan = (max(rel) - min(rel)) or 1.0
+    cspan = (max(cit) - min(cit)) or 1.0
+    scores = [
+        round(alpha * (r - min(rel)) / rspan + (1.0 - alpha) * (c - min(cit)) / cspan, 4)
+        for r, c in zip(rel, cit)
+    ]
+    return scores, [p for _, p in sorted(zip(scores, papers), key=lambda t: t[0], reverse=True)]
+
+
+def _pool(seed: int, n: int = 400):
+    """Few distinct values per field, so ties are everywhere."""
+    rng = random.Random(seed)
+    papers = []
+    for i in range(n):
+        year = rng.choice([None, 2019, 2020, 2021])
+        papers.append({
+            "id": i,
+            "title": f"paper {i} " + rng.choice(["quantum gravity", "dark matter", "axion review"]),
+            "abstract": rng.choice(["", "spin foam", "lattice QCD"]),
+            "citationCount": rng.choice([None, 0, 1, 5, 5, 40, 1200]),
+            "year": year,
+            "published": rng.choice([None, f"{year}-03-01", f"{year}-11-15"]) if year else None,
+            "isOpenAccess": rng.random() < 0.5,
+            "relevance_score": rng.choice([None, 0.0, 0.25, 0.5, 0.75, 1.0]),
+        })
+    return papers
+
+
+def _ids(papers):
+    return [p["id"] for p in papers]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("kw", [
+    {"min_citations": 5}, {"open_access_only": True}, {"exclude": ["Review", "lattice"]},
+    {"min_citations": 40, "open_access_only": True, "exclude": ["axion"]}, {},
+])
+def test_filter_matches_the_list_filter(seed, kw):
+    papers = _pool(seed)
+    intent = SearchIntent(topics=["x"], **kw)
+
+    assert _ids(PaperBatch(papers).filter(intent).papers) == _ids(_old_filter(papers, intent))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_impact_and_date_orders_match_stable_sorts(seed):
+    batch = PaperBatch(_pool(seed))
+
+    assert _ids(batch.ordered(batch.impact_order())) == _ids(_old_impact(batch.papers))
+    assert _ids(batch.ordered(batch.date_order())) == _ids(_old_date(batch.papers))
+
+
+@pytest.mark.parametrize("head", [1, 7, 50, 399, 400, 1000])
+def test_a_head_order_matches_the_full_sort_up_to_head(head):
+    batch = PaperBatch(_pool(0))
+    full = _ids(_old_impact(batch.papers))
+
+    partial = _ids(batch.ordered(batch.impact_order(head)))
+
+    assert partial[:head] == full[:head]
+    assert sorted(partial) == sorted(full)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("alpha", [0.0, 0.7, 1.0])
+def test_blend_scores_match_the_list_blend(seed, alpha):
+    batch = PaperBatch(_pool(seed))
+    old_scores, old_order = _old_blend(batch.papers, alpha)
+
+    scores = batch.blend_scores(alpha)
+
+    assert scores.tolist() == old_scores
+    assert _ids(batch.ordered(descending(scores))) == _ids(old_order)
@@ -0,0 +1,168 @@
+"""TTLCache with a shared (L2) backend."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.cache import SingleFlight, SQLiteBackend, TTLCache, flush_l2_writes
+
+
+class SlowBackend:
+    """Dict-backed L2 where every round trip takes ``delay`` seconds."""
+
+    name = "slow"
+
+    def __init__(self, delay: float = 0.2) -> None:
+        self.delay = delay
+        self.data = {}
+        self.reads = []
+
+    def get_many(self, keys):
+        time.sleep(self.delay)
+        self.reads.append(len(keys))
+        return [self.data.get(k) for k in keys]
+
+    def set_many(self, items):
+        time.sleep(self.delay)
+        for key, val, ts, _ in items:
+            self.data[key] = (val, ts)
+
+
+def test_set_does_not_wait_for_the_backend():
+    backend = SlowBackend()
+    cache = TTLCache(name="slow_set", backend=backend)
+
+    start = time.perf_counter()
+    for i in range(20):
+        cache.set(i, f"v{i}")
+    assert time.perf_counter() - start < 0.1
+
+    flush_l2_writes()
+    assert len(backend.data) == 20
+
+
+@pytest.mark.asyncio
+async def test_misses_are_read_in_one_round_trip_off_the_event_loop():
+    backend = SlowBackend()
+    TTLCache(name="slow_get", backend=backend).set("a", 1)
+    flush_l2_writes()
+    cache = TTLCache(name="slow_get", backend=backend)  # another worker: empty L1
+
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    t = asyncio.ensure_future(ticker())
+    try:
+        assert await cache.aget_many(["a", "b", "c"]) == [1, None, None]
+    finally:
+        t.cancel()
+
+    assert backend.reads == [3]
+    assert ticks >= 10  # the loop kept running during the 0.2s read
+    assert await cache.aget("a") == 1  # now an L1 hit
+    assert backend.reads == [3]
+
+
+def test_sqlite_backend_round_trip(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "cache.sqlite"))
+    now = time.time()
+    backend.set_many([("k1", {"x": 1}, now, 60), ("k2", [2], now, 0), ("old", 3, now - 120, 60)])
+
+    assert backend.get_many(["k1", "missing", "k2", "old"]) == [({"x": 1}, now), None, ([2], now), None]
+
+
+def test_least_recently_used_entries_are_evicted_first():
+    cache = TTLCache(max_size=3, name="lru")
+    for k in "abc":
+        cache.set(k, k)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("d", "d")
+
+    assert [cache.get(k) for k in "abcd"] == ["a", None, "c", "d"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_budget_evicts_until_the_cache_fits():
+    cache = TTLCache(max_size=100, max_bytes=20_000, name="budget")
+    for i in range(10):
+        cache.set(i, "x" * 4000)
+
+    st = cache.stats()
+    assert st["bytes"] <= 20_000 and st["size"] < 10
+    assert cache.get(9) is not None and cache.get(0) is None
+
+
+def test_an_oversize_overwrite_replaces_the_old_value():
+    cache = TTLCache(max_bytes=2000, name="oversize")
+    cache.set("k", "small")
+    cache.set("k", "x" * 5000)
+    assert cache.get("k") is None  # not kept in L1, and never the stale value
+
+    backend = SlowBackend(delay=0)
+    shared = TTLCache(max_bytes=2000, name="oversize_l2", backend=backend)
+    shared.set("k", "small")
+    shared.set("k", "x" * 5000)
+    flush_l2_writes()
+    assert shared.get("k") == "x" * 5000  # served from L2, the only copy
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight("test_coalesce")
+    runs = []
+
+    async def compute():
+        runs.append(1)
+        await asyncio.sleep(0.05)
+        return {"ranked": []}
+
+    results = await asyncio.gather(*(flight.do("k", compute) for _ in range(5)))
+
+    assert len(runs) == 1 and all(r is results[0] for r in results)
+    assert flight.stats() == {"inflight": 0, "calls": 5, "leaders": 1, "coalesced": 4}
+    await flight.do("k", compute)  # finished keys start a new computation
+    assert len(runs) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_raises_the_failure_in_every_waiter():
+    flight = SingleFlight("test_failure")
+    runs = []
+
+    async def fail():
+        runs.append(1)
+        await asyncio.sleep(0.05)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(*(flight.do("k", fail) for _ in range(3)), return_exceptions=True)
+
+    assert len(runs) == 1
+    assert all(isinstance(r, RuntimeError) and str(r) == "upstream down" for r in results)
+    assert not flight.running("k")  # failures are not cached: the next call retries
+    with pytest.raises(RuntimeError):
+        await flight.do("k", fail)
+    assert len(runs) == 2
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_waiter_does_not_cancel_the_shared_work():
+    flight = SingleFlight("test_cancel")
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return 42
+
+    leaver = asyncio.ensure_future(flight.do("k", compute))
+    stayer = asyncio.ensure_future(flight.do("k", compute))
+    await asyncio.sleep(0.01)
+    leaver.cancel()
+
+    assert await stayer == 42
+    assert leaver.cancelled()
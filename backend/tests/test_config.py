@@ -0,0 +1,30 @@
+"""Settings validation (``app.config`` checks its environment at import)."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+
+def _import_config(**env: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", "import app.config"],
+        cwd=BACKEND, env={**os.environ, **env}, capture_output=True, text=True,
+    )
+
+
+@pytest.mark.parametrize("rate", ["0", "-1", "nan"])
+def test_non_positive_rate_limits_are_rejected(rate):
+    proc = _import_config(HTTP_RATE_LIMITS=f"api.openalex.org=5,api.semanticscholar.org={rate}")
+
+    assert proc.returncode != 0
+    assert "HTTP_RATE_LIMITS: rate for api.semanticscholar.org must be positive" in proc.stderr
+
+
+def test_positive_rate_limits_are_accepted():
+    assert _import_config(HTTP_RATE_LIMITS="api.openalex.org=5,api.semanticscholar.org=0.5").returncode == 0
@@ -0,0 +1,49 @@
+"""Connector plumbing: paged fetching."""
+from __future__ import annotations
+
+import pytest
+
+from app.services.search.connectors import openalex_connector
+from app.services.search.connectors.base import PageFetchError, fetch_pages
+from app.services.search.connectors.openalex_connector import OpenAlexConnector
+from app.services.search.schema import SearchIntent
+
+pytestmark = pytest.mark.asyncio
+
+
+def _pages(total: int, failing=()):
+    calls = []
+
+    async def fetch(index: int, size: int):
+        calls.append(index)
+        if index in failing:
+            raise PageFetchError(f"page {index} failed")
+        start = index * size
+        return list(range(start, min(start + size, total))), total
+
+    return fetch, calls
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+async def test_a_failed_page_fails_the_fetch(concurrent):
+    fetch, _ = _pages(100, failing={2})
+
+    with pytest.raises(PageFetchError):
+        await fetch_pages(fetch, 50, 10, concurrent=concurrent)
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+async def test_only_a_short_successful_page_ends_the_source(concurrent):
+    fetch, _ = _pages(35)
+
+    assert await fetch_pages(fetch, 50, 10, offset=5, concurrent=concurrent) == list(range(5, 35))
+
+
+async def test_a_failed_request_is_an_error_not_an_empty_source(monkeypatch):
+    async def unreachable(url, **kw):
+        return None  # what get_with_retry returns once its retries are spent
+
+    monkeypatch.setattr(openalex_connector, "get_with_retry", unreachable)
+
+    with pytest.raises(PageFetchError):
+        await OpenAlexConnector().search(SearchIntent(topics=["quantum gravity"]), 50)
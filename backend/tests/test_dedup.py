@@ -0,0 +1,95 @@
+"""Cross-source deduplication: identity keys, near-duplicate titles and guards."""
+from __future__ import annotations
+
+import pytest
+
+from app.services.search.dedup import dedupe
+
+
+def _paper(title: str, source: str = "openalex", **kw):
+    return {"title": title, "source": source, "abstract": "", **kw}
+
+
+def _groups(papers):
+    return [sorted(p["sources"]) for p in dedupe(papers)]
+
+
+def test_records_sharing_a_doi_or_arxiv_id_merge():
+    papers = [
+        _paper("Quantum error correction with surface codes", "openalex",
+               doi="10.1103/PhysRevA.86.032324", citationCount=40),
+        _paper("Surface codes: towards practical quantum computation", "s2",
+               doi="https://doi.org/10.1103/physreva.86.032324", citationCount=55),
+        _paper("Topological quantum memory", "arxiv", arxiv_id="quant-ph/0110143v2"),
+        _paper("Topological quantum memory (revised)", "core", arxiv_id="QUANT-PH/0110143"),
+    ]
+
+    merged = dedupe(papers)
+
+    assert [p["sources"] for p in merged] == [["openalex", "s2"], ["arxiv", "core"]]
+    assert merged[0]["citationCount"] == 55
+
+
+def test_a_record_with_both_ids_joins_a_doi_only_and_an_arxiv_only_record():
+    papers = [
+        _paper("Holographic entanglement entropy", "openalex", doi="10.1103/prl.96.181602"),
+        _paper("Ryu-Takayanagi formula", "arxiv", arxiv_id="hep-th/0603001"),
+        _paper("Holographic derivation of entanglement entropy", "s2",
+               doi="10.1103/PRL.96.181602", arxiv_id="hep-th/0603001v2"),
+    ]
+
+    assert _groups(papers) == [["arxiv", "openalex", "s2"]]
+
+
+def test_near_duplicate_titles_merge():
+    papers = [
+        _paper("Loop quantum gravity and black hole entropy", "openalex", year=2004,
+               doi="10.1103/physrevlett.93.021301"),
+        _paper("Loop Quantum Gravity and Black-Hole Entropy.", "arxiv", year=2003,
+               arxiv_id="gr-qc/0401041"),
+        _paper("Emergent spacetime from entanglement entropy", "openalex", year=2020),
+        _paper("Emergent spacetime from entanglement entropies", "s2", year=2020),
+    ]
+
+    assert _groups(papers) == [["arxiv", "openalex"], ["openalex", "s2"]]
+
+
+@pytest.mark.parametrize("a, b", [
+    ({"year": 2010}, {"year": 2014}),
+    ({"arxiv_id": "1001.00001"}, {"arxiv_id": "1001.00002v1"}),
+    ({"doi": "10.1234/jqg.2020.1"}, {"doi": "10.1234/jqg.2020.2"}),
+])
+def test_guards_keep_near_duplicate_titles_apart(a, b):
+    papers = [
+        _paper("Emergent spacetime from entanglement entropy", "openalex", **a),
+        _paper("Emergent spacetime from entanglement entropies", "s2", **b),
+    ]
+
+    assert len(dedupe(papers)) == 2
+
+
+@pytest.mark.parametrize("a, b", [
+    ("Spin foam models of quantum gravity part I", "Spin foam models of quantum gravity part II"),
+    ("Dark energy and the accelerating universe", "Erratum: dark energy and the accelerating universe"),
+    ("Dark energy and the accelerating universe", "Comment on dark energy and the accelerating universe"),
+])
+def test_numbered_parts_and_companion_pieces_stay_apart(a, b):
+    assert len(dedupe([_paper(a, "openalex"), _paper(b, "s2")])) == 2
+
+
+def test_preprint_and_journal_dois_of_one_work_still_merge():
+    papers = [
+        _paper("Emergent spacetime from entanglement entropy", "openalex", doi="10.1038/s41567-020-1"),
+        _paper("Emergent spacetime from entanglement entropies", "biorxiv", doi="10.1101/2020.01.01.1"),
+    ]
+
+    assert len(dedupe(papers)) == 1
+
+
+def test_fuzzy_matches_do_not_chain():
+    # A~B and B~C are near duplicates, A and C are not (Jaccard 0.79 < 0.8).
+    a = _paper("Emergent spacetime from entanglement entropy", "a")
+    b = _paper("Emergent spacetime from entanglement entropies", "b")
+    c = _paper("Emergent spacetimes from entanglement entropies", "c")
+
+    assert _groups([a, b, c]) == [["a", "b"], ["c"]]
@@ -0,0 +1,105 @@
+"""Embedding batch scheduler: packing misses into API calls."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.search import rerank as rerank_module
+from app.services.search.rerank import _EmbedScheduler
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeEmbedAPI:
+    """Blocking embed call (like the SDK) that records every batch."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.batches = []
+        self.active = self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, texts, task_type):
+        with self._lock:
+            self.batches.append(list(texts))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("quota exceeded")
+            return [[float(len(t)), 1.0] for t in texts]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+async def test_full_batches_start_at_once_and_the_rest_waits_for_the_window(monkeypatch):
+    monkeypatch.setattr(rerank_module, "_BATCH", 4)
+    api = FakeEmbedAPI()
+    scheduler = _EmbedScheduler(api, window_s=0.05, concurrency=4)
+
+    first = scheduler.submit([f"t{i}" for i in range(10)], "RETRIEVAL_DOCUMENT")
+    await asyncio.sleep(0.01)
+    assert [len(b) for b in api.batches] == [4, 4]  # two full batches; 2 texts wait
+
+    second = scheduler.submit(["u0"], "RETRIEVAL_DOCUMENT")  # tops up the partial batch
+    vecs = await asyncio.gather(*first, *second)
+
+    assert [len(b) for b in api.batches] == [4, 4, 3]
+    assert api.batches[2] == ["t8", "t9", "u0"]
+    assert vecs[0] == [2.0, 1.0] and len(vecs) == 11
+
+
+async def test_task_types_are_batched_separately():
+    api = FakeEmbedAPI()
+    scheduler = _EmbedScheduler(api, window_s=0.01, concurrency=4)
+
+    await asyncio.gather(
+        *scheduler.submit(["query"], "RETRIEVAL_QUERY"),
+        *scheduler.submit(["doc a", "doc b"], "RETRIEVAL_DOCUMENT"),
+    )
+
+    assert sorted(api.batches) == [["doc a", "doc b"], ["query"]]
+
+
+async def test_at_most_concurrency_batches_run_at_once(monkeypatch):
+    monkeypatch.setattr(rerank_module, "_BATCH", 2)
+    api = FakeEmbedAPI(delay=0.02)
+    scheduler = _EmbedScheduler(api, window_s=0.01, concurrency=2)
+
+    await asyncio.gather(*scheduler.submit([f"t{i}" for i in range(10)], "RETRIEVAL_DOCUMENT"))
+
+    assert len(api.batches) == 5 and api.max_active == 2
+
+
+async def test_a_failed_batch_fails_every_text_in_it():
+    scheduler = _EmbedScheduler(FakeEmbedAPI(fail=True), window_s=0.01, concurrency=2)
+
+    results = await asyncio.gather(
+        *scheduler.submit(["a", "b", "c"], "RETRIEVAL_DOCUMENT"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_cancelled_texts_are_not_embedded():
+    api = FakeEmbedAPI()
+    scheduler = _EmbedScheduler(api, window_s=0.03, concurrency=2)
+
+    gone = scheduler.submit(["gone a", "gone b"], "RETRIEVAL_DOCUMENT")
+    kept = scheduler.submit(["kept"], "RETRIEVAL_DOCUMENT")
+    for fut in gone:
+        fut.cancel()
+
+    assert await kept[0] == [4.0, 1.0]
+    assert api.batches == [["kept"]]
+
+    alone = scheduler.submit(["alone"], "RETRIEVAL_DOCUMENT")
+    alone[0].cancel()
+    await asyncio.sleep(0.06)
+    assert api.batches == [["kept"]]  # a batch nobody waits for is never sent
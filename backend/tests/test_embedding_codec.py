@@ -0,0 +1,87 @@
+"""Embedding cache encodings: round-trip error bounds and cosine fidelity."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.services.embedding_codec import Int8Vector, decode, encode, unit_matrix
+
+DIM = 3072
+
+
+def _vectors(n: int = 20, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0.0, 0.02, (n, DIM)).astype(np.float32)
+
+
+def _cosines(X: np.ndarray) -> np.ndarray:
+    X = X / np.linalg.norm(X, axis=1, keepdims=True)
+    return X @ X.T
+
+
+def test_float32_is_lossless():
+    v = _vectors(1)[0]
+
+    enc = encode(v, "float32")
+
+    assert enc.dtype == np.float32 and np.array_equal(decode(enc), v)
+
+
+def test_float16_error_is_within_half_precision():
+    for v in _vectors():
+        enc = encode(v, "float16")
+
+        assert enc.dtype == np.float16 and enc.nbytes == DIM * 2
+        # 11-bit significand: relative error <= 2**-11 for normal values.
+        assert np.all(np.abs(decode(enc) - v) <= np.abs(v) * 2.0 ** -11 + 6e-8)
+
+
+def test_int8_error_is_within_half_a_step():
+    for v in _vectors():
+        enc = encode(v, "int8")
+
+        assert isinstance(enc, Int8Vector) and enc.nbytes == DIM + 8 and len(enc) == DIM
+        assert enc.scale == pytest.approx(np.abs(v).max() / 127.0)
+        assert np.abs(enc.codes.astype(int)).max() == 127
+        assert np.all(np.abs(decode(enc) - v) <= enc.scale / 2 * (1 + 1e-5))
+
+
+@pytest.mark.parametrize("dtype, tol", [("float32", 1e-6), ("float16", 1e-4), ("int8", 5e-3)])
+def test_cosines_through_unit_matrix_match_the_originals(dtype, tol):
+    X = _vectors()
+
+    U = unit_matrix([encode(v, dtype) for v in X])
+
+    assert U.dtype == np.float32 and U.shape == X.shape
+    assert np.allclose(np.linalg.norm(U, axis=1), 1.0, atol=1e-5)
+    assert np.abs(U @ U.T - _cosines(X)).max() < tol
+
+
+def test_int8_rows_normalize_like_their_decoded_vectors():
+    encoded = [encode(v, "int8") for v in _vectors(5)]
+
+    from_codes = unit_matrix(encoded)
+    from_decoded = unit_matrix([decode(e) for e in encoded])
+
+    assert np.allclose(from_codes, from_decoded, atol=1e-6)
+
+
+def test_mixed_encodings_and_plain_lists_share_one_matrix():
+    v = _vectors(1)[0]
+
+    U = unit_matrix([v.tolist(), encode(v, "float16"), encode(v, "int8")])
+
+    assert np.abs(U @ U[0] - 1.0).max() < 5e-3
+
+
+def test_zero_vectors_stay_finite():
+    zero = np.zeros(8, dtype=np.float32)
+
+    enc = encode(zero, "int8")
+
+    assert enc.scale == 1.0 and not decode(enc).any()
+    assert np.isfinite(unit_matrix([enc, encode(zero, "float16")])).all()
+
+
+def test_an_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError, match="bfloat16"):
+        encode([1.0, 2.0], "bfloat16")
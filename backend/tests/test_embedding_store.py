@@ -0,0 +1,66 @@
+"""Memory-mapped embedding store."""
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+
+from app.services.cache import text_key
+from app.services.embedding_store import EmbeddingStore
+
+MODEL, TASK = "test-model", "RETRIEVAL_DOCUMENT"
+
+
+def _items(n: int, dim: int = 8):
+    rng = np.random.default_rng(0)
+    return [(text_key(f"text {i}"), rng.standard_normal(dim).astype(np.float32)) for i in range(n)]
+
+
+def test_rows_round_trip(tmp_path):
+    store = EmbeddingStore(str(tmp_path))
+    items = _items(5)
+    assert store.put_many(MODEL, TASK, items) == 5
+    assert store.put_many(MODEL, TASK, items) == 0  # already stored
+
+    for key, vec in items:
+        np.testing.assert_allclose(store.get(MODEL, TASK, key), vec, atol=1e-2)
+    assert store.get(MODEL, TASK, text_key("unknown")) is None
+
+
+def test_other_workers_rows_appear_after_refresh(tmp_path):
+    writer, reader = EmbeddingStore(str(tmp_path)), EmbeddingStore(str(tmp_path))
+    reader.refresh(MODEL, TASK)
+    key, _ = _items(1)[0]
+    writer.put_many(MODEL, TASK, _items(1))
+
+    assert reader.get(MODEL, TASK, key) is None  # lookups never touch the disk
+    reader._shards[(MODEL, TASK)]._last_refresh = 0.0  # skip the rate limit
+    assert reader.refresh(MODEL, TASK)
+    assert reader.get(MODEL, TASK, key) is not None
+
+
+def test_lookups_do_not_wait_for_a_writer(tmp_path):
+    store = EmbeddingStore(str(tmp_path))
+    items = _items(3)
+    store.put_many(MODEL, TASK, items)
+    shard = store._shards[(MODEL, TASK)]
+
+    held, release = threading.Event(), threading.Event()
+
+    def slow_writer() -> None:
+        with shard._lock:  # what put_many holds during flock + file writes
+            held.set()
+            release.wait(5)
+
+    t = threading.Thread(target=slow_writer)
+    t.start()
+    held.wait(5)
+    try:
+        start = time.perf_counter()
+        assert store.get(MODEL, TASK, items[0][0]) is not None
+        assert store.get(MODEL, TASK, text_key("miss")) is None
+        assert time.perf_counter() - start < 0.1
+    finally:
+        release.set()
+        t.join()
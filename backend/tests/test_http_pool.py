@@ -0,0 +1,45 @@
+"""Shared per-host HTTP clients."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services import http_pool
+from app.services.http_pool import client_for, close_all
+
+OPENALEX = "https://api.openalex.org/works"
+
+
+@pytest.mark.asyncio
+async def test_one_client_per_host():
+    works = client_for(OPENALEX)
+
+    assert client_for("https://api.openalex.org/authors?page=2") is works
+    assert client_for("https://inspirehep.net/api/literature") is not works
+    assert works.headers["User-Agent"] == http_pool.USER_AGENT
+    await close_all()
+
+
+@pytest.mark.asyncio
+async def test_close_all_closes_the_clients_and_later_calls_reopen():
+    before = client_for(OPENALEX)
+
+    await close_all()
+
+    assert before.is_closed
+    after = client_for(OPENALEX)
+    assert after is not before and not after.is_closed
+    await after.aclose()
+    assert client_for(OPENALEX) is not after  # a closed client is replaced
+    await close_all()
+
+
+def test_each_event_loop_gets_its_own_clients():
+    async def open_client():
+        return client_for(OPENALEX), len(http_pool._clients)
+
+    (first, _), (second, loops) = asyncio.run(open_client()), asyncio.run(open_client())
+
+    assert first is not second
+    assert loops == 1  # the first loop closed; its clients were dropped
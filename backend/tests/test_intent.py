@@ -0,0 +1,92 @@
+"""Intent extraction: the local fast path and the per-day intent cache."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.cache import SingleFlight, TTLCache
+from app.services.search import intent as intent_module
+from app.services.search.intent import _fast_intent, extract_intent
+
+TODAY = "2026-10-17"
+
+
+def test_keywords_with_since_and_by_clauses_are_parsed_locally():
+    intent = _fast_intent("quantum error correction since 2019 by John Preskill", TODAY)
+
+    assert intent.topics == ["quantum error correction"]
+    assert intent.authors == ["John Preskill"]
+    assert intent.date_from == "2019-01-01"
+    assert (intent.field, intent.arxiv_categories) == ("physics", ["quant-ph"])
+
+
+@pytest.mark.parametrize("nl, author", [
+    ("holographic entanglement by J. M. Maldacena", "J. M. Maldacena"),
+    ("string theory since 2010 by Erik van der Berg", "Erik van der Berg"),
+])
+def test_person_names_are_recognised(nl, author):
+    assert _fast_intent(nl, TODAY).authors == [author]
+
+
+def test_subfield_keywords_set_field_and_arxiv_categories():
+    gravity = _fast_intent("loop quantum gravity", TODAY)
+    assert (gravity.field, gravity.arxiv_categories) == ("physics", ["gr-qc", "hep-th"])
+
+    mixed = _fast_intent("machine learning for quantum computing", TODAY)
+    assert mixed.field is None  # two disciplines
+    assert set(mixed.arxiv_categories) == {"quant-ph", "cs.LG", "stat.ML"}
+
+    plain = _fast_intent("topological insulators", TODAY)
+    assert (plain.field, plain.arxiv_categories) == (None, [])
+
+
+@pytest.mark.parametrize("nl", [
+    "reinforcement learning by Doing",  # one capitalized word is not a person
+    "dark matter by LIGO Team",
+    "recent papers about dark matter",
+    "dark matter since 2030",
+    "dark matter not axions",
+    "what is dark matter?",
+])
+def test_anything_else_goes_to_the_model(nl):
+    assert _fast_intent(nl, TODAY) is None
+
+
+@pytest.mark.asyncio
+async def test_model_intents_are_cached_per_normalized_text(monkeypatch):
+    calls = []
+
+    async def fake_llm(nl, today):
+        calls.append(nl)
+        await asyncio.sleep(0.05)
+        return {"topics": ["dark matter"], "exclude": ["axions"], "canonical_query": nl}
+
+    monkeypatch.setattr(intent_module, "_extract_llm", fake_llm)
+    monkeypatch.setattr(intent_module, "intent_cache", TTLCache(name="intent_test"))
+    monkeypatch.setattr(intent_module, "intent_flight", SingleFlight("intent_test"))
+
+    first, joined = await asyncio.gather(
+        extract_intent("dark matter not axions"), extract_intent("dark matter not axions"),
+    )
+    again = await extract_intent("  Dark   Matter NOT axions ")
+
+    assert len(calls) == 1
+    assert first == joined == again and again.exclude == ["axions"]
+
+
+@pytest.mark.asyncio
+async def test_failed_extractions_are_not_cached(monkeypatch):
+    results = [None, {"topics": ["dark matter"], "exclude": ["axions"]}]
+
+    async def flaky_llm(nl, today):
+        return results.pop(0)
+
+    monkeypatch.setattr(intent_module, "_extract_llm", flaky_llm)
+    monkeypatch.setattr(intent_module, "intent_cache", TTLCache(name="intent_test"))
+
+    fallback = await extract_intent("dark matter not axions")
+    retried = await extract_intent("dark matter not axions")
+
+    assert fallback.topics == ["dark matter not axions"] and not fallback.exclude
+    assert retried.exclude == ["axions"]
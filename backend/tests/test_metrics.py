@@ -0,0 +1,69 @@
+"""``GET /api/metrics``: the Prometheus text exposition format."""
+from __future__ import annotations
+
+import re
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.routes.metrics import router
+from app.services.metrics import PREFIX, counter, histogram
+
+pytestmark = pytest.mark.asyncio
+
+_SAMPLE = re.compile(r'^([a-z_:][a-z0-9_:]*)(\{(?:[a-z_]+="(?:[^"\\\n]|\\.)*",?)*\})? (\S+)$')
+
+
+async def _scrape() -> httpx.Response:
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        return await c.get("/api/metrics")
+
+
+async def test_every_sample_follows_its_type_line():
+    resp = await _scrape()
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    typed = {}
+    for line in resp.text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, name, kind = line.split(" ")
+            assert kind in ("counter", "gauge", "histogram") and name not in typed
+            typed[name] = kind
+        elif not line.startswith("# HELP "):
+            name = _SAMPLE.match(line).group(1)
+            family = re.sub(r"_(bucket|sum|count)$", "", name)
+            assert name in typed or typed.get(family) == "histogram", line
+    assert typed[f"{PREFIX}cache_entries"] == "gauge"
+    assert typed[f"{PREFIX}search_rerank_seconds"] == "histogram"
+    assert typed[f"{PREFIX}search_intent_requests_total"] == "counter"
+
+
+async def test_label_values_are_escaped():
+    counter("test_escaping_total", "Label escaping.").inc(path='say "hi"\\now\nbye')
+
+    text = (await _scrape()).text
+
+    assert f'{PREFIX}test_escaping_total{{path="say \\"hi\\"\\\\now\\nbye"}} 1\n' in text
+
+
+async def test_histograms_expose_cumulative_buckets_sum_and_count():
+    h = histogram("test_scrape_seconds", "Histogram exposition.", (0.01, 0.5, 1.0))
+    for v in (0.003, 0.2, 0.2, 100.0):
+        h.observe(v, source="fake")
+
+    text = (await _scrape()).text
+
+    full = f"{PREFIX}test_scrape_seconds"
+    lines = [line for line in text.splitlines() if line.startswith(full)]
+    assert lines == [
+        f'{full}_bucket{{source="fake",le="0.01"}} 1',
+        f'{full}_bucket{{source="fake",le="0.5"}} 3',
+        f'{full}_bucket{{source="fake",le="1"}} 3',
+        f'{full}_bucket{{source="fake",le="+Inf"}} 4',
+        f'{full}_sum{{source="fake"}} 100.403',
+        f'{full}_count{{source="fake"}} 4',
+    ]
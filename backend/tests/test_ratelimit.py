@@ -0,0 +1,39 @@
+"""Per-host rate limiting of outbound requests."""
+from __future__ import annotations
+
+import asyncio
+
+from app.services import ratelimit
+from app.services.ratelimit import limiter_for
+
+ARXIV = "http://export.arxiv.org/api/query"
+
+
+async def _contend(n: int = 2) -> ratelimit.HostLimiter:
+    limiter = limiter_for(ARXIV)
+    limiter._tokens = float(n)  # no pacing; the slot and lock still queue
+
+    async def one() -> None:
+        async with limiter.slot():
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(one() for _ in range(n)))
+    return limiter
+
+
+def test_each_event_loop_gets_its_own_limiters():
+    first = asyncio.run(_contend())
+    second = asyncio.run(_contend())  # would raise "bound to a different event loop"
+
+    assert first is not second
+    assert second.host == "export.arxiv.org"
+
+
+async def _loops_with_limiters() -> int:
+    limiter_for(ARXIV)
+    return len(ratelimit._limiters)
+
+
+def test_limiters_of_closed_loops_are_dropped():
+    asyncio.run(_contend())
+    assert asyncio.run(_loops_with_limiters()) == 1
@@ -0,0 +1,113 @@
+"""Relevance reranking backends (no network: LLM calls go to a fake client)."""
+from __future__ import annotations
+
+import re
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.search import rerank as rerank_module
+from app.services.search.rerank import rerank
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeAnthropic:
+    """Ranks a listing by whether the paper mentions "foam" (a judgement BM25
+    on the query terms cannot make)."""
+
+    def __init__(self) -> None:
+        self.windows = []
+        self._lock = threading.Lock()
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, **kw):
+        items = re.findall(r"^\[(\d+)\] (.*)$", kw["messages"][0]["content"], re.M)
+        with self._lock:
+            self.windows.append(len(items))
+        order = sorted(range(len(items)), key=lambda i: self._key(items[i][1]))
+        return SimpleNamespace(content=[SimpleNamespace(type="tool_use", input={"ranking": order})])
+
+    def _key(self, text: str):
+        return "foam" not in text
+
+
+class GradedAnthropic(FakeAnthropic):
+    """Ranks by the ``grade N`` in each title, highest first."""
+
+    def _key(self, text: str):
+        return -int(re.search(r"grade (\d+)", text).group(1))
+
+
+def _papers(n: int, relevant=()):
+    return [
+        {"title": f"P{i} " + ("spacetime foam" if i in relevant else "dark matter"), "abstract": "x"}
+        for i in range(n)
+    ]
+
+
+async def test_windowed_llm_rerank_covers_the_whole_pool(monkeypatch):
+    client = FakeAnthropic()
+    monkeypatch.setattr(rerank_module, "RERANK_PROVIDER", "anthropic")
+    monkeypatch.setattr(rerank_module, "LLM_RERANK_MODE", "windowed")
+    monkeypatch.setattr(rerank_module, "RERANK_TOP_K", 100)
+    monkeypatch.setattr(rerank_module, "_anthropic", client)
+
+    ranked, provider = await rerank("quantum gravity", _papers(300, relevant={5, 250}), ["quantum gravity"])
+
+    assert provider == "anthropic"
+    assert len(ranked) == 300 and all("relevance_score" in p for p in ranked)
+    assert {ranked[0]["title"], ranked[1]["title"]} == {"P5 spacetime foam", "P250 spacetime foam"}
+    assert max(client.windows) == rerank_module.LLM_RERANK_WINDOW
+
+
+async def test_windowed_rerank_compares_window_winners_globally(monkeypatch):
+    client = GradedAnthropic()
+    monkeypatch.setattr(rerank_module, "LLM_RERANK_WINDOW", 10)
+    grades = {0: 3, 22: 9, 23: 8}  # 0 tops the first window; 22 and 23 are the best overall
+    papers = [{"title": f"P{i} grade {grades.get(i, 1)}", "abstract": ""} for i in range(30)]
+
+    order = await rerank_module._windowed_order(client, "q", papers)
+
+    assert order[:3] == [22, 23, 0]
+    assert sorted(order) == list(range(30))
+
+
+async def test_bm25_rerank_orders_by_term_overlap(monkeypatch):
+    monkeypatch.setattr(rerank_module, "RERANK_PROVIDER", "bm25")
+    papers = [
+        {"title": "Dark matter halos", "abstract": "galaxy rotation curves"},
+        {"title": "Loop quantum gravity", "abstract": "quantum gravity and spin networks"},
+        {"title": "Quantum optics", "abstract": "photons"},
+    ]
+
+    ranked, provider = await rerank("quantum gravity", papers)
+
+    assert provider == "bm25"
+    assert [p["title"] for p in ranked] == ["Loop quantum gravity", "Quantum optics", "Dark matter halos"]
+    assert ranked[0]["relevance_score"] == 1.0
+
+
+@pytest.mark.parametrize("head_scores", [[0.9, 0.8, 0.7], [-0.1, -0.3, -0.6], [0.0, 0.0, 0.0]])
+async def test_cascade_keeps_the_tail_below_the_head_in_bm25_order(monkeypatch, head_scores):
+    monkeypatch.setattr(rerank_module, "RERANK_TOP_K", 3)
+    # BM25 order for "quantum gravity": P0, P1, ... (fewer matching terms further down).
+    papers = [
+        {"title": f"P{i} " + " ".join(["quantum gravity"] * (8 - i) + ["optics"] * i), "abstract": ""}
+        for i in range(8)
+    ]
+
+    async def backend(query_text, head):
+        ranked = head[::-1]  # the expensive stage disagrees with BM25
+        for p, score in zip(ranked, head_scores):
+            p["relevance_score"] = score
+        return ranked
+
+    ranked = await rerank_module._cascade(backend, "quantum gravity", "quantum gravity", papers)
+
+    assert [p["title"][:2] for p in ranked] == ["P2", "P1", "P0", "P3", "P4", "P5", "P6", "P7"]
+    scores = [p["relevance_score"] for p in ranked]
+    assert max(scores[3:]) < min(scores[:3])
+    assert scores[3:] == sorted(scores[3:], reverse=True) and len(set(scores[3:])) == 5
+    assert [p["relevance_rank"] for p in ranked[3:]] == [4, 5, 6, 7, 8]
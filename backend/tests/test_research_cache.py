@@ -0,0 +1,100 @@
+"""Legacy research lookups: positive results for an hour, misses for minutes."""
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+
+from app.services import research_client
+from app.services.cache import TTLCache
+from app.services.research_client import AdvancedResearchAPIClient
+
+pytestmark = pytest.mark.asyncio
+
+CITING = {"data": [{"citingPaper": {"paperId": "p1", "title": "Spin foams"}}]}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(research_client, "research_cache", TTLCache(ttl=3600, name="r_test"))
+    monkeypatch.setattr(research_client, "legacy_citation_cache", TTLCache(ttl=3600, name="l_test"))
+    monkeypatch.setattr(
+        research_client, "research_negative_cache", TTLCache(ttl=120, name="n_test")
+    )
+    return AdvancedResearchAPIClient()
+
+
+def _upstream(monkeypatch, client, replies):
+    """Each request pops the next reply: a JSON body, a status code, or an exception."""
+    calls = []
+
+    async def fake_get(url, **kwargs):
+        calls.append(url)
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        if isinstance(reply, int):
+            return httpx.Response(reply)
+        return httpx.Response(200, json=reply)
+
+    monkeypatch.setattr(client, "_get", fake_get)
+    return calls
+
+
+async def test_an_empty_result_is_retried_after_the_negative_ttl(client, clock, monkeypatch):
+    calls = _upstream(monkeypatch, client, [{"data": []}, CITING])
+
+    first = await client.fetch_paper_citations("P")
+    clock[0] += 60
+    again = await client.fetch_paper_citations("P")
+    clock[0] += 61
+    later = await client.fetch_paper_citations("P")
+
+    assert first == again == {"citations": [], "total": 0}
+    assert later["total"] == 1 and len(calls) == 2
+
+
+async def test_a_failed_lookup_is_cached_only_briefly(client, clock, monkeypatch):
+    calls = _upstream(monkeypatch, client, [httpx.ConnectError("outage"), 503, CITING])
+
+    await client.fetch_paper_citations("P")
+    await client.fetch_paper_citations("P")
+    clock[0] += 121
+    assert (await client.fetch_paper_citations("P"))["total"] == 0  # still down: 503
+    clock[0] += 121
+    assert (await client.fetch_paper_citations("P"))["total"] == 1
+
+    assert len(calls) == 3
+
+
+async def test_found_results_keep_the_long_ttl(client, clock, monkeypatch):
+    calls = _upstream(monkeypatch, client, [CITING, {"data": []}])
+
+    await client.fetch_paper_citations("P")
+    clock[0] += 3000
+    assert (await client.fetch_paper_citations("P"))["total"] == 1
+    clock[0] += 601
+    assert (await client.fetch_paper_citations("P"))["total"] == 0
+
+    assert len(calls) == 2
+    assert research_client.research_negative_cache.stats()["size"] == 1
+
+
+async def test_a_missing_doi_is_negatively_cached(client, clock, monkeypatch):
+    calls = _upstream(monkeypatch, client, [404, 404])
+
+    assert await client.get_paper_by_doi("10.1234/nope", source="openalex") == {}
+    assert await client.get_paper_by_doi("10.1234/nope", source="openalex") == {}
+    clock[0] += 121
+    await client.get_paper_by_doi("10.1234/nope", source="openalex")
+
+    assert len(calls) == 2
+    assert research_client.research_cache.stats()["size"] == 0
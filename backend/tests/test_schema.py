@@ -0,0 +1,112 @@
+"""``PaperRecord``: the compact record behind ``make_paper``."""
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from app.services.search import schema
+from app.services.search.schema import PaperRecord, export_papers, make_paper
+
+
+def _paper(**kw):
+    return make_paper(
+        source="arxiv", source_name="arXiv", title="Spin foams",
+        authors=["A. Ashtekar", "C. Rovelli"], categories=["gr-qc", "hep-th"], doi="10.1234/x",
+        extra={"openalex_id": "W1"}, **kw,
+    )
+
+
+def _json(p):
+    return {k: list(v) if isinstance(v, tuple) else v for k, v in p.items()}
+
+
+def test_mapping_protocol_matches_a_dict():
+    p = _paper()
+    d = p.to_dict()
+
+    assert _json(p) == d and len(p) == len(d) and list(p) == list(d)
+    assert p["authors"] == [{"name": "A. Ashtekar"}, {"name": "C. Rovelli"}]
+    assert p["openalex_id"] == "W1" and p.get("missing", 0) == 0
+    assert "authors" in p and "doi" in p and "missing" not in p
+
+    p["relevance_score"] = 0.5
+    p["note"] = "extra"
+    del p["doi"]
+    del p["openalex_id"]
+    assert "doi" not in p and p.get("doi") is None and "openalex_id" not in p
+    assert p["relevance_score"] == 0.5 and p["note"] == "extra"
+    with pytest.raises(KeyError):
+        p["doi"]
+    with pytest.raises(KeyError):
+        del p["openalex_id"]
+
+
+def test_changes_to_authors_stick():
+    p = _paper()
+
+    p["authors"].append({"name": "L. Smolin"})
+    p["authors"][0]["name"] = "Abhay Ashtekar"
+
+    names = ["Abhay Ashtekar", "C. Rovelli", "L. Smolin"]
+    assert [a["name"] for a in p["authors"]] == names
+    assert [a["name"] for a in p.to_dict()["authors"]] == names
+
+
+def test_copies_are_independent_records():
+    p = _paper()
+    q = p.copy()
+
+    q["title"] = "Loops"
+    q["relevance_rank"] = 1
+    q["note"] = "extra"
+
+    assert p["title"] == "Spin foams" and "relevance_rank" not in p and "note" not in p
+    assert q["categories"] is p["categories"]  # shared tuples stay shared
+
+
+def test_pickling_round_trips_and_repacks():
+    p = _paper()
+    p["relevance_rank"] = 3
+
+    q = pickle.loads(pickle.dumps(p))
+
+    assert isinstance(q._authors, tuple)  # plain names pack again
+    assert isinstance(q, PaperRecord) and dict(q) == dict(p)
+    assert q["categories"] is _paper()["categories"]  # shared tuple
+
+
+def test_export_papers_gives_independent_json_dicts():
+    p = _paper()
+    plain = {"title": "Already a dict", "authors": []}
+
+    out = export_papers([p, plain])
+
+    assert type(out[0]) is dict and out[0] == _json(p)
+    assert out[0]["categories"] == ["gr-qc", "hep-th"]  # JSON lists, not tuples
+    out[0]["authors"][0]["name"] = "changed"
+    out[0]["categories"].append("quant-ph")
+    assert p["authors"][0]["name"] == "A. Ashtekar" and p["categories"] == ("gr-qc", "hep-th")
+    assert out[1] == plain and out[1] is not plain
+
+
+def test_exporting_does_not_unpack_the_authors():
+    p = _paper()
+
+    export_papers([p])
+    pickle.dumps(p)
+
+    assert isinstance(p._authors, tuple)
+
+
+def test_shared_tuples_evict_least_recently_used(monkeypatch):
+    monkeypatch.setattr(schema, "_SHARED_TUPLES_MAX", 3)
+    monkeypatch.setattr(schema, "_shared_tuples", schema.OrderedDict())
+
+    kept = schema._shared(["kept"])
+    for i in range(5):
+        schema._shared(["kept"])  # keeps it recently used
+        schema._shared([f"c{i}"])
+
+    assert len(schema._shared_tuples) == 3
+    assert schema._shared(["kept"]) is kept
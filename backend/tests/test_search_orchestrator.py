@@ -0,0 +1,208 @@
+"""Search orchestrator: pool sharing, paging and deepening."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.search import orchestrator
+from app.services.search.intent import provisional_intent
+from app.services.search.orchestrator import run_nl_search, run_search
+from app.services.search.rerank import _doc_text, bm25_scores
+from app.services.search.schema import SearchIntent
+
+from conftest import FakeSource
+
+pytestmark = pytest.mark.asyncio
+
+
+def _intent(**kw) -> SearchIntent:
+    return SearchIntent(topics=["quantum gravity"], **kw)
+
+
+async def test_citation_floor_fills_the_page_after_a_plain_search(search_env):
+    source = FakeSource()
+    search_env(source)
+    await run_search(_intent(), limit=20)
+
+    page = await run_search(_intent(min_citations=950), limit=20)
+
+    assert page["returned"] == 20
+    assert all(p["citationCount"] >= 950 for p in page["papers"])
+
+
+async def test_date_sort_returns_the_newest_papers_after_a_plain_search(search_env):
+    source = FakeSource()
+    search_env(source)
+    await run_search(_intent(), limit=20)
+
+    page = await run_search(_intent(sort="date"), limit=20)
+
+    newest = sorted(source.corpus, key=lambda p: (p["published"], p["rank"]), reverse=True)[:20]
+    assert [p["published"] for p in page["papers"]] == [p["published"] for p in newest]
+
+
+async def test_hybrid_sort_reuses_the_relevance_pool(search_env):
+    source = FakeSource()
+    search_env(source)
+    await run_search(_intent(), limit=20)
+    calls = len(source.calls)
+
+    await run_search(_intent(sort="hybrid"), limit=20)
+
+    assert len(source.calls) == calls
+
+
+async def test_late_source_merges_behind_the_pages_already_served(search_env):
+    fast = FakeSource("openalex", citations=lambda i: 500 - i)
+    slow = FakeSource("arxiv", delay=0.2, citations=lambda i: 1000 - i)
+    search_env(fast, slow, deadline=0.05)
+    intent = _intent(sort="citations")
+
+    first = await run_search(intent, limit=10)
+    assert first["sources_cut_off"] == ["arxiv"]
+    await asyncio.sleep(0.4)  # arXiv lands and is merged in the background
+
+    again = await run_search(intent, limit=10)
+    second = await run_search(intent, offset=10, limit=10)
+
+    titles = lambda page: [p["title"] for p in page["papers"]]  # noqa: E731
+    assert titles(again) == titles(first)
+    # The best late records come straight after the served page; none skipped.
+    assert titles(second) == [f"arxiv{i} quantum gravity" for i in range(10)]
+
+
+async def test_deepening_rescores_the_tail_with_the_new_records(search_env):
+    def abstract(i: int) -> str:
+        return " ".join(["quantum"] * (i * 7 % 5) + ["gravity"] * (i * 3 % 4) + ["noise"] * (i % 6 + 1))
+
+    search_env(FakeSource(abstract=abstract))
+    intent = _intent()
+    await run_search(intent, limit=10)
+    await run_search(intent, offset=5, limit=10)  # deepens one page ahead, keeping 15
+    key = orchestrator._intent_signature(intent, None)
+    while orchestrator.search_flight.running(("deepen", key)):
+        await asyncio.sleep(0.01)
+
+    ranked = orchestrator.search_results_cache.get(key)["ranked"]
+    assert len(ranked) > 20
+    tail = ranked[15:]
+    joint = bm25_scores("quantum gravity", [_doc_text(p) for p in tail])
+    joint = [round(s, 4) for s in (joint / joint.max()).tolist()]  # as the reranker rounds
+    assert joint == sorted(joint, reverse=True)
+
+
+async def test_rerank_scores_are_reused_only_for_the_same_set(search_env, monkeypatch):
+    calls = []
+    real = orchestrator.rerank
+
+    async def counting(query, papers, keywords=()):
+        calls.append(len(papers))
+        return await real(query, papers, keywords)
+
+    monkeypatch.setattr(orchestrator, "rerank", counting)
+    corpus = FakeSource(n=30).corpus
+
+    await orchestrator._score(_intent(), [p.copy() for p in corpus])
+    await orchestrator._score(_intent(sort="hybrid"), [p.copy() for p in corpus])
+    await orchestrator._score(_intent(), [p.copy() for p in corpus[:10]])
+
+    assert calls == [30, 10]
+
+
+async def test_discarded_speculation_does_not_cancel_requests_that_joined_it(search_env, monkeypatch):
+    source = FakeSource(delay=0.2)
+    search_env(source)
+
+    async def extract(nl):
+        await asyncio.sleep(0.05)
+        return _intent(sort="date")  # queries the source differently: discard
+
+    monkeypatch.setattr(orchestrator, "extract_intent", extract)
+    nl = asyncio.ensure_future(run_nl_search("quantum gravity", limit=20))
+    await asyncio.sleep(0.01)  # the speculative fetch is in flight
+    joined = await run_search(provisional_intent("quantum gravity"), limit=20)
+    await nl
+
+    assert joined["returned"] == 20 and not joined["errors"]
+    # One speculative fetch (joined, not repeated), then the real date query.
+    assert [c["sort"] for c in source.calls if c["offset"] == 0] == ["relevance", "date"]
+
+
+async def test_a_run_where_every_source_failed_is_cached_only_briefly(search_env, monkeypatch):
+    source = FakeSource(failures=1)
+    search_env(source)
+    monkeypatch.setattr(orchestrator, "search_negative_cache", orchestrator.TTLCache(ttl=0.2))
+    intent = _intent()
+
+    down = await run_search(intent, limit=20)
+    again = await run_search(intent, limit=20)
+    assert down["returned"] == again["returned"] == 0 and "fake" in down["errors"]
+    assert len(source.calls) == 1  # the repeat is served from the negative cache
+
+    await asyncio.sleep(0.25)
+    up = await run_search(intent, limit=20)
+    assert up["returned"] == 20 and not up["errors"]
+
+
+async def test_a_failed_source_is_fetched_again_when_deepening(search_env):
+    ok, flaky = FakeSource("openalex"), FakeSource("arxiv", failures=1)
+    search_env(ok, flaky)
+    intent = _intent(sort="citations")
+
+    first = await run_search(intent, limit=10)
+    assert "arxiv" in first["errors"] and first["has_more"]
+    cached = orchestrator.search_results_cache.get(orchestrator._intent_signature(intent, None))
+    assert "arxiv" not in cached["exhausted"]
+
+    deeper = await run_search(intent, offset=first["total_found"], limit=10)
+    assert any(p["source"] == "arxiv" for p in deeper["papers"])
+
+
+@pytest.mark.parametrize("toggle", [
+    {"sort": "date"}, {"sort": "citations"}, {"open_access_only": True},
+    {"min_citations": 500}, {"exclude": ["fake1"]},
+])
+async def test_sort_and_filter_toggles_reuse_a_complete_pool(search_env, toggle):
+    source = FakeSource(n=30)
+    search_env(source)
+    plain = await run_search(_intent(), limit=30)  # the first wave drains the source
+    calls = len(source.calls)
+
+    page = await run_search(_intent(**toggle), limit=30)
+
+    assert len(source.calls) == calls
+    pooled = {p["title"] for p in plain["papers"]}
+    expected = [
+        p for p in source._matches(_intent(**toggle))
+        if p["title"] in pooled and not any(t in p["title"] for t in toggle.get("exclude", ()))
+    ]
+    if "sort" in toggle:
+        field = "published" if toggle["sort"] == "date" else "citationCount"
+        assert [p[field] for p in page["papers"]] == [p[field] for p in expected]
+    else:
+        assert sorted(p["title"] for p in page["papers"]) == sorted(p["title"] for p in expected)
+
+
+async def test_a_stale_refresh_keeps_the_depth_paging_reached(search_env, monkeypatch):
+    source = FakeSource()
+    search_env(source)
+    for name in ("search_pool_cache", "search_results_cache"):
+        monkeypatch.setattr(orchestrator, name, orchestrator.TTLCache(ttl=3600, soft_ttl=0.1))
+    intent = _intent()
+    key = orchestrator._intent_signature(intent, None)
+
+    first = await run_search(intent, limit=10)
+    deep = await run_search(intent, offset=first["total_found"], limit=10)  # deepens
+    depth = len(orchestrator.search_results_cache.get(key)["ranked"])
+    assert depth >= first["total_found"] + 10
+
+    await asyncio.sleep(0.15)
+    await run_search(intent, limit=10)  # stale: served, refreshed in the background
+    await asyncio.sleep(0.05)
+    assert not orchestrator.search_flight.running(key)
+    assert len(orchestrator.search_results_cache.get(key)["ranked"]) >= depth
+
+    calls = len(source.calls)
+    again = await run_search(intent, offset=first["total_found"], limit=10)
+    assert again["papers"] == deep["papers"] and len(source.calls) == calls
@@ -0,0 +1,93 @@
+"""``POST /api/search/stream``: NDJSON and SSE event sequences."""
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.routes import catalog
+from app.routes.catalog import router
+
+from conftest import FakeSource
+
+pytestmark = pytest.mark.asyncio
+
+BODY = {"intent": {"topics": ["quantum gravity"]}, "limit": 10}
+
+
+@pytest.fixture
+def client(search_env, monkeypatch):
+    async def no_store(collection, docs):
+        return None
+
+    monkeypatch.setattr(catalog, "insert_many", no_store)
+    search_env(FakeSource("openalex"), FakeSource("arxiv", delay=0.2))
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def _ndjson(resp: httpx.Response):
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+def _sse(resp: httpx.Response):
+    events = []
+    for block in resp.text.split("\n\n"):
+        if block:
+            name, data = block.split("\n")
+            assert name.startswith("event: ") and data.startswith("data: ")
+            events.append((name[7:], json.loads(data[6:])))
+    return events
+
+
+async def test_ndjson_streams_partials_then_one_final(client):
+    async with client:
+        resp = await client.post("/api/search/stream", json=BODY)
+
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    events = _ndjson(resp)
+    assert [e["event"] for e in events] == ["partial", "final"]
+    partial, final = events
+    assert partial["sources_used"] == ["openalex"] and partial["sources_pending"] == ["arxiv"]
+    assert not partial["reranked"] and len(partial["papers"]) == 10
+    assert sorted(final["sources_used"]) == ["arxiv", "openalex"] and final["reranked"]
+    assert "sources_pending" not in final and final["returned"] == 10
+
+
+async def test_sse_frames_the_same_events(client):
+    async with client:
+        resp = await client.post(
+            "/api/search/stream", json=BODY, headers={"Accept": "text/event-stream"}
+        )
+
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _sse(resp)
+    assert [name for name, _ in events] == ["partial", "final"]
+    assert all(data["event"] == name for name, data in events)
+
+
+async def test_a_cached_search_streams_only_the_final_event(client):
+    async with client:
+        first = _ndjson(await client.post("/api/search/stream", json=BODY))
+        again = _ndjson(await client.post("/api/search/stream", json=BODY))
+
+    assert [e["event"] for e in again] == ["final"]
+    assert [p["id"] for p in again[0]["papers"]] == [p["id"] for p in first[-1]["papers"]]
+
+
+async def test_a_pipeline_failure_ends_the_stream_with_an_error_event(client, monkeypatch):
+    async def broken(*args, **kwargs):
+        yield {"event": "partial", "papers": [], "total_found": 0, "returned": 0,
+               "sources_used": [], "errors": {}, "reranked": False, "intent": {},
+               "sources_pending": ["arxiv"]}
+        raise RuntimeError("rerank exploded")
+
+    monkeypatch.setattr(catalog, "stream_search", broken)
+    async with client:
+        events = _ndjson(await client.post("/api/search/stream", json=BODY))
+
+    assert [e["event"] for e in events] == ["partial", "error"]
+    assert "rerank exploded" in events[-1]["detail"]
@@ -0,0 +1,83 @@
+"""Tool routes and the legacy arXiv search behind ``/api/test-arxiv``."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.routes.tools import router
+from app.services.research_client import api_client
+from app.services.search.connectors import arxiv_connector
+
+pytestmark = pytest.mark.asyncio
+
+
+def _feed(n: int) -> str:
+    entries = "".join(
+        f"""<entry><id>http://arxiv.org/abs/2401.{i:05d}v1</id><title>Paper {i}</title>
+        <summary>Qubits.</summary><published>2024-01-01T00:00:00Z</published><updated>2024-01-01T00:00:00Z</updated>
+        <author><name>A. Author</name></author></entry>"""
+        for i in range(n)
+    )
+    return (
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+        f"<opensearch:totalResults>{n}</opensearch:totalResults>{entries}</feed>"
+    )
+
+
+class FakeArxiv:
+    """Stands in for the arXiv API: slow to answer, then serves ``responses``
+    in turn (None = the request failed after its retries)."""
+
+    def __init__(self, *responses, delay: float = 0.0) -> None:
+        self.responses = list(responses)
+        self.delay = delay
+        self.queries = []
+
+    async def __call__(self, url, *, params=None, **kw):
+        self.queries.append(params["search_query"])
+        await asyncio.sleep(self.delay)
+        text = self.responses.pop(0)
+        return None if text is None else SimpleNamespace(text=text)
+
+
+async def test_arxiv_route_does_not_stall_the_event_loop(monkeypatch):
+    monkeypatch.setattr(arxiv_connector, "get_with_retry", FakeArxiv(_feed(5), delay=0.3))
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+
+    lag = 0.0
+
+    async def ticker() -> None:
+        nonlocal lag
+        loop = asyncio.get_running_loop()
+        while True:
+            before = loop.time()
+            await asyncio.sleep(0.01)
+            lag = max(lag, loop.time() - before - 0.01)
+
+    t = asyncio.ensure_future(ticker())
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.get("/api/test-arxiv")
+    finally:
+        t.cancel()
+
+    assert resp.json()["results_count"] == 5
+    assert lag < 0.1
+
+
+async def test_simplified_query_is_tried_only_after_a_failure(monkeypatch):
+    empty = FakeArxiv(_feed(0), _feed(5))
+    monkeypatch.setattr(arxiv_connector, "get_with_retry", empty)
+    assert await api_client.search_arxiv_enhanced("quantum computing", max_results=5) == []
+    assert len(empty.queries) == 1
+
+    failing = FakeArxiv(None, _feed(5))
+    monkeypatch.setattr(arxiv_connector, "get_with_retry", failing)
+    papers = await api_client.search_arxiv_enhanced("quantum computing", max_results=5)
+    assert len(papers) == 5
+    assert failing.queries == [empty.queries[0], "quantum computing"]